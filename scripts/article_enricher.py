@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Article Enricher
+Fetches detail pages of thin top candidates to fill in description, date and image
+"""
+
+import asyncio
+import hashlib
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from http_client import create_session
+from http_fixtures import fixture_cache_dir
+from item_store import canonicalize_link
+from json_store import load_section, save_section
+from politeness import HostRateLimiter, get_shared_limiter
+from robots_cache import RobotsCache, get_shared_robots
+from run_budget import RunBudget
+from structured_data import page_metadata
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+ARTICLE_CACHE_FILE = CACHE_DIR / "article_details.json"
+
+ENRICH_USER_AGENT = 'CurationsLA/1.0 (Newsletter Aggregator; +https://la.curations.cc)'
+ENRICH_FETCH_BUDGET = 8      # Detail pages fetched per enrich() call (one category)
+ENRICH_CONCURRENCY = 8
+ENRICH_PER_HOST = 2
+ENRICH_TIMEOUT = 15
+MIN_DESCRIPTION_CHARS = 40   # Shorter descriptions count as missing
+CACHE_TTL_DAYS = 30          # Published articles rarely change
+MAX_PAGE_BYTES = 512 * 1024  # Metadata lives in the <head>; don't hold whole huge pages
+
+def is_thin(item: Dict) -> bool:
+    """Whether an item's description is too short to score on"""
+    description = re.sub(r'<[^>]+>', '', item.get('description') or '')
+    return len(description.strip()) < MIN_DESCRIPTION_CHARS
+
+class ArticleEnricher:
+    def __init__(self, fetch_budget: int = ENRICH_FETCH_BUDGET, concurrency: int = ENRICH_CONCURRENCY,
+                 per_host: int = ENRICH_PER_HOST, timeout: int = ENRICH_TIMEOUT,
+                 cache_file: Path = ARTICLE_CACHE_FILE, rate_limiter: HostRateLimiter = None,
+                 robots: RobotsCache = None):
+        """
+        Initialize Article Enricher
+
+        Args:
+            fetch_budget: Maximum detail pages fetched per enrich() call
+            concurrency: Maximum detail pages downloaded at the same time
+            per_host: Maximum simultaneous downloads from one host
+            timeout: Per-request timeout in seconds
+            cache_file: JSON file of previously extracted article details
+            rate_limiter: Per-host request spacing (defaults to the shared limiter)
+            robots: robots.txt rules checked before every page (defaults to the shared cache)
+        """
+        self.fetch_budget = fetch_budget
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.cache_file = Path(cache_file)
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        self.robots = robots or get_shared_robots()
+        self.ttl = timedelta(days=CACHE_TTL_DAYS)
+        self.lock = threading.Lock()
+        self.details = self._load()
+        self.stats = {'fetched': 0, 'cached': 0, 'failed': 0, 'disallowed': 0}
+        # Optional run budget; nothing launches after its deadline
+        self.budget: RunBudget = None
+
+        self.session = create_session(ENRICH_USER_AGENT)
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached article details from disk"""
+        return load_section(self.cache_file, 'articles', "article cache")
+
+    def save(self):
+        """Persist article details, dropping expired entries"""
+        cutoff = (datetime.now() - self.ttl).isoformat()
+        with self.lock:
+            self.details = {key: value for key, value in self.details.items() if value['fetched_at'] >= cutoff}
+            save_section(self.cache_file, 'articles', self.details)
+
+    def _cache_key(self, link: str) -> str:
+        return hashlib.sha256(canonicalize_link(link).encode('utf-8')).hexdigest()
+
+    def get_cached(self, link: str) -> Optional[Dict]:
+        """Cached details for an article, if still fresh"""
+        with self.lock:
+            details = self.details.get(self._cache_key(link))
+        if details and datetime.fromisoformat(details['fetched_at']) > datetime.now() - self.ttl:
+            return details
+        return None
+
+    def fetch_details(self, link: str) -> Dict:
+        """Download an article page and extract its metadata"""
+        timeout = self.budget.cap_timeout(self.timeout) if self.budget else self.timeout
+        with self.session.get(link, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            body = b''
+            for chunk in response.iter_content(64 * 1024):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+
+        details = page_metadata(body.decode(response.encoding or 'utf-8', errors='replace'), link)
+        details['fetched_at'] = datetime.now().isoformat()
+        with self.lock:
+            self.details[self._cache_key(link)] = details
+        return details
+
+    def select_candidates(self, items: List[Dict], scores: Dict[int, float], top_n: int = 8) -> List[Dict]:
+        """
+        Thin items that could still reach the top picks, best provisional score first
+
+        Items that already carry a vibe_score only set the bar; they are never
+        re-fetched.
+
+        Args:
+            items: Every candidate in the category
+            scores: id(item) -> provisional vibe score from the text already present
+            top_n: Number of items the category keeps
+
+        Returns:
+            List[Dict]: At most fetch_budget items worth a detail-page request
+        """
+        # A full description can lift a thin item to at most 1.0, so it can only make
+        # the cut if the current top_n complete items haven't all maxed out
+        complete = sorted((scores[id(item)] for item in items if not is_thin(item)), reverse=True)
+        bar = complete[top_n - 1] if len(complete) >= top_n else -1.0
+        if bar >= 1.0:
+            return []
+        thin = [item for item in items
+                if item.get('link') and 'vibe_score' not in item and is_thin(item)]
+        thin.sort(key=lambda item: scores[id(item)], reverse=True)
+        return thin[:self.fetch_budget]
+
+    def apply_cached(self, items: List[Dict]) -> int:
+        """
+        Fill thin items in from details fetched on earlier runs, without any requests
+
+        Returns:
+            int: Number of items that gained details
+        """
+        applied = 0
+        for item in items:
+            details = self.get_cached(item['link']) if item.get('link') and is_thin(item) else None
+            if details:
+                self.stats['cached'] += 1
+                applied += self.apply(item, details)
+        return applied
+
+    async def _enrich_one(self, item: Dict, executor: ThreadPoolExecutor, global_limit: asyncio.Semaphore,
+                          host_limits: Dict[str, asyncio.Semaphore]) -> bool:
+        """Fill one item in from its detail page (or the cache)"""
+        link = item['link']
+        details = self.get_cached(link)
+        if details:
+            self.stats['cached'] += 1
+        elif not await asyncio.to_thread(self.robots.allowed, link):
+            self.stats['disallowed'] += 1
+            return False
+        else:
+            host = urlparse(link).netloc.lower()
+            async with host_limits[host]:
+                await self.rate_limiter.wait_async(link)
+                async with global_limit:
+                    if self.budget and self.budget.deadline_passed():
+                        return False
+                    try:
+                        loop = asyncio.get_running_loop()
+                        details = await loop.run_in_executor(executor, self.fetch_details, link)
+                        self.stats['fetched'] += 1
+                    except Exception as e:
+                        print(f"⚠️  Could not enrich {link}: {str(e)}")
+                        self.stats['failed'] += 1
+                        return False
+
+        return self.apply(item, details)
+
+    def apply(self, item: Dict, details: Dict) -> bool:
+        """Merge extracted details into an item, returning whether anything changed"""
+        changed = False
+        if details.get('description') and len(details['description']) > len(item.get('description') or ''):
+            item['description'] = details['description']
+            changed = True
+        if details.get('published') and (not item.get('published') or item.get('published_estimated')):
+            item['published'] = details['published']
+            item.pop('published_estimated', None)
+            changed = True
+        if details.get('image') and not item.get('image'):
+            item['image'] = details['image']
+            changed = True
+        return changed
+
+    async def enrich_async(self, items: List[Dict]) -> int:
+        """Enrich items concurrently, returning how many were improved"""
+        if not items:
+            return 0
+        global_limit = asyncio.Semaphore(self.concurrency)
+        host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = await asyncio.gather(*[
+                self._enrich_one(item, executor, global_limit, host_limits) for item in items
+            ])
+        return sum(results)
+
+    def enrich(self, items: List[Dict]) -> int:
+        """Synchronous entry point for enrich_async"""
+        return asyncio.run(self.enrich_async(items))
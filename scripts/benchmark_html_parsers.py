@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+CurationsLA HTML Parser Benchmark
+Times every installed parser backend on recorded pages from each scraped site,
+parsing both the full document and only the site's article containers
+
+Record pages first with:
+    python scripts/curationsla_cli.py generate --http-mode record
+Sites without a recorded page are benchmarked on a synthetic listing page
+shaped by their spec.
+"""
+
+import argparse
+import base64
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+sys.path.append(str(Path(__file__).parent))
+
+from html_parsers import available_backends, make_soup
+from http_fixtures import DEFAULT_ARCHIVE, FixtureArchive
+from scraper_engine import SiteSpec, extract_articles, load_site_specs
+
+# Configuration
+DEFAULT_ROUNDS = 5
+ARTICLE_LIMIT = 10  # Articles the generator asks each scraper for
+SYNTHETIC_ARTICLES = 60
+SYNTHETIC_FILLER_BLOCKS = 400  # Navigation/markup noise, roughly a few hundred KB per page
+
+def _first_alternative(pattern: str) -> str:
+    """A class name that matches a selector's class pattern"""
+    return pattern.split('|')[0] if pattern else ''
+
+def synthetic_page(spec: SiteSpec) -> bytes:
+    """Listing page that the site's selectors match, padded like a real homepage"""
+    container_tag = spec.container.tags[0]
+    container_class = _first_alternative(spec.container.class_re.pattern if spec.container.class_re else '')
+    title_tag = spec.title.tags[-1]
+    title_class = _first_alternative(spec.title.class_re.pattern if spec.title.class_re else '')
+    excerpt_tag = spec.excerpt.tags[0]
+    excerpt_class = _first_alternative(spec.excerpt.class_re.pattern if spec.excerpt.class_re else '')
+
+    filler = ''.join(
+        f'<div class="nav-block"><ul><li><a href="/section/{i}">Section {i}</a></li>'
+        f'<li><span>Menu item {i}</span></li></ul><script>var x{i} = {i};</script></div>'
+        for i in range(SYNTHETIC_FILLER_BLOCKS)
+    )
+    articles = ''.join(
+        f'<{container_tag} class="{container_class} promo">'
+        f'<{title_tag} class="{title_class}">Good vibes story {i}</{title_tag}>'
+        f'<a href="/story/{i}">Read</a>'
+        f'<{excerpt_tag} class="{excerpt_class}">Neighbors celebrate event number {i}.</{excerpt_tag}>'
+        f'<time datetime="2025-09-25T09:00:00-07:00">Sep 25</time>'
+        f'</{container_tag}>'
+        for i in range(SYNTHETIC_ARTICLES)
+    )
+    html = f"<html><head><title>{spec.source}</title></head><body>{filler}<main>{articles}</main>{filler}</body></html>"
+    return html.encode('utf-8')
+
+def load_pages(archive_path: Path) -> List[Tuple[SiteSpec, str, bytes]]:
+    """One page per site: the first recorded listing page, else a synthetic one"""
+    archive = FixtureArchive(archive_path, mode='replay', latency='0') if archive_path.exists() else None
+    pages = []
+
+    for spec in load_site_specs().values():
+        urls = [spec.page_url(category) for category in spec.paths] + [spec.page_url('general')]
+        recorded = None
+        for url in dict.fromkeys(urls):
+            fixture = archive.lookup('GET', url) if archive else None
+            if fixture and fixture['status'] == 200:
+                recorded = (url, base64.b64decode(fixture['body']))
+                break
+
+        if recorded:
+            pages.append((spec, 'recorded', recorded[1]))
+        else:
+            pages.append((spec, 'synthetic', synthetic_page(spec)))
+
+    return pages
+
+def time_backend(backend: str, spec: SiteSpec, body: bytes, rounds: int,
+                 partial: bool = False) -> Tuple[float, int]:
+    """Best-of-rounds seconds to parse and extract a page, plus the articles found"""
+    best = float('inf')
+    found = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        if partial:
+            soup = make_soup(body, backend, parse_only=spec.container.strainer, max_subtrees=ARTICLE_LIMIT)
+        else:
+            soup = make_soup(body, backend)
+        found = len(extract_articles(soup, spec, 'general', ARTICLE_LIMIT))
+        best = min(best, time.perf_counter() - start)
+    return best, found
+
+def run_benchmark(archive_path: Path = DEFAULT_ARCHIVE, rounds: int = DEFAULT_ROUNDS) -> Dict:
+    """
+    Benchmark every installed backend on every site
+
+    Returns:
+        Dict: Run name (backend, or backend+partial) -> {'total_seconds', 'sites': {site: (seconds, articles)}}
+    """
+    runs = [(backend, partial) for backend in available_backends() for partial in (False, True)]
+    names = [f"{backend}{'+partial' if partial else ''}" for backend, partial in runs]
+    pages = load_pages(archive_path)
+    results = {name: {'total_seconds': 0.0, 'sites': {}} for name in names}
+
+    print(f"\n⏱️  Benchmarking {', '.join(names)} on {len(pages)} sites ({rounds} rounds each)\n")
+    header = f"{'site':<18}{'page':<11}{'KB':>7}" + ''.join(f"{name:>22}" for name in names)
+    print(header)
+    print("-" * len(header))
+
+    for spec, kind, body in pages:
+        row = f"{spec.name:<18}{kind:<11}{len(body) / 1024:>7.0f}"
+        counts = set()
+        for (backend, partial), name in zip(runs, names):
+            seconds, found = time_backend(backend, spec, body, rounds, partial)
+            results[name]['total_seconds'] += seconds
+            results[name]['sites'][spec.name] = (seconds, found)
+            counts.add(found)
+            row += f"{seconds * 1000:.1f} ms ({found})".rjust(22)
+        if len(counts) > 1:
+            row += "  ⚠️  runs disagree"
+        print(row)
+
+    print()
+    baseline = results.get('html.parser', {}).get('total_seconds')
+    for name in names:
+        total = results[name]['total_seconds']
+        speedup = f" ({baseline / total:.1f}x vs html.parser)" if baseline and name != 'html.parser' else ''
+        print(f"📊 {name}: {total * 1000:.1f} ms total{speedup}")
+
+    return results
+
+def main():
+    """Run the parser benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark HTML parser backends on scraped sites')
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_ARCHIVE,
+                        help='Recorded HTTP fixture archive to read pages from')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Timing rounds per page')
+    args = parser.parse_args()
+
+    run_benchmark(args.fixtures, args.rounds)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Vibe Scoring Benchmark
+Times the per-keyword substring scans the filter started from against each match mode's single
+pass, then scalar (one text at a time) against vectorized batch scoring over growing batch sizes,
+reporting the crossover, the smallest batch where the vectorized path wins
+
+Texts come from the item store when it has enough entries (run the generator first),
+otherwise from synthetic feed items built from the lexicon.
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+sys.path.append(str(Path(__file__).parent))
+
+from filters.vibe_engine import (
+    BATCH_MIN_ITEMS, BLOCKED_KEYWORDS, GOOD_VIBES_KEYWORDS, MATCH_MODES, NUMPY_AVAILABLE, get_engine
+)
+from item_store import ITEM_STORE_FILE
+
+# Configuration
+DEFAULT_ROUNDS = 5
+MATCHER_TEXTS = 500  # Texts scored one at a time in the matcher comparison
+BATCH_SIZES = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+KEYWORD_RATE = 0.08  # Share of words in a synthetic item that are lexicon keywords
+FILLER_WORDS = ("the a of in and to for with at on this that weekend neighbors city Saturday "
+                "Silver Lake Echo Park West Hollywood locals’ “favorite” spot").split()
+
+def synthetic_texts(count: int, seed: int = 42) -> List[str]:
+    """Feed-like title plus description texts, 10-60 words each"""
+    rng = random.Random(seed)
+    keywords = GOOD_VIBES_KEYWORDS + BLOCKED_KEYWORDS
+    return [
+        ' '.join(rng.choice(keywords) if rng.random() < KEYWORD_RATE else rng.choice(FILLER_WORDS)
+                 for _ in range(rng.randint(10, 60))).capitalize()
+        for _ in range(count)
+    ]
+
+def load_texts(count: int, db_path: Path = ITEM_STORE_FILE) -> List[str]:
+    """Cleaned item texts from the item store, topped up with synthetic ones"""
+    texts = []
+    if db_path.exists():
+        conn = sqlite3.connect(str(db_path))
+        texts = [row[0] for row in conn.execute(
+            "SELECT cleaned_text FROM items WHERE cleaned_text != '' ORDER BY first_seen DESC LIMIT ?", (count,)
+        )]
+        conn.close()
+    if texts:
+        print(f"📚 Using {len(texts)} stored items")
+    return texts + synthetic_texts(count - len(texts))
+
+def best_time(score, texts: List[str], rounds: int) -> float:
+    """Best-of-rounds seconds for one call"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        score(texts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_matcher_benchmark(count: int = MATCHER_TEXTS, rounds: int = DEFAULT_ROUNDS) -> Dict[str, float]:
+    """
+    Time one substring test per keyword against each match mode's single scan, one text at a time
+
+    Returns:
+        Dict: 'substring scans' and '<mode> mode' -> best seconds for all texts
+    """
+    texts = load_texts(count)
+    keywords = [(keyword, 1) for keyword in GOOD_VIBES_KEYWORDS] + [(keyword, -2) for keyword in BLOCKED_KEYWORDS]
+
+    def substring_scans(batch: List[str]):
+        for text in batch:
+            text_lower = text.lower()
+            sum(weight for keyword, weight in keywords if keyword in text_lower)
+
+    timings = {'substring scans': best_time(substring_scans, texts, rounds)}
+    for mode in MATCH_MODES:
+        engine = get_engine(mode)
+        timings[f"{mode} mode"] = best_time(lambda batch: [engine.score_text(text) for text in batch], texts, rounds)
+
+    print(f"\n⏱️  {len(keywords)} substring scans vs single-pass matching, {count} texts ({rounds} rounds each)\n")
+    for name, seconds in timings.items():
+        print(f"{name:>16}{seconds * 1000:>11.2f} ms")
+    return timings
+
+def run_benchmark(sizes: List[int] = BATCH_SIZES, rounds: int = DEFAULT_ROUNDS, mode: str = None) -> Dict:
+    """
+    Benchmark both scoring paths at every batch size
+
+    Args:
+        sizes: Batch sizes to time
+        rounds: Timing rounds per size
+        mode: Match mode to benchmark (defaults to MATCH_MODE)
+
+    Returns:
+        Dict: 'sizes' -> {size: (scalar seconds, vectorized seconds)}, 'crossover' -> size or None
+    """
+    engine = get_engine(mode)
+    texts = load_texts(max(sizes))
+
+    # Build the vectorized scorer up front and check both paths agree before timing them
+    assert engine.score_batch(texts, vectorized=False, cached=False) == \
+        engine.score_batch(texts, vectorized=True, cached=False), \
+        "Scalar and vectorized scores differ"
+
+    print(f"\n⏱️  Scalar vs vectorized vibe scoring, {engine.mode} mode "
+          f"({rounds} rounds each, BATCH_MIN_ITEMS={BATCH_MIN_ITEMS[engine.mode]})\n")
+    header = f"{'items':>7}{'scalar':>14}{'vectorized':>14}{'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+
+    results = {'sizes': {}, 'crossover': None}
+    for size in sizes:
+        batch = texts[:size]
+        scalar = best_time(lambda chunk: engine.score_batch(chunk, vectorized=False, cached=False), batch, rounds)
+        vectorized = best_time(lambda chunk: engine.score_batch(chunk, vectorized=True, cached=False), batch, rounds)
+        results['sizes'][size] = (scalar, vectorized)
+        if vectorized < scalar and results['crossover'] is None:
+            results['crossover'] = size
+        elif vectorized >= scalar:
+            results['crossover'] = None
+        print(f"{size:>7}{scalar * 1000:>11.2f} ms{vectorized * 1000:>11.2f} ms{scalar / vectorized:>9.1f}x")
+
+    print()
+    if results['crossover']:
+        print(f"📊 Vectorized scoring wins from {results['crossover']} items per batch")
+    else:
+        print("📊 Vectorized scoring never consistently won at these sizes")
+    return results
+
+def main():
+    """Run the scoring benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark scalar against vectorized vibe scoring')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Timing rounds per batch size')
+    parser.add_argument('--sizes', type=int, nargs='+', default=BATCH_SIZES, help='Batch sizes to time')
+    parser.add_argument('--mode', choices=MATCH_MODES, help='Match mode to benchmark (default: all)')
+    args = parser.parse_args()
+
+    run_matcher_benchmark(rounds=args.rounds)
+
+    if not NUMPY_AVAILABLE:
+        print("\n❌ NumPy is not installed; only scalar scoring is available (pip install numpy)")
+        return
+
+    for mode in [args.mode] if args.mode else MATCH_MODES:
+        run_benchmark(sorted(args.sizes), args.rounds, mode)
+
+if __name__ == "__main__":
+    main()
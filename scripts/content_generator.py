@@ -7,8 +7,6 @@ Generates daily newsletter content from RSS feeds with Good Vibes filtering
 import os
 import json
 import sys
-import feedparser
-import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 import re
@@ -21,6 +19,18 @@ script_dir = Path(__file__).parent
 if str(script_dir) not in sys.path:
     sys.path.insert(0, str(script_dir))
 
+from article_enricher import ArticleEnricher
+from feed_discovery import FeedDiscovery
+from feed_fetcher import FeedFetcher
+from feed_health import FeedHealthRegistry
+from filters.vibe_engine import DEFAULT_THRESHOLD, get_engine, get_score_cache
+from http_cache import HTTPCache
+from http_client import get_shared_adapter
+from item_store import ItemStore
+from robots_cache import get_shared_robots
+from run_budget import RunBudget
+from scrape_cache import ScrapeCache
+
 # Try to import web scraper, but make it optional
 try:
     from web_scraper import WebScraper
@@ -44,30 +54,13 @@ SOURCES_DIR = BASE_DIR / "sources" / "feeds"
 OUTPUT_DIR = BASE_DIR / "output"
 CONTENT_DIR = BASE_DIR / "content"
 
-# LA Neighborhoods mapping
-NEIGHBORHOODS = {
-    'DTLA': ['Downtown', 'Arts District', 'Little Tokyo', 'Chinatown'],
-    'WESTSIDE': ['Santa Monica', 'Venice', 'Brentwood', 'West LA'],
-    'VALLEY': ['Studio City', 'Sherman Oaks', 'Burbank', 'North Hollywood'],
-    'EASTSIDE': ['Silver Lake', 'Echo Park', 'Los Feliz', 'Highland Park'],
-    'SOUTHBAY': ['Manhattan Beach', 'Hermosa Beach', 'Redondo Beach'],
-    'HOLLYWOOD': ['Hollywood', 'West Hollywood', 'Hollywood Hills'],
-    'MIDCITY': ['Beverly Hills', 'Fairfax', 'Miracle Mile']
-}
-
-# Good Vibes Filter
-GOOD_VIBES_KEYWORDS = [
-    'opening', 'new', 'celebrate', 'community', 'festival', 'art', 'music',
-    'food', 'restaurant', 'launch', 'debut', 'premiere', 'exhibition',
-    'performance', 'achievement', 'winner', 'success', 'expansion',
-    'collaboration', 'partnership', 'innovation', 'discovery', 'milestone'
-]
+# Concurrent feed fetching limits
+FETCH_CONCURRENCY = 16
+FETCH_PER_HOST = 2
 
-BLOCKED_KEYWORDS = [
-    'crime', 'murder', 'shooting', 'arrest', 'police', 'lawsuit', 'controversy',
-    'scandal', 'protest', 'angry', 'outrage', 'closure', 'bankruptcy',
-    'layoffs', 'fired', 'political', 'politics', 'election'
-]
+# Fetch detail pages for thin items that could make a category's top 8
+ARTICLE_ENRICHMENT = True
+ENRICH_FETCH_BUDGET = 8  # Detail pages per category
 
 # Morning Brew Style Elements
 MORNING_BREW_STYLE = {
@@ -110,9 +103,28 @@ class ContentGenerator:
         self.content = {}
         self.js_content_data = {}
         
+        # Concurrent feed fetcher; prefetched results are keyed by feed URL
+        self.feed_health = FeedHealthRegistry()
+        self.feed_fetcher = FeedFetcher(concurrency=FETCH_CONCURRENCY, per_host=FETCH_PER_HOST,
+                                        http_cache=HTTPCache(), health=self.feed_health)
+        self.prefetched_feeds = {}
+        # Replacement feeds found for broken ones, used ahead of the configured URL
+        self.feed_discovery = FeedDiscovery()
+        # Wall-clock budget for network work, started when a run begins fetching
+        self.run_budget = None
+        
+        # Persistent store of ingested items; only new entries are scored each run
+        self.item_store = ItemStore()
+        
+        # Optional detail-page enrichment for items with missing descriptions
+        if ARTICLE_ENRICHMENT:
+            self.article_enricher = ArticleEnricher(fetch_budget=ENRICH_FETCH_BUDGET)
+        else:
+            self.article_enricher = None
+        
         # Initialize web scraper for failed RSS feeds (if available)
         if WEB_SCRAPING_AVAILABLE:
-            self.web_scraper = WebScraper()
+            self.web_scraper = WebScraper(scrape_cache=ScrapeCache())
         else:
             self.web_scraper = None
         
@@ -140,54 +152,105 @@ class ContentGenerator:
     
     def fetch_rss_feed(self, url: str, name: str) -> List[Dict]:
         """Fetch and parse RSS feed"""
-        try:
-            print(f"📡 Fetching {name}...")
-            
-            # Add user agent to avoid blocking
-            headers = {
-                'User-Agent': 'CurationsLA/1.0 (Newsletter Aggregator; +https://la.curations.cc)'
-            }
-            
-            # Some feeds require direct requests
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            feed = feedparser.parse(response.content)
-            
-            if feed.bozo:
-                print(f"⚠️  Feed parsing warning for {name}: {feed.bozo_exception}")
-            
-            items = []
-            for entry in feed.entries[:10]:  # Limit to 10 most recent
-                item = {
-                    'title': getattr(entry, 'title', ''),
-                    'link': getattr(entry, 'link', ''),
-                    'description': getattr(entry, 'description', ''),
-                    'published': getattr(entry, 'published', ''),
-                    'summary': getattr(entry, 'summary', ''),
-                    'source': name,
-                    'feed_url': url
-                }
-                items.append(item)
-            
-            print(f"✅ Retrieved {len(items)} items from {name}")
-            time.sleep(1)  # Be respectful to servers
-            return items
-            
-        except Exception as e:
-            print(f"❌ Error fetching {name}: {str(e)}")
-            return []
+        # Served from the concurrent prefetch when available
+        if url in self.prefetched_feeds:
+            return [dict(item, source=name) for item in self.prefetched_feeds[url]]
+        
+        # Per-host spacing is handled by the fetcher's rate limiter
+        return self.feed_fetcher.fetch_feed(url, name)
+    
+    def prefetch_feeds(self, categories: List[str]):
+        """Download every active feed of every category concurrently, high priority first"""
+        self.run_budget = RunBudget()
+        if self.web_scraper:
+            self.web_scraper.budget = self.run_budget
+        if self.article_enricher:
+            self.article_enricher.budget = self.run_budget
+        self.feed_discovery.budget = self.run_budget
+        
+        feeds = []
+        for category in categories:
+            config = self.load_feed_config(category)
+            feeds.extend(dict(self.feed_discovery.resolve(feed), category=category)
+                         for feed in config.get('feeds', []) if feed.get('active', True))
+        
+        print(f"\n📡 Prefetching {len(feeds)} feeds across {len(categories)} categories...")
+        start = time.time()
+        self.prefetched_feeds = self.feed_fetcher.fetch_feeds(feeds, self.run_budget)
+        
+        ok_count = sum(1 for items in self.prefetched_feeds.values() if items)
+        print(f"⚡ Prefetched {ok_count}/{len(self.prefetched_feeds)} feeds in {time.time() - start:.1f}s")
+        coalesced = self.feed_fetcher.coalescer.get_stats()['coalesced_requests']
+        if coalesced:
+            print(f"🔗 {coalesced} feed requests shared across categories")
+        self.feed_health.save()
+        skipped = self.run_budget.get_summary()['skipped_fetches']
+        if skipped:
+            print(f"⏱️  {skipped} lower-priority feeds skipped to stay within the run budget")
+        
+        self.discover_feeds(feeds)
+    
+    def discover_feeds(self, feeds: List[Dict]):
+        """Search the sites of feeds the prefetch got nothing from for working feeds, concurrently"""
+        # Feeds are only skipped once the soft budget is spent, so none of them are searched here
+        if self.run_budget.budget_spent():
+            return
+        
+        failed = []
+        for feed in feeds:
+            if self.prefetched_feeds.get(feed['url']):
+                continue
+            configured_url = feed.get('configured_url', feed['url'])
+            if 'configured_url' in feed:
+                # The feed found on an earlier run has stopped working too
+                self.feed_discovery.forget(configured_url)
+            if self.feed_discovery.should_search(configured_url):
+                failed.append(feed)
+        if not failed:
+            return
+        
+        print(f"\n🔍 Searching for replacement feeds for {len(failed)} failed feeds...")
+        start = time.time()
+        results = self.feed_discovery.discover_many(failed)
+        for feed in failed:
+            feed_url, items = results[feed.get('configured_url', feed['url'])]
+            if feed_url:
+                # Served like a prefetched feed once resolve() picks up the discovered URL
+                self.prefetched_feeds[feed_url] = items
+                self.run_budget.add_candidates(feed['category'], len(items))
+        found = sum(1 for feed_url, _ in results.values() if feed_url)
+        print(f"✨ Found {found}/{len(results)} replacement feeds in {time.time() - start:.1f}s")
+        self.feed_discovery.save()
+    
+    def within_budget(self, feed_info: Dict, category: str) -> bool:
+        """Check the run budget before starting more network work for a feed"""
+        if self.run_budget and not self.run_budget.should_launch(feed_info, [category]):
+            print(f"⏱️  Skipping {feed_info['name']} - run budget spent")
+            return False
+        return True
     
     def fetch_with_scraping_fallback(self, feed_info: Dict, category: str) -> List[Dict]:
         """Fetch content with web scraping fallback for failed RSS feeds"""
-        # First try RSS
+        # Known-dead feeds (open circuit) skip RSS; replacements were searched for after the prefetch
+        if self.feed_health.is_open(feed_info['url']):
+            print(f"⛔ {feed_info['name']} circuit open, skipping RSS")
+            return self.scrape_fallback(feed_info, category)
+        
+        # First try RSS (only feeds missed by the prefetch cost another request)
+        if feed_info['url'] not in self.prefetched_feeds and not self.within_budget(feed_info, category):
+            return []
         rss_items = self.fetch_rss_feed(feed_info['url'], feed_info['name'])
         
         if rss_items:
             return rss_items
         
+        # Feeds replaced by discovery after the prefetch never get here
+        return self.scrape_fallback(feed_info, category)
+    
+    def scrape_fallback(self, feed_info: Dict, category: str) -> List[Dict]:
+        """Scrape the feed's site when its RSS is unavailable"""
         # If RSS failed and web scraping is available, try web scraping fallback
-        if not self.web_scraper:
+        if not self.web_scraper or not self.within_budget(feed_info, category):
             return []
             
         print(f"🕷️  RSS failed for {feed_info['name']}, attempting web scraping...")
@@ -220,6 +283,8 @@ class ContentGenerator:
                 scraped_items = self.web_scraper.scrape_content(scraper_name, category, 10)
                 if scraped_items:
                     print(f"✅ Web scraping successful for {feed_info['name']}: {len(scraped_items)} items")
+                    if self.run_budget:
+                        self.run_budget.add_candidates(category, len(scraped_items))
                     return scraped_items
             except Exception as e:
                 print(f"❌ Web scraping also failed for {feed_info['name']}: {str(e)}")
@@ -259,7 +324,7 @@ class ContentGenerator:
         community = self.get_random_style_element('community')
         
         # Clean and shorten description
-        desc = re.sub(r'<[^>]+>', '', item['description'])
+        desc = re.sub(r'<[^>]*(>|$)', '', item['description'])
         if len(desc) > 120:
             desc = desc[:117] + "..."
         
@@ -269,46 +334,72 @@ class ContentGenerator:
     
     def calculate_vibe_score(self, text: str) -> float:
         """Calculate Good Vibes score for content"""
-        text_lower = text.lower()
-        
-        good_score = sum(1 for keyword in GOOD_VIBES_KEYWORDS if keyword in text_lower)
-        bad_score = sum(2 for keyword in BLOCKED_KEYWORDS if keyword in text_lower)
-        
-        # Calculate score between 0 and 1
-        total_score = good_score - bad_score
-        normalized_score = max(0, min(1, (total_score + 5) / 10))
-        
-        return normalized_score
+        return get_engine().score(text)
     
     def extract_neighborhood(self, text: str) -> str:
         """Extract LA neighborhood from text"""
-        text_lower = text.lower()
-        
-        for area, neighborhoods in NEIGHBORHOODS.items():
-            for neighborhood in neighborhoods:
-                if neighborhood.lower() in text_lower:
-                    return neighborhood
-        
-        return "Los Angeles"  # Default fallback
+        return get_engine().neighborhood(text)
+    
+    def score_items(self, items: List[Dict]):
+        """Attach vibe score and neighborhood to items that don't have them yet"""
+        unscored = [item for item in items if 'vibe_score' not in item]
+        scores, neighborhoods, _ = get_engine().score_batch(
+            [f"{item['title']} {item['description']}" for item in unscored]
+        )
+        for item, vibe_score, neighborhood in zip(unscored, scores, neighborhoods):
+            item['vibe_score'], item['neighborhood'] = vibe_score, neighborhood
     
-    def filter_good_vibes(self, items: List[Dict], threshold: float = 0.3) -> List[Dict]:
+    def filter_good_vibes(self, items: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
         """Filter items for Good Vibes content"""
-        filtered_items = []
-        
-        for item in items:
-            # Combine title and description for scoring
-            content_text = f"{item['title']} {item['description']}"
-            vibe_score = self.calculate_vibe_score(content_text)
-            
-            if vibe_score >= threshold:
-                item['vibe_score'] = vibe_score
-                item['neighborhood'] = self.extract_neighborhood(content_text)
-                filtered_items.append(item)
+        self.score_items(items)
+        filtered_items = [item for item in items if item['vibe_score'] >= threshold]
         
         # Sort by vibe score (highest first)
         filtered_items.sort(key=lambda x: x['vibe_score'], reverse=True)
         return filtered_items
     
+    def enrich_candidates(self, items: List[Dict], category: str):
+        """Fill in thin items from their detail pages when they could make the top 8"""
+        if not self.article_enricher:
+            return
+        
+        # Items with stored scores only set the bar. Pages fetched on earlier runs cost no
+        # requests, so the rest get those details before they are scored
+        unscored = [item for item in items if 'vibe_score' not in item]
+        reused = self.article_enricher.apply_cached(unscored)
+        if reused:
+            print(f"🗃️  {category}: reused article details for {reused} thin items")
+        
+        # Provisional scores for every unscored item, in one batch
+        vibe_scores, neighborhoods, _ = get_engine().score_batch(
+            [f"{item['title']} {item['description']}" for item in unscored]
+        )
+        scores = {id(item): item['vibe_score'] for item in items if 'vibe_score' in item}
+        scores.update(zip(map(id, unscored), vibe_scores))
+        
+        candidates = self.article_enricher.select_candidates(items, scores)
+        if candidates:
+            enriched = self.article_enricher.enrich(candidates)
+            print(f"🔎 {category}: enriched {enriched}/{len(candidates)} thin items from their article pages")
+        
+        # Items that weren't fetched still have the text they were scored on, so keep those scores
+        fetched = set(map(id, candidates))
+        for item, vibe_score, neighborhood in zip(unscored, vibe_scores, neighborhoods):
+            if id(item) not in fetched:
+                item['vibe_score'], item['neighborhood'] = vibe_score, neighborhood
+    
+    def process_incremental(self, items: List[Dict], category: str) -> List[Dict]:
+        """Enrich and score only entries not already scored under the current lexicon, reusing stored results"""
+        # Items scored under an older lexicon version come back as new and are scored again
+        score_version = get_engine().version
+        new_items, known_items = self.item_store.partition(items, score_version)
+        print(f"🗃️  {category}: {len(new_items)} new or re-scored, {len(known_items)} already processed")
+        
+        self.enrich_candidates(new_items + known_items, category)
+        self.score_items(new_items)
+        self.item_store.record_items(new_items, category, score_version)
+        return new_items + known_items
+    
     def aggregate_category_content(self, category: str) -> List[Dict]:
         """Aggregate content for a specific category"""
         print(f"\n🌴 Processing {category.upper()} category...")
@@ -321,11 +412,20 @@ class ContentGenerator:
         
         for feed in config.get('feeds', []):
             if feed.get('active', True):  # Default to active if not specified
-                items = self.fetch_with_scraping_fallback(feed, category)
+                items = self.fetch_with_scraping_fallback(self.feed_discovery.resolve(feed), category)
                 all_items.extend(items)
         
-        # Filter for Good Vibes
-        good_items = self.filter_good_vibes(all_items)
+        self.feed_health.save()
+        self.feed_discovery.save()
+        if self.web_scraper and self.web_scraper.scrape_cache:
+            self.web_scraper.scrape_cache.save()
+        get_shared_robots().save()
+        
+        # Filter for Good Vibes, scoring only entries not seen on a previous run
+        good_items = self.filter_good_vibes(self.process_incremental(all_items, category))
+        if self.article_enricher:
+            self.article_enricher.save()
+        get_score_cache().save()
         
         print(f"📊 {category}: {len(all_items)} total → {len(good_items)} good vibes")
         
@@ -352,9 +452,9 @@ class ContentGenerator:
             if len(title) > 80:
                 title = title[:77] + "..."
             
-            # Extract brief description
-            desc = item['description'][:150] + "..." if len(item['description']) > 150 else item['description']
-            desc = re.sub(r'<[^>]+>', '', desc)  # Remove HTML tags
+            # Extract brief description, removing HTML tags before truncating so none is cut in half
+            desc = re.sub(r'<[^>]*(>|$)', '', item['description'])
+            desc = desc[:150] + "..." if len(desc) > 150 else desc
             
             neighborhood = item.get('neighborhood', 'Los Angeles')
             
@@ -506,9 +606,12 @@ Keep spreading those good vibes, LA! See you tomorrow for another round of the c
         
         # Aggregate content from all categories
         categories = ['eats', 'events', 'community', 'development', 'business', 'entertainment', 'sports', 'goodies']
+        self.item_store.start_run()
+        self.prefetch_feeds(categories)
         
         for category in categories:
             self.content[category] = self.aggregate_category_content(category)
+        self.item_store.finish_run()
         
         # Generate newsletter header
         day_name = self.day_name.title()
@@ -799,6 +902,10 @@ if (typeof window !== 'undefined') {{
         stats["total_items"] = total_items
         stats["avg_vibe_score"] = round(total_score / total_items, 2) if total_items else 0
         
+        # Connection reuse and bandwidth across every fetch this run
+        stats["network"] = get_shared_adapter().get_totals()
+        stats["network_by_host"] = get_shared_adapter().get_stats()
+        
         with open(self.output_path / "stats.json", 'w') as f:
             json.dump(stats, f, indent=2)
     
@@ -923,6 +1030,8 @@ if (typeof window !== 'undefined') {{
         
         # Process all categories
         categories = ['eats', 'events', 'community', 'development', 'business', 'entertainment', 'sports', 'goodies']
+        self.item_store.start_run()
+        self.prefetch_feeds(categories)
         
         for category in categories:
             print(f"\n🌴 Processing {category.upper()} category...")
@@ -931,6 +1040,7 @@ if (typeof window !== 'undefined') {{
             # Enhanced freshness checking
             fresh_items = self.check_content_freshness(items)
             self.content[category] = fresh_items
+        self.item_store.finish_run()
         
         # Check for duplicates across all content
         duplicate_check = self.check_for_duplicates()
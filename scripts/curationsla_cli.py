@@ -5,6 +5,7 @@ Unified interface for all CurationsLA automation features
 """
 
 import argparse
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +13,23 @@ from pathlib import Path
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
+def add_fixture_arguments(subparser):
+    """Add record/replay HTTP fixture options to a subcommand"""
+    subparser.add_argument('--http-mode', choices=['live', 'record', 'replay'],
+                           help='Record responses to, or replay them from, a fixture archive')
+    subparser.add_argument('--fixtures', help='Fixture archive path (.json.gz)')
+    subparser.add_argument('--replay-latency',
+                           help="Replay latency: 'recorded' or fixed seconds per response")
+
+def apply_fixture_arguments(args):
+    """Export fixture options before any fetching module creates its sessions"""
+    if getattr(args, 'http_mode', None):
+        os.environ['CURATIONSLA_HTTP_MODE'] = args.http_mode
+    if getattr(args, 'fixtures', None):
+        os.environ['CURATIONSLA_FIXTURE_ARCHIVE'] = args.fixtures
+    if getattr(args, 'replay_latency', None):
+        os.environ['CURATIONSLA_REPLAY_LATENCY'] = args.replay_latency
+
 def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(
@@ -36,6 +54,10 @@ Examples:
   
   # Generate agent reference guide
   python curationsla_cli.py showcase --generate-guide
+  
+  # Record every feed/scrape response, then replay the run offline
+  python curationsla_cli.py generate --http-mode record --fixtures fixtures/run.json.gz
+  python curationsla_cli.py generate --http-mode replay --fixtures fixtures/run.json.gz
 """
     )
     
@@ -46,6 +68,7 @@ Examples:
     gen_parser.add_argument('--enhanced', action='store_true', 
                            help='Use enhanced generation with duplicate prevention')
     gen_parser.add_argument('--date', help='Target date (YYYY-MM-DD)')
+    add_fixture_arguments(gen_parser)
     
     # Showcase command
     show_parser = subparsers.add_parser('showcase', help='Showcase and compare publications')
@@ -74,6 +97,7 @@ Examples:
                             help='Test web scraping functionality')
     test_parser.add_argument('--validate', action='store_true',
                             help='Validate all enhancements')
+    add_fixture_arguments(test_parser)
     
     args = parser.parse_args()
     
@@ -81,6 +105,8 @@ Examples:
         parser.print_help()
         return
     
+    apply_fixture_arguments(args)
+    
     # Execute commands
     if args.command == 'generate':
         from content_generator import ContentGenerator, ARCHIVE_MANAGEMENT_AVAILABLE
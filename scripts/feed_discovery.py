@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Feed Discovery
+Finds a working RSS/Atom feed for sites whose configured feed is broken, and remembers it
+"""
+
+import asyncio
+import re
+import threading
+import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from feed_fetcher import FEED_USER_AGENT, parse_feed_items
+from http_client import create_session
+from http_fixtures import fixture_cache_dir
+from json_store import load_section, save_section
+from politeness import HostRateLimiter, get_shared_limiter
+from request_coalescer import RequestCoalescer
+from run_budget import RunBudget, order_by_priority
+from structured_data import ATTRIBUTE_RE
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+DISCOVERY_FILE = CACHE_DIR / "discovered_feeds.json"
+
+DISCOVERY_TIMEOUT = 15
+RETRY_DAYS = 7                # Sites with no feed found aren't searched again for a week
+MAX_CANDIDATES = 12           # Feed URLs validated per site before giving up
+MAX_SITEMAPS = 3              # Sitemaps read per site
+MAX_CONCURRENT_SEARCHES = 4   # Sites searched at the same time
+MAX_SEARCHES_PER_HOST = 2     # Simultaneous searches of one site (they share its pages)
+
+FEED_TYPES = {'application/rss+xml', 'application/atom+xml', 'application/rdf+xml', 'application/feed+json'}
+COMMON_FEED_PATHS = [
+    '/feed', '/rss', '/feed.xml', '/rss.xml', '/atom.xml', '/index.xml', '/feed/rss', '/rss/index.xml', '/?feed=rss2'
+]
+
+LINK_TAG_RE = re.compile(r'<link\s[^>]*>', re.IGNORECASE)
+SITEMAP_LINE_RE = re.compile(r'^\s*sitemap\s*:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+LOC_RE = re.compile(r'<loc>\s*([^<\s]+)\s*</loc>', re.IGNORECASE)
+FEED_URL_RE = re.compile(r'(/feed|/rss|/atom|\.rss$|\.atom$|rss\d*(\.\d)?\.xml$)', re.IGNORECASE)
+
+def find_feed_links(markup: str, page_url: str) -> List[str]:
+    """Feed URLs advertised by <link rel="alternate"> tags, in page order"""
+    links = []
+    for tag in LINK_TAG_RE.findall(markup):
+        attributes = {key.lower(): dq or sq for key, dq, sq in ATTRIBUTE_RE.findall(tag)}
+        rels = attributes.get('rel', '').lower().split()
+        if 'alternate' in rels and attributes.get('type', '').lower() in FEED_TYPES and attributes.get('href'):
+            links.append(urljoin(page_url, attributes['href'].strip()))
+    return links
+
+def find_sitemap_feeds(sitemap: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a sitemap's <loc> entries into feed-looking URLs and nested sitemaps
+
+    Returns:
+        Tuple: (feed URLs, child sitemap URLs)
+    """
+    feeds, sitemaps = [], []
+    for loc in LOC_RE.findall(sitemap):
+        if FEED_URL_RE.search(urlparse(loc).path):
+            feeds.append(loc)
+        elif 'sitemap' in loc.lower():
+            sitemaps.append(loc)
+    return feeds, sitemaps
+
+class FeedDiscovery:
+    def __init__(self, cache_file: Path = DISCOVERY_FILE, timeout: int = DISCOVERY_TIMEOUT,
+                 rate_limiter: HostRateLimiter = None, retry_days: float = RETRY_DAYS,
+                 concurrency: int = MAX_CONCURRENT_SEARCHES, per_host: int = MAX_SEARCHES_PER_HOST):
+        """
+        Initialize Feed Discovery
+
+        Args:
+            cache_file: JSON file mapping configured feed URLs to discovered ones
+            timeout: Per-request timeout in seconds
+            rate_limiter: Per-host request spacing (defaults to the shared limiter)
+            retry_days: Days before a site with no feed found is searched again
+            concurrency: Maximum number of sites searched at the same time
+            per_host: Maximum number of simultaneous searches of one site
+        """
+        self.cache_file = Path(cache_file)
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        self.retry = timedelta(days=retry_days)
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.lock = threading.Lock()
+        self.entries = self._load()
+
+        self.session = create_session(FEED_USER_AGENT)
+        # Homepages, robots.txt and sitemaps are read once per run, shared by every feed on a site
+        self.site_pages = RequestCoalescer()
+        # Optional run budget; requests never run past its deadline
+        self.budget: RunBudget = None
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load discovered feeds from disk"""
+        return load_section(self.cache_file, 'feeds', "feed discovery cache")
+
+    def save(self):
+        """Persist discovered feeds to disk"""
+        with self.lock:
+            save_section(self.cache_file, 'feeds', self.entries)
+
+    def resolve(self, feed: Dict) -> Dict:
+        """
+        The feed config to fetch this run, using a previously discovered URL if there is one
+
+        The configured URL is kept as 'configured_url' so failures can be traced back.
+        """
+        with self.lock:
+            entry = self.entries.get(feed['url'])
+        if entry and entry.get('feed_url'):
+            return dict(feed, url=entry['feed_url'], configured_url=feed['url'])
+        return feed
+
+    def should_search(self, configured_url: str) -> bool:
+        """Whether discovery may run for a feed (skips recent searches that found nothing)"""
+        with self.lock:
+            entry = self.entries.get(configured_url)
+        if not entry or entry.get('feed_url'):
+            return True
+        return datetime.fromisoformat(entry['checked_at']) < datetime.now() - self.retry
+
+    def forget(self, configured_url: str):
+        """Drop a discovered feed that stopped working"""
+        with self.lock:
+            self.entries.pop(configured_url, None)
+
+    def _get(self, url: str) -> Optional[requests.Response]:
+        """GET a URL politely, returning None on any failure"""
+        try:
+            timeout = self.budget.cap_timeout(self.timeout) if self.budget else self.timeout
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, timeout=timeout)
+            return response if response.status_code == 200 else None
+        except (requests.RequestException, TimeoutError):
+            return None
+
+    def _get_site_page(self, url: str) -> Optional[requests.Response]:
+        """GET a page every search of a site reads (homepage, robots.txt, sitemaps) once per run"""
+        return self.site_pages.get(url, lambda: self._get(url))
+
+    def _candidates(self, site_url: str, exclude: set) -> Iterator[Tuple[str, str]]:
+        """Candidate feed URLs for a site as (url, method), cheapest signals first"""
+        seen = set(exclude)
+
+        def fresh(urls, method):
+            for url in urls:
+                if url not in seen:
+                    seen.add(url)
+                    yield url, method
+
+        homepage = self._get_site_page(site_url)
+        if homepage is not None:
+            yield from fresh(find_feed_links(homepage.text, homepage.url), 'link_alternate')
+
+        yield from fresh((urljoin(site_url, path) for path in COMMON_FEED_PATHS), 'common_path')
+
+        robots = self._get_site_page(urljoin(site_url, '/robots.txt'))
+        queue = SITEMAP_LINE_RE.findall(robots.text) if robots is not None else []
+        queue = queue or [urljoin(site_url, '/sitemap.xml')]
+        for index, sitemap_url in enumerate(queue):  # Grows as sitemap indexes are read
+            if index >= MAX_SITEMAPS:
+                break
+            sitemap = self._get_site_page(sitemap_url)
+            if sitemap is None:
+                continue
+            feeds, children = find_sitemap_feeds(sitemap.text)
+            yield from fresh(feeds, 'sitemap')
+            queue.extend(child for child in children if child not in queue)
+
+    def _validate(self, url: str, name: str) -> List[Dict]:
+        """Items from a candidate URL, or [] when it isn't a working feed"""
+        response = self._get(url)
+        if response is None:
+            return []
+        try:
+            return parse_feed_items(response.content, name, url)
+        except Exception:
+            return []
+
+    def discover(self, feed: Dict, site_url: str = None) -> Tuple[Optional[str], List[Dict]]:
+        """
+        Search a site for a working feed to replace a failing one
+
+        Args:
+            feed: Feed config whose URL failed (its configured URL is the cache key)
+            site_url: Site homepage, defaulting to the feed URL's origin
+
+        Returns:
+            Tuple: (discovered feed URL, its items), or (None, []) when nothing works
+
+        A search cut short by the run budget isn't remembered, so the site is searched again next run.
+        """
+        configured_url = feed.get('configured_url', feed['url'])
+        parsed = urlparse(feed['url'])
+        site_url = site_url or f"{parsed.scheme}://{parsed.netloc}/"
+        print(f"🔍 Looking for a working feed on {site_url} for {feed['name']}...")
+
+        found, items = None, []
+        for attempt, (candidate, method) in enumerate(self._candidates(site_url, {configured_url, feed['url']})):
+            if attempt >= MAX_CANDIDATES:
+                break
+            if self.budget and self.budget.budget_spent():
+                print(f"⏱️  Stopped looking for a feed for {feed['name']} - run budget spent")
+                return None, []
+            items = self._validate(candidate, feed['name'])
+            if items:
+                found = candidate
+                print(f"✨ Found feed for {feed['name']} via {method}: {candidate}")
+                break
+
+        with self.lock:
+            entry = {'checked_at': datetime.now().isoformat(), 'feed_url': found}
+            if found:
+                entry['method'] = method
+            self.entries[configured_url] = entry
+        return found, items if found else []
+
+    async def discover_many_async(self, feeds: List[Dict]) -> Dict[str, Tuple[Optional[str], List[Dict]]]:
+        """
+        Search the sites of many failing feeds concurrently, high-priority feeds first
+
+        Args:
+            feeds: Feed configs whose URLs failed; each configured URL is searched once
+
+        Returns:
+            Dict: Configured feed URL -> (discovered feed URL, its items), (None, []) when
+                  nothing works or the run budget ran out first
+        """
+        global_limit = asyncio.Semaphore(self.concurrency)
+        host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        ordered = {}
+        for feed in order_by_priority(feeds):
+            ordered.setdefault(feed.get('configured_url', feed['url']), feed)
+
+        async def search(feed: Dict) -> Tuple[Optional[str], List[Dict]]:
+            async with host_limits[urlparse(feed['url']).netloc.lower()], global_limit:
+                # Searches are a repair step; none starts once the soft budget is spent
+                if self.budget and self.budget.budget_spent():
+                    return None, []
+                return await loop.run_in_executor(executor, self.discover, feed)
+
+        tasks = [asyncio.ensure_future(search(feed)) for feed in ordered.values()]
+        pending = set()
+        try:
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=self.budget.remaining() if self.budget else None)
+            for task in pending:
+                task.cancel()
+            if pending:
+                print(f"⏱️  Run deadline reached - abandoned {len(pending)} feed searches")
+        finally:
+            # Abandoned searches' requests are capped at the deadline
+            executor.shutdown(wait=not pending, cancel_futures=True)
+
+        return {
+            configured_url: (None, []) if task in pending else task.result()
+            for configured_url, task in zip(ordered, tasks)
+        }
+
+    def discover_many(self, feeds: List[Dict]) -> Dict[str, Tuple[Optional[str], List[Dict]]]:
+        """Synchronous entry point for discover_many_async"""
+        return asyncio.run(self.discover_many_async(feeds))
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Feed Fetcher
+Concurrent asyncio engine that downloads every active RSS feed in one pass
+"""
+
+import asyncio
+import feedparser
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from feed_health import FeedHealthRegistry
+from feed_stream import FeedFormatError, iter_feed_entries, take_entries
+from http_cache import HTTPCache
+from http_client import create_session
+from politeness import HostRateLimiter, get_shared_limiter
+from request_coalescer import RequestCoalescer
+from run_budget import RunBudget, order_by_priority
+
+# Configuration
+FEED_USER_AGENT = 'CurationsLA/1.0 (Newsletter Aggregator; +https://la.curations.cc)'
+MAX_CONCURRENT_FETCHES = 16  # Global cap on in-flight feed downloads
+MAX_FETCHES_PER_HOST = 2     # Keeps a single publisher from seeing a burst
+FEED_TIMEOUT = 30
+FEED_ENTRY_LIMIT = 10        # Limit to 10 most recent entries per feed
+PARSE_PROCESSES = min(4, os.cpu_count() or 1)  # Feed parsing is CPU-bound
+
+def parse_feed_items(content: bytes, name: str, url: str, limit: int = FEED_ENTRY_LIMIT,
+                     cutoff: Optional[datetime] = None) -> List[Dict]:
+    """
+    Parse raw feed bytes into newsletter item dicts
+
+    Entries are streamed and parsing stops after the first limit entries (or once
+    the feed runs past the freshness cutoff). Documents the streaming parser
+    can't read fall back to a full feedparser parse.
+    """
+    try:
+        entries = take_entries(iter_feed_entries(content), limit, cutoff)
+    except FeedFormatError as e:
+        feed = feedparser.parse(content)
+
+        if feed.bozo:
+            print(f"⚠️  Feed parsing warning for {name}: {feed.bozo_exception}")
+        else:
+            print(f"⚠️  Streaming parse failed for {name}, used feedparser: {str(e)}")
+
+        entries = take_entries(feed.entries, limit, cutoff)
+
+    items = []
+    for entry in entries:
+        item = {
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'description': entry.get('description', ''),
+            'published': entry.get('published', ''),
+            'summary': entry.get('summary', ''),
+            'source': name,
+            'feed_url': url
+        }
+        items.append(item)
+
+    return items
+
+class FeedFetcher:
+    def __init__(self, concurrency: int = MAX_CONCURRENT_FETCHES,
+                 per_host: int = MAX_FETCHES_PER_HOST, timeout: int = FEED_TIMEOUT,
+                 http_cache: HTTPCache = None, health: FeedHealthRegistry = None,
+                 rate_limiter: HostRateLimiter = None, parse_processes: int = PARSE_PROCESSES,
+                 entry_limit: int = FEED_ENTRY_LIMIT, cutoff: Optional[datetime] = None):
+        """
+        Initialize Feed Fetcher
+
+        Args:
+            concurrency: Maximum number of feeds downloaded at the same time
+            per_host: Maximum number of simultaneous downloads from one host
+            timeout: Per-request timeout in seconds
+            http_cache: Optional conditional-GET cache for feed bodies
+            health: Optional health registry; feeds with an open circuit are skipped
+            rate_limiter: Per-host request spacing (defaults to the shared limiter)
+            parse_processes: Worker processes for feed parsing (0 parses in-thread)
+            entry_limit: Entries kept per feed; parsing stops once it is reached
+            cutoff: Optional freshness cutoff; older entries are skipped
+        """
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.http_cache = http_cache
+        self.health = health
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        self.parse_processes = parse_processes
+        self.entry_limit = entry_limit
+        self.cutoff = cutoff
+        # Feeds shared between category configs are fetched and parsed once per run
+        self.coalescer = RequestCoalescer()
+
+        # Keep-alive connections pooled with the scraper and enricher
+        self.session = create_session(FEED_USER_AGENT)
+
+    def download(self, url: str, timeout: float = None) -> Tuple[bytes, bool]:
+        """
+        Download a feed body, revalidating against the HTTP cache
+
+        Args:
+            url: Feed URL
+            timeout: Request timeout, defaulting to the fetcher's timeout
+
+        Returns:
+            Tuple: (body, not_modified) where not_modified means it came from disk
+        """
+        headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
+        response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+
+        if response.status_code == 304 and self.http_cache:
+            body = self.http_cache.get_body(url)
+            if body is not None:
+                self.http_cache.mark_validated(url)
+                return body, True
+
+        response.raise_for_status()
+
+        if self.http_cache:
+            self.http_cache.store(url, response.content, response.headers)
+        return response.content, False
+
+    def is_skipped(self, url: str, name: str) -> bool:
+        """Check the circuit breaker before spending a request on a feed"""
+        if self.health and self.health.is_open(url):
+            print(f"⛔ Skipping {name} - known-dead feed, circuit open")
+            return True
+        return False
+
+    def fetch_feed(self, url: str, name: str) -> List[Dict]:
+        """Fetch and parse a single feed, returning [] on failure"""
+        if self.is_skipped(url, name):
+            return []
+
+        def fetch():
+            self.rate_limiter.wait(url)
+            return self._fetch_feed(url, name)
+
+        return self._fan_out(self.coalescer.get(url, fetch), name)
+
+    def _fan_out(self, items: List[Dict], name: str) -> List[Dict]:
+        """Give each requester its own copies, stamped with its feed name"""
+        return [dict(item, source=name) for item in items]
+
+    def _download_stage(self, url: str, name: str,
+                        timeout: float = None) -> Tuple[Optional[bytes], Optional[List[Dict]]]:
+        """
+        Network stage of a feed fetch
+
+        Returns:
+            Tuple: (body to parse, None), or (None, items) when the cache already has them
+        """
+        print(f"📡 Fetching {name}...")
+        body, not_modified = self.download(url, timeout)
+
+        items = self.http_cache.get_items(url) if not_modified else None
+        if items is not None:
+            # Unchanged since last run - reuse the parsed items from disk
+            print(f"♻️  {name} not modified - reused {len(items)} cached items")
+            return None, [dict(item, source=name, feed_url=url) for item in items]
+        return body, None
+
+    def _store_parsed(self, url: str, name: str, items: List[Dict]):
+        """Cache freshly parsed items alongside the feed body"""
+        if self.http_cache:
+            self.http_cache.store_items(url, items)
+        print(f"✅ Retrieved {len(items)} items from {name}")
+
+    def _record_failure(self, url: str, name: str, error: Exception, latency: float):
+        print(f"❌ Error fetching {name}: {str(error)}")
+        if self.health:
+            self.health.record_failure(url, str(error), latency)
+
+    def _fetch_feed(self, url: str, name: str) -> List[Dict]:
+        """Fetch and parse a feed once its request slot has been granted"""
+        start = time.monotonic()
+        try:
+            body, items = self._download_stage(url, name)
+            latency = time.monotonic() - start
+            if items is None:
+                items = parse_feed_items(body, name, url, self.entry_limit, self.cutoff)
+                self._store_parsed(url, name, items)
+
+            if self.health:
+                self.health.record_success(url, latency)
+            return items
+        except Exception as e:
+            self._record_failure(url, name, e, time.monotonic() - start)
+            return []
+
+    def _create_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Start the feed-parsing process pool, or None to parse in-thread"""
+        if self.parse_processes <= 0:
+            return None
+        try:
+            # Spawned workers avoid forking a process that already runs threads
+            return ProcessPoolExecutor(max_workers=self.parse_processes,
+                                       mp_context=multiprocessing.get_context('spawn'))
+        except (OSError, NotImplementedError) as e:
+            print(f"⚠️  Parse process pool unavailable, parsing in-thread: {str(e)}")
+            return None
+
+    async def _parse(self, body: bytes, name: str, url: str, executor: ThreadPoolExecutor,
+                     parse_pool: Optional[ProcessPoolExecutor]) -> List[Dict]:
+        """CPU stage: parse feed bytes in the process pool, falling back to a thread"""
+        loop = asyncio.get_running_loop()
+        if parse_pool:
+            try:
+                return await loop.run_in_executor(parse_pool, parse_feed_items, body, name, url,
+                                                  self.entry_limit, self.cutoff)
+            except BrokenProcessPool:
+                print(f"⚠️  Parse process pool broke, parsing {name} in-thread")
+        return await loop.run_in_executor(executor, parse_feed_items, body, name, url,
+                                          self.entry_limit, self.cutoff)
+
+    async def _fetch_one(self, feed: Dict, executor: ThreadPoolExecutor,
+                         parse_pool: Optional[ProcessPoolExecutor],
+                         global_limit: asyncio.Semaphore,
+                         host_limits: Dict[str, asyncio.Semaphore],
+                         budget: Optional[RunBudget] = None,
+                         categories: Optional[List[str]] = None) -> List[Dict]:
+        """Download one feed under the global and per-host limits, then parse it"""
+        url, name = feed['url'], feed['name']
+        host = urlparse(url).netloc.lower()
+        loop = asyncio.get_running_loop()
+
+        if self.is_skipped(url, name):
+            return []
+
+        async def fetch():
+            async with host_limits[host]:
+                # Waiting for the host's token doesn't hold a global slot
+                await self.rate_limiter.wait_async(url)
+                async with global_limit:
+                    # The launch decision is made when the slot is granted, not when queued
+                    if budget and not budget.should_launch(feed, categories):
+                        print(f"⏱️  Skipping {name} - run budget spent")
+                        return []
+                    start = time.monotonic()
+                    try:
+                        timeout = budget.cap_timeout(self.timeout) if budget else self.timeout
+                        body, items = await loop.run_in_executor(executor, self._download_stage,
+                                                                 url, name, timeout)
+                    except Exception as e:
+                        self._record_failure(url, name, e, time.monotonic() - start)
+                        return []
+                    latency = time.monotonic() - start
+
+            # Download slots are released here, so parsing overlaps other downloads
+            try:
+                if items is None:
+                    items = await self._parse(body, name, url, executor, parse_pool)
+                    await loop.run_in_executor(executor, self._store_parsed, url, name, items)
+            except Exception as e:
+                self._record_failure(url, name, e, latency)
+                return []
+
+            if self.health:
+                self.health.record_success(url, latency)
+            return items
+
+        items = self._fan_out(await self.coalescer.get_async(url, fetch), name)
+        if budget:
+            budget.add_candidates(feed.get('category'), len(items))
+        return items
+
+    async def fetch_feeds_async(self, feeds: List[Dict],
+                                budget: Optional[RunBudget] = None) -> Dict[str, List[Dict]]:
+        """
+        Fetch many feeds concurrently, high-priority feeds first
+
+        Args:
+            feeds: Feed configs with 'name' and 'url' keys (plus optional
+                   'priority' and 'category')
+            budget: Optional run budget; once its soft budget is spent, lower-priority
+                    feeds for covered categories are skipped, and any fetch still
+                    running at its deadline is abandoned
+
+        Returns:
+            Dict: Feed URL -> parsed items ([] for failed or skipped feeds)
+        """
+        global_limit = asyncio.Semaphore(self.concurrency)
+        host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        parse_pool = self._create_parse_pool()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        # Semaphores wake waiters in arrival order, so sorted tasks get slots first
+        ordered = order_by_priority(feeds)
+        categories_by_url = defaultdict(list)
+        for feed in ordered:
+            categories_by_url[feed['url']].append(feed.get('category'))
+
+        # Each distinct URL is downloaded once; duplicates join the in-flight fetch
+        tasks = [
+            asyncio.ensure_future(self._fetch_one(feed, executor, parse_pool, global_limit, host_limits,
+                                                  budget, categories_by_url[feed['url']]))
+            for feed in ordered
+        ]
+        pending = set()
+        try:
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=budget.remaining() if budget else None)
+            for task in pending:
+                task.cancel()
+            if pending:
+                print(f"⏱️  Run deadline reached - abandoned {len(pending)} in-flight feeds")
+        finally:
+            # Don't wait on abandoned downloads; their timeouts are capped at the deadline
+            executor.shutdown(wait=not pending, cancel_futures=True)
+            if parse_pool:
+                parse_pool.shutdown(wait=not pending, cancel_futures=True)
+
+        return {
+            feed['url']: [] if task in pending else task.result()
+            for feed, task in zip(ordered, tasks)
+        }
+
+    def fetch_feeds(self, feeds: List[Dict], budget: Optional[RunBudget] = None) -> Dict[str, List[Dict]]:
+        """Synchronous entry point for fetch_feeds_async"""
+        return asyncio.run(self.fetch_feeds_async(feeds, budget))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Feed Health Registry
+Persistent per-feed health records with a circuit breaker for known-dead feeds
+"""
+
+import math
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from http_fixtures import fixture_cache_dir
+from json_store import load_section, save_section
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+HEALTH_FILE = CACHE_DIR / "feed_health.json"
+
+FAILURE_THRESHOLD = 3    # Consecutive failures before the circuit opens
+COOLDOWN_HOURS = 24      # How long an open circuit skips the feed
+LATENCY_WINDOW = 50      # Recent latency samples kept per feed
+
+def _percentile(samples: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+class FeedHealthRegistry:
+    def __init__(self, health_file: Path = HEALTH_FILE, failure_threshold: int = FAILURE_THRESHOLD,
+                 cooldown_hours: float = COOLDOWN_HOURS):
+        """
+        Initialize Feed Health Registry
+
+        Args:
+            health_file: JSON file the registry persists to
+            failure_threshold: Consecutive failures that open a feed's circuit
+            cooldown_hours: Hours an open circuit stays open before a retry
+        """
+        self.health_file = Path(health_file)
+        self.failure_threshold = failure_threshold
+        self.cooldown = timedelta(hours=cooldown_hours)
+        self.lock = threading.Lock()
+        self.records = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load health records from disk"""
+        return load_section(self.health_file, 'feeds', "feed health file")
+
+    def save(self):
+        """Persist health records to disk"""
+        with self.lock:
+            save_section(self.health_file, 'feeds', self.records)
+
+    def _record(self, url: str) -> Dict:
+        """Get or create the raw record for a feed (caller holds the lock)"""
+        if url not in self.records:
+            self.records[url] = {
+                'attempts': 0,
+                'successes': 0,
+                'consecutive_failures': 0,
+                'latencies': [],
+                'last_error': None,
+                'last_success': None,
+                'last_failure': None,
+                'circuit_open_until': None
+            }
+        return self.records[url]
+
+    def record_success(self, url: str, latency: float):
+        """Record a successful fetch and close the feed's circuit"""
+        with self.lock:
+            record = self._record(url)
+            record['attempts'] += 1
+            record['successes'] += 1
+            record['consecutive_failures'] = 0
+            record['circuit_open_until'] = None
+            record['last_success'] = datetime.now().isoformat()
+            record['latencies'] = (record['latencies'] + [round(latency, 3)])[-LATENCY_WINDOW:]
+
+    def record_failure(self, url: str, error: str, latency: float = None):
+        """Record a failed fetch, opening the circuit once the threshold is hit"""
+        with self.lock:
+            record = self._record(url)
+            now = datetime.now()
+            record['attempts'] += 1
+            record['consecutive_failures'] += 1
+            record['last_error'] = error
+            record['last_failure'] = now.isoformat()
+            if latency is not None:
+                record['latencies'] = (record['latencies'] + [round(latency, 3)])[-LATENCY_WINDOW:]
+
+            if record['consecutive_failures'] >= self.failure_threshold:
+                record['circuit_open_until'] = (now + self.cooldown).isoformat()
+
+    def is_open(self, url: str, now: datetime = None) -> bool:
+        """Check whether a feed's circuit is open (feed should be skipped)"""
+        record = self.records.get(url)
+        if not record or not record.get('circuit_open_until'):
+            return False
+        now = now or datetime.now()
+        return now < datetime.fromisoformat(record['circuit_open_until'])
+
+    def get_feed_health(self, url: str) -> Dict:
+        """
+        Get the health summary for a feed
+
+        Returns:
+            Dict: success rate, p50/p95 latency, last error, failures and circuit state
+        """
+        record = self.records.get(url)
+        if not record:
+            return {'url': url, 'attempts': 0, 'circuit': 'closed'}
+
+        if self.is_open(url):
+            circuit = 'open'
+        elif record['consecutive_failures'] >= self.failure_threshold:
+            circuit = 'half_open'  # Cooldown expired; next fetch is a trial
+        else:
+            circuit = 'closed'
+
+        return {
+            'url': url,
+            'attempts': record['attempts'],
+            'success_rate': round(record['successes'] / record['attempts'], 3) if record['attempts'] else None,
+            'p50_latency': _percentile(record['latencies'], 50),
+            'p95_latency': _percentile(record['latencies'], 95),
+            'last_error': record['last_error'],
+            'consecutive_failures': record['consecutive_failures'],
+            'circuit': circuit,
+            'circuit_open_until': record['circuit_open_until']
+        }
+
+    def get_health_report(self) -> Dict:
+        """Get a summary of every tracked feed"""
+        feeds = [self.get_feed_health(url) for url in self.records]
+        return {
+            'tracked_feeds': len(feeds),
+            'open_circuits': sum(1 for feed in feeds if feed['circuit'] == 'open'),
+            'feeds': sorted(feeds, key=lambda feed: feed.get('success_rate') or 0)
+        }
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Batch Vibe Scorer
+Runs the keyword automaton over a whole list of texts in lockstep with NumPy, producing a
+sparse keyword-presence matrix that is reduced to scores and neighborhoods without Python loops per item
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .keyword_matcher import KeywordMatcher
+except ImportError:
+    from keyword_matcher import KeywordMatcher
+
+class BatchScorer:
+    def __init__(self, matcher: KeywordMatcher, weights: Sequence[float], ranks: Sequence[int], no_rank: int,
+                 columns: Sequence[int] = None):
+        """
+        Initialize Batch Scorer
+
+        Args:
+            matcher: Compiled keyword automaton
+            weights: Score contribution of each keyword column
+            ranks: Priority of each keyword column when picking a neighborhood (lower wins)
+            no_rank: Rank given to columns that aren't neighborhoods, and to texts without one
+            columns: Keyword column of each pattern id, when several patterns count as one
+                     keyword (defaults to one column per pattern)
+        """
+        self.columns = np.arange(len(matcher.patterns)) if columns is None else np.asarray(columns, dtype=np.intp)
+        self.column_count = len(weights)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.ranks = np.asarray(ranks, dtype=np.intp)
+        self.no_rank = no_rank
+        candidates = np.flatnonzero(self.ranks < no_rank)
+        self.ranked_columns = candidates[np.argsort(self.ranks[candidates], kind='stable')]
+
+        # Characters that appear in some keyword get a class; every other character is
+        # class 0, which always leads back to the root state
+        alphabet = sorted({char for _, keyword in matcher.patterns for char in keyword})
+        if len(alphabet) >= 255 or any(ord(char) > 255 for char in alphabet) or {'\0', '?'} & set(alphabet):
+            raise ValueError("Batch scoring needs keywords written in Latin-1 without '?' or NUL")
+        self.classes = np.zeros(256, dtype=np.uint8)
+        for char_class, char in enumerate(alphabet, start=1):
+            self.classes[ord(char)] = char_class
+            if char.isascii() and char.upper() != char:
+                self.classes[ord(char.upper())] = char_class  # ASCII texts skip str.lower()
+
+        # Dense transition table, flattened: row offset of a state + character class -> row offset
+        # of the next state, so each step of the scan is one add and one gather
+        self.class_count = len(alphabet) + 1
+        table = np.zeros((len(matcher.delta), self.class_count), dtype=np.int32)
+        for state, transitions in enumerate(matcher.delta):
+            for char, target in transitions.items():
+                table[state, self.classes[ord(char)]] = target
+        self.table = (table * self.class_count).ravel()
+
+        # Pattern ids reported by each state, flattened
+        self.output_counts = np.array([len(ids) for ids in matcher.output], dtype=np.intp)
+        self.output_starts = np.cumsum(self.output_counts) - self.output_counts
+        self.output_ids = np.fromiter((pattern_id for ids in matcher.output for pattern_id in ids),
+                                      dtype=np.intp, count=int(self.output_counts.sum()))
+        self.has_output = np.repeat(self.output_counts > 0, self.class_count)  # By row offset
+
+    def presence(self, texts: List[str]) -> np.ndarray:
+        """
+        Keyword-presence matrix of a batch of texts
+
+        Args:
+            texts: Texts to search (lowercased here)
+
+        Returns:
+            np.ndarray: Boolean matrix, one row per text and one column per keyword
+        """
+        present = np.zeros((len(texts), self.column_count), dtype=bool)
+
+        # ASCII texts are case-folded by the class table; others need str.lower(), which can change
+        # their length. Anything outside Latin-1 becomes '?', which no keyword contains.
+        prepared = [text if text.isascii() else text.lower() for text in texts]
+        lengths = np.fromiter(map(len, prepared), dtype=np.intp, count=len(prepared))
+        width = int(lengths.max(initial=0))
+        if not width:
+            return present
+
+        # Longest texts first, so the texts still running at any position are a prefix
+        order = np.argsort(-lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        running = np.searchsorted(-sorted_lengths, -np.arange(width), side='left')
+        position_starts = np.cumsum(running) - running
+
+        # Character classes laid out position-major without padding: position p holds the
+        # p-th character of every text that is at least p + 1 characters long, in sorted order
+        codes = np.frombuffer(''.join(prepared[i] for i in order).encode('latin-1', 'replace'), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(texts)), sorted_lengths)
+        positions = np.arange(codes.size) - np.repeat(np.cumsum(sorted_lengths) - sorted_lengths, sorted_lengths)
+        grid = np.empty(codes.size, dtype=np.uint8)
+        grid[position_starts[positions] + rows] = self.classes[codes]
+
+        # Step every running text through the automaton at once, keeping each state visited
+        table = self.table
+        state = np.zeros(len(texts), dtype=np.int32)
+        visited = np.empty(codes.size, dtype=np.int32)
+        for start, count in zip(position_starts.tolist(), running.tolist()):
+            current = table[state[:count] + grid[start:start + count]]
+            state[:count] = current
+            visited[start:start + count] = current
+
+        hits = np.flatnonzero(self.has_output[visited])
+        if not hits.size:
+            return present
+
+        # Expand each (text, state) hit into the pattern ids that state reports
+        rows = hits - position_starts[np.searchsorted(position_starts, hits, side='right') - 1]
+        states = visited[hits] // self.class_count
+        counts = self.output_counts[states]
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        pattern_ids = self.output_ids[np.repeat(self.output_starts[states], counts) + offsets]
+
+        # A keyword counts once per text, however often (and in whichever form) it appears
+        present[order[np.repeat(rows, counts)], self.columns[pattern_ids]] = True
+        return present
+
+    def reduce(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Summed keyword weight and best neighborhood rank of every text
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Tuple: (net weight per text, lowest rank found per text or no_rank)
+        """
+        present = self.presence(texts)
+        net = present @ self.weights
+
+        # First neighborhood column present, with columns in rank order
+        ranked = present[:, self.ranked_columns]
+        best = np.where(ranked.any(axis=1), self.ranks[self.ranked_columns][ranked.argmax(axis=1)], self.no_rank) \
+            if self.ranked_columns.size else np.full(len(texts), self.no_rank, dtype=np.intp)
+        return net, best
@@ -4,102 +4,46 @@ CurationsLA Good Vibes Filter
 Filters content to maintain positive, community-focused newsletter tone
 """
 
-import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Set
 
-# Positive keywords that boost Good Vibes score
-GOOD_VIBES_KEYWORDS = [
-    # Openings & Launches
-    'opening', 'launch', 'debut', 'premiere', 'unveiling', 'grand opening',
-    'soft opening', 'ribbon cutting', 'new', 'introducing', 'announcing',
-    
-    # Community & Celebration
-    'community', 'celebrate', 'celebration', 'festival', 'party', 'gathering',
-    'reunion', 'anniversary', 'milestone', 'achievement', 'success', 'winner',
-    'award', 'recognition', 'honor', 'tribute',
-    
-    # Culture & Arts
-    'art', 'artist', 'exhibition', 'gallery', 'museum', 'performance',
-    'concert', 'music', 'theater', 'dance', 'creative', 'culture',
-    'mural', 'installation', 'sculpture', 'painting',
-    
-    # Food & Dining
-    'restaurant', 'cafe', 'coffee', 'food', 'chef', 'menu', 'dining',
-    'brewery', 'bar', 'cocktail', 'wine', 'brunch', 'dinner', 'lunch',
-    'farmers market', 'food truck', 'bakery', 'dessert',
-    
-    # Business & Innovation
-    'expansion', 'growth', 'innovation', 'collaboration', 'partnership',
-    'investment', 'funding', 'startup', 'entrepreneur', 'business',
-    'hiring', 'jobs', 'opportunity', 'development',
-    
-    # Positive Activities
-    'free', 'family-friendly', 'outdoor', 'fun', 'exciting', 'amazing',
-    'beautiful', 'stunning', 'gorgeous', 'incredible', 'wonderful',
-    'fantastic', 'awesome', 'brilliant', 'inspiring', 'uplifting',
-    
-    # Community Improvement
-    'renovation', 'restoration', 'improvement', 'upgrade', 'modernization',
-    'beautification', 'revitalization', 'transformation', 'enhancement',
-    'sustainability', 'green', 'eco-friendly', 'renewable'
-]
-
-# Negative keywords that reduce Good Vibes score or block content
-BLOCKED_KEYWORDS = [
-    # Crime & Violence
-    'murder', 'shooting', 'stabbing', 'robbery', 'theft', 'burglary',
-    'assault', 'attack', 'violence', 'crime', 'criminal', 'arrest',
-    'police', 'investigation', 'suspect', 'victim', 'death', 'killed',
-    'injured', 'hospital', 'emergency',
-    
-    # Politics & Controversy
-    'political', 'politics', 'election', 'candidate', 'voting', 'ballot',
-    'republican', 'democrat', 'conservative', 'liberal', 'government',
-    'city council', 'mayor', 'congressman', 'senator', 'governor',
-    'protest', 'rally', 'demonstration', 'activist', 'activism',
-    
-    # Legal & Financial Problems
-    'lawsuit', 'legal', 'court', 'judge', 'trial', 'settlement',
-    'bankruptcy', 'foreclosure', 'eviction', 'closure', 'closing',
-    'layoffs', 'fired', 'terminated', 'downsizing', 'cuts', 'losses',
-    'debt', 'financial trouble', 'scandal', 'fraud', 'corruption',
-    
-    # Controversy & Conflict
-    'controversy', 'controversial', 'outrage', 'angry', 'anger',
-    'upset', 'furious', 'complaint', 'complain', 'criticism', 'critic',
-    'oppose', 'opposition', 'against', 'conflict', 'dispute', 'fight',
-    'argument', 'disagreement', 'tension', 'divided',
-    
-    # Negative Business
-    'decline', 'decrease', 'drop', 'fall', 'plummet', 'crash',
-    'fail', 'failure', 'struggling', 'problem', 'issue', 'concern',
-    'worry', 'fear', 'threat', 'danger', 'risk', 'warning'
-]
-
-# Neighborhood name patterns for LA
-LA_NEIGHBORHOODS = {
-    'downtown': ['downtown', 'dtla', 'downtown la', 'downtown los angeles', 'arts district', 'little tokyo', 'chinatown'],
-    'westside': ['westside', 'santa monica', 'venice', 'brentwood', 'west la', 'west los angeles', 'mar vista', 'palms'],
-    'valley': ['valley', 'san fernando valley', 'studio city', 'sherman oaks', 'burbank', 'north hollywood', 'van nuys', 'encino'],
-    'eastside': ['eastside', 'silver lake', 'echo park', 'los feliz', 'highland park', 'eagle rock', 'mount washington'],
-    'south_bay': ['south bay', 'manhattan beach', 'hermosa beach', 'redondo beach', 'el segundo', 'torrance'],
-    'hollywood': ['hollywood', 'west hollywood', 'weho', 'hollywood hills', 'sunset strip', 'melrose'],
-    'mid_city': ['mid city', 'beverly hills', 'fairfax', 'miracle mile', 'mid-wilshire', 'koreatown', 'pico-robertson'],
-    'pasadena': ['pasadena', 'south pasadena', 'altadena', 'san marino', 'alhambra'],
-    'beaches': ['manhattan beach', 'hermosa beach', 'redondo beach', 'el segundo', 'playa del rey']
-}
+try:
+    from .vibe_engine import (
+        BLOCKED_KEYWORDS, DEFAULT_THRESHOLD, GOOD_VIBES_KEYWORDS, LA_NEIGHBORHOODS, get_engine
+    )
+except ImportError:
+    from vibe_engine import (
+        BLOCKED_KEYWORDS, DEFAULT_THRESHOLD, GOOD_VIBES_KEYWORDS, LA_NEIGHBORHOODS, get_engine
+    )
 
 class GoodVibesFilter:
-    def __init__(self, threshold: float = 0.3):
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, match_mode: str = None):
         """
         Initialize Good Vibes Filter
         
         Args:
             threshold: Minimum vibe score (0-1) for content to pass filter
+            match_mode: 'tokens' (whole words) or 'substring'; defaults to the engine's MATCH_MODE
         """
         self.threshold = threshold
-        self.good_keywords = set(keyword.lower() for keyword in GOOD_VIBES_KEYWORDS)
-        self.blocked_keywords = set(keyword.lower() for keyword in BLOCKED_KEYWORDS)
+        
+        # Lexicon and compiled matcher are shared with every other scorer
+        self.engine = get_engine(match_mode)
+        self.good_keywords = set(self.engine.good_keywords)
+        self.blocked_keywords = set(self.engine.blocked_keywords)
+        self.neighborhood_order = self.engine.neighborhood_order
+        self.matcher = self.engine.matcher
+    
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Find every good keyword, blocked keyword and neighborhood in one pass
+        
+        Args:
+            text: Content to analyze
+            
+        Returns:
+            Dict: 'good', 'blocked' and 'neighborhood' -> keywords found
+        """
+        return self.engine.scan(text)
     
     def calculate_vibe_score(self, text: str) -> float:
         """
@@ -111,31 +55,19 @@ class GoodVibesFilter:
         Returns:
             float: Vibe score between 0 (bad vibes) and 1 (good vibes)
         """
-        if not text:
-            return 0.0
-        
-        text_lower = text.lower()
-        
-        # Count positive keywords
-        good_score = 0
-        for keyword in self.good_keywords:
-            if keyword in text_lower:
-                good_score += 1
-        
-        # Count negative keywords (weighted more heavily)
-        bad_score = 0
-        for keyword in self.blocked_keywords:
-            if keyword in text_lower:
-                bad_score += 2  # Negative keywords have more impact
-        
-        # Calculate final score
-        net_score = good_score - bad_score
-        
-        # Normalize to 0-1 scale
-        # Add baseline of 5 to prevent completely neutral content from scoring 0
-        normalized_score = max(0, min(1, (net_score + 5) / 10))
+        return self.engine.score(text)
+    
+    def score_matches(self, matches: Dict[str, Set[str]]) -> float:
+        """
+        Vibe score from a scan result
         
-        return normalized_score
+        Args:
+            matches: Output of scan()
+            
+        Returns:
+            float: Vibe score between 0 (bad vibes) and 1 (good vibes)
+        """
+        return self.engine.score_matches(matches)
     
     def extract_neighborhood(self, text: str) -> str:
         """
@@ -147,17 +79,19 @@ class GoodVibesFilter:
         Returns:
             str: Neighborhood name or "Los Angeles" as fallback
         """
-        text_lower = text.lower()
-        
-        # Check for neighborhood mentions
-        for area, neighborhoods in LA_NEIGHBORHOODS.items():
-            for neighborhood in neighborhoods:
-                if neighborhood in text_lower:
-                    # Return properly capitalized neighborhood name
-                    return neighborhood.title()
+        return self.engine.neighborhood(text)
+    
+    def neighborhood_from_matches(self, matches: Dict[str, Set[str]]) -> str:
+        """
+        Neighborhood from a scan result
         
-        # Default fallback
-        return "Los Angeles"
+        Args:
+            matches: Output of scan()
+            
+        Returns:
+            str: Neighborhood name or "Los Angeles" as fallback
+        """
+        return self.engine.neighborhood_from_matches(matches)
     
     def is_good_vibes(self, text: str) -> bool:
         """
@@ -182,20 +116,17 @@ class GoodVibesFilter:
         Returns:
             List[Dict]: Filtered items with added vibe_score and neighborhood
         """
-        filtered_items = []
+        # Combine title and description for analysis, scoring the whole list in one batch
+        texts = [f"{item.get('title', '')} {item.get('description', '')}" for item in items]
+        scores, neighborhoods, passes = self.engine.score_batch(texts, self.threshold)
         
-        for item in items:
-            # Combine title and description for analysis
-            full_text = f"{item.get('title', '')} {item.get('description', '')}"
-            
-            # Calculate vibe score
-            vibe_score = self.calculate_vibe_score(full_text)
-            
+        filtered_items = []
+        for item, vibe_score, neighborhood, passed in zip(items, scores, neighborhoods, passes):
             # Only include items that meet threshold
-            if vibe_score >= self.threshold:
+            if passed:
                 # Add metadata
                 item['vibe_score'] = round(vibe_score, 3)
-                item['neighborhood'] = self.extract_neighborhood(full_text)
+                item['neighborhood'] = neighborhood
                 item['is_good_vibes'] = True
                 
                 filtered_items.append(item)
@@ -215,19 +146,15 @@ class GoodVibesFilter:
         Returns:
             Dict: Analysis results including score, neighborhood, keywords found
         """
-        text_lower = text.lower()
+        matches = self.scan(text)
         
-        # Find positive keywords
-        good_keywords_found = [kw for kw in self.good_keywords if kw in text_lower]
+        # Keywords found, in lexicon order
+        good_keywords_found = self.engine.ordered(matches['good'])
+        bad_keywords_found = self.engine.ordered(matches['blocked'])
         
-        # Find negative keywords
-        bad_keywords_found = [kw for kw in self.blocked_keywords if kw in text_lower]
-        
-        # Calculate score
-        vibe_score = self.calculate_vibe_score(text)
-        
-        # Extract neighborhood
-        neighborhood = self.extract_neighborhood(text)
+        # Score and neighborhood from the same scan
+        vibe_score = self.score_matches(matches) if text else 0.0
+        neighborhood = self.neighborhood_from_matches(matches)
         
         return {
             'vibe_score': round(vibe_score, 3),
@@ -248,16 +175,10 @@ class GoodVibesFilter:
         Returns:
             Dict: Filter statistics
         """
-        return {
-            'threshold': self.threshold,
-            'good_keywords_count': len(self.good_keywords),
-            'blocked_keywords_count': len(self.blocked_keywords),
-            'neighborhoods_tracked': len(LA_NEIGHBORHOODS),
-            'total_neighborhood_variations': sum(len(neighs) for neighs in LA_NEIGHBORHOODS.values())
-        }
+        return {'threshold': self.threshold, **self.engine.get_stats()}
 
 # Convenience functions for direct use
-def filter_good_vibes(items: List[Dict], threshold: float = 0.3) -> List[Dict]:
+def filter_good_vibes(items: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
     """
     Convenience function to filter items for Good Vibes
     
@@ -281,10 +202,9 @@ def calculate_vibe_score(text: str) -> float:
     Returns:
         float: Vibe score (0-1)
     """
-    filter_instance = GoodVibesFilter()
-    return filter_instance.calculate_vibe_score(text)
+    return get_engine().score(text)
 
-def is_good_vibes(text: str, threshold: float = 0.3) -> bool:
+def is_good_vibes(text: str, threshold: float = DEFAULT_THRESHOLD) -> bool:
     """
     Convenience function to check if content is Good Vibes
     
@@ -295,8 +215,7 @@ def is_good_vibes(text: str, threshold: float = 0.3) -> bool:
     Returns:
         bool: True if content passes filter
     """
-    filter_instance = GoodVibesFilter(threshold)
-    return filter_instance.is_good_vibes(text)
+    return get_engine().score(text) >= threshold
 
 if __name__ == "__main__":
     # Test the filter
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Keyword Matcher
+Aho-Corasick automaton that finds every keyword of several lexicons in one pass over a text
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+class KeywordMatcher:
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        """
+        Initialize Keyword Matcher
+
+        Args:
+            lexicons: Group name -> keywords (matched case-insensitively as substrings)
+        """
+        self.groups = list(lexicons)
+        self.patterns: List[Tuple[str, str]] = []  # Pattern id -> (group, keyword)
+        for group, keywords in lexicons.items():
+            for keyword in dict.fromkeys(keyword.lower() for keyword in keywords):
+                if keyword:
+                    self.patterns.append((group, keyword))
+
+        self._build()
+
+    def _build(self):
+        """Build the trie, then turn it into a full transition table (a DFA)"""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+
+        for pattern_id, (_, keyword) in enumerate(self.patterns):
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            output[state].append(pattern_id)
+
+        # Breadth-first failure links; each state inherits its failure state's
+        # transitions and outputs, so scanning never has to follow a failure chain
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            output[state] = output[state] + output[fail[state]]
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0) if state else 0
+                queue.append(child)
+
+        self.delta = delta
+        self.output = [tuple(ids) for ids in output]
+
+    def scan_ids(self, text: str) -> Set[int]:
+        """
+        Ids of every pattern present in a text, in a single pass
+
+        Args:
+            text: Text to search (lowercased here)
+
+        Returns:
+            Set[int]: Indexes into self.patterns
+        """
+        delta, output = self.delta, self.output
+        hits = set()
+        state = 0
+        for char in text.lower():
+            state = delta[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Every keyword present in a text, in a single pass
+
+        Args:
+            text: Text to search (lowercased here)
+
+        Returns:
+            Dict: Group name -> set of keywords found
+        """
+        found = {group: set() for group in self.groups}
+        if not text:
+            return found
+
+        patterns = self.patterns
+        for pattern_id in self.scan_ids(text):
+            group, keyword = patterns[pattern_id]
+            found[group].add(keyword)
+        return found
+
+    def get_stats(self) -> Dict:
+        """Size of the compiled automaton"""
+        return {
+            'patterns': len(self.patterns),
+            'states': len(self.delta),
+            'transitions': sum(len(transitions) for transitions in self.delta)
+        }
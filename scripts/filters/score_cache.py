@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Vibe Score Cache
+Remembers the score and neighborhood of every text already scored, so syndicated articles that show up
+in several feeds and on consecutive days, and backfills over archived items, aren't scored again
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# The shared cache helpers live in scripts/, which isn't on the path when a filter runs as a script
+SCRIPTS_DIR = str(Path(__file__).parent.parent)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from http_fixtures import fixture_cache_dir
+from json_store import atomic_write
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+SCORE_CACHE_FILE = CACHE_DIR / "vibe_scores.json"
+
+MEMORY_ENTRIES = 16384  # Recently scored raw texts kept in process, skipping normalization and hashing
+MAX_AGE_DAYS = 60       # Entries unused this long are dropped on save (covers multi-week backfills)
+
+def text_key(version: str, normalized: str) -> str:
+    """Disk key of a normalized text under one lexicon version"""
+    digest = hashlib.blake2b(normalized.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    return f"{version}:{digest}"
+
+class ScoreCache:
+    def __init__(self, cache_file: Path = SCORE_CACHE_FILE, memory_entries: int = MEMORY_ENTRIES):
+        """
+        Initialize Score Cache
+
+        Args:
+            cache_file: JSON file the cache persists to
+            memory_entries: Size of the in-process LRU of raw texts
+        """
+        self.cache_file = Path(cache_file)
+        self.memory_entries = memory_entries
+        self.lock = threading.Lock()
+        self.memory: OrderedDict = OrderedDict()  # (version, raw text) -> (score, neighborhood)
+        self.entries = self._load()               # text_key() -> [score, neighborhood, last used date]
+        self.dirty = False
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def _load(self) -> Dict[str, List]:
+        """Load cached scores from disk"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f).get('scores', {})
+        except (OSError, ValueError):
+            print(f"⚠️  Could not read vibe score cache, starting fresh: {self.cache_file}")
+            return {}
+
+    def save(self):
+        """Persist cached scores, dropping entries unused for the maximum age (including old lexicon versions)"""
+        if not self.dirty:
+            return
+        cutoff = (datetime.now() - timedelta(days=MAX_AGE_DAYS)).date().isoformat()
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            self.entries = {key: entry for key, entry in self.entries.items() if entry[2] >= cutoff}
+            data = {'last_updated': datetime.now().isoformat(), 'scores': self.entries}
+            atomic_write(self.cache_file, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+            self.dirty = False
+
+    def _remember(self, key: Tuple[str, str], result: Tuple[float, str]):
+        """Add a result to the in-process LRU (caller holds the lock)"""
+        self.memory[key] = result
+        if len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def score_batch(self, engine, texts: List[str], threshold: float,
+                    vectorized: bool = None) -> Tuple[List[float], List[str], List[bool]]:
+        """
+        Scores of many texts, running the engine only on texts not cached for its lexicon version
+
+        Args:
+            engine: VibeEngine providing version, normalize() and uncached score_batch()
+            texts: Texts to analyze
+            threshold: Minimum score to pass
+            vectorized: Passed on to the engine for the texts that miss
+
+        Returns:
+            Tuple: (scores, neighborhoods, passes), as engine.score_batch() would give
+        """
+        version = engine.version
+        today = datetime.now().date().isoformat()
+        results: List[Tuple[float, str]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}  # Disk key -> positions of texts that normalize to it
+        missing_text: Dict[str, str] = {}
+
+        with self.lock:
+            for position, text in enumerate(texts):
+                if not text:
+                    results[position] = (0.0, "Los Angeles")
+                    continue
+                result = self.memory.get((version, text))
+                if result is not None:
+                    self.memory.move_to_end((version, text))
+                    self.stats['memory_hits'] += 1
+                    results[position] = result
+                    continue
+
+                key = text_key(version, engine.normalize(text))
+                entry = self.entries.get(key)
+                if entry is not None:
+                    self.stats['disk_hits'] += 1
+                    if entry[2] != today:
+                        entry[2] = today
+                        self.dirty = True
+                    results[position] = (entry[0], entry[1])
+                    self._remember((version, text), results[position])
+                elif key in missing:
+                    missing[key].append(position)  # Same article twice in one batch - score it once
+                else:
+                    self.stats['misses'] += 1
+                    missing[key] = [position]
+                    missing_text[key] = text
+
+        if missing:
+            keys = list(missing)
+            scores, neighborhoods, _ = engine.score_batch([missing_text[key] for key in keys], threshold,
+                                                          vectorized, cached=False)
+            with self.lock:
+                for key, score, neighborhood in zip(keys, scores, neighborhoods):
+                    self.entries[key] = [score, neighborhood, today]
+                    for position in missing[key]:
+                        results[position] = (score, neighborhood)
+                        self._remember((version, texts[position]), results[position])
+                self.dirty = True
+
+        scores = [score for score, _ in results]
+        return scores, [neighborhood for _, neighborhood in results], [score >= threshold for score in scores]
+
+    def get_stats(self) -> Dict:
+        """Hit counts and cache sizes"""
+        with self.lock:
+            lookups = sum(self.stats.values())
+            hits = self.stats['memory_hits'] + self.stats['disk_hits']
+            return {
+                **self.stats,
+                'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+                'memory_entries': len(self.memory),
+                'disk_entries': len(self.entries)
+            }
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Token Index
+Whole-word keyword matching: each text is tokenized once and its tokens looked up in a hash index
+of keywords and multi-word phrases, so 'art' no longer fires on 'party' or 'police' on 'policies'
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+WORD_RE = re.compile(r"\w+")
+
+# Endings treated as inflections of a keyword: plurals for every keyword, verb forms for longer ones
+PLURAL_ENDINGS = ('s', 'es')
+VERB_ENDINGS = ('ed', 'ing')
+VERB_MIN_LENGTH = 5
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of a text (runs of letters, digits and underscores)"""
+    return WORD_RE.findall(text.lower())
+
+def inflections(word: str) -> Set[str]:
+    """
+    A word plus its common English inflections
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Set[str]: e.g. 'party' -> party, partys, parties; 'celebrate' -> celebrates, celebrated, celebrating
+    """
+    forms = {word}
+    forms.update(word + ending for ending in PLURAL_ENDINGS)
+    if len(word) > 1 and word.endswith('y') and word[-2] not in 'aeiou':
+        forms.update((word[:-1] + 'ies', word[:-1] + 'ied'))
+    if len(word) >= VERB_MIN_LENGTH:
+        stem = word[:-1] if word.endswith('e') else word
+        forms.update(stem + ending for ending in VERB_ENDINGS)
+    return forms
+
+class TokenIndex:
+    def __init__(self, lexicons: Dict[str, Iterable[str]], inflect: Iterable[str] = (),
+                 not_inflections: Iterable[str] = ()):
+        """
+        Initialize Token Index
+
+        Args:
+            lexicons: Group name -> keywords or phrases (matched as whole lowercase words)
+            inflect: Groups whose keywords also match inflected forms of their last word
+            not_inflections: Words never treated as an inflection (e.g. 'news' is not a form of 'new')
+        """
+        self.groups = list(lexicons)
+        self.patterns: List[Tuple[str, str]] = []       # Pattern id -> (group, keyword)
+        self.variants: List[List[Tuple[str, ...]]] = []  # Pattern id -> token sequences that match it
+        self.words: Dict[str, List[int]] = {}            # Single token -> pattern ids
+        self.phrases: Dict[str, List[Tuple[str, int]]] = {}  # First token -> (' '-joined phrase, pattern id)
+
+        inflect = set(inflect)
+        not_inflections = set(not_inflections)
+        for group, keywords in lexicons.items():
+            seen = set()
+            for keyword in keywords:
+                tokens = tuple(tokenize(keyword))
+                if not tokens or tokens in seen:
+                    continue
+                seen.add(tokens)
+
+                variants = [tokens]
+                if group in inflect:
+                    forms = inflections(tokens[-1]) - not_inflections - {tokens[-1]}
+                    variants += [tokens[:-1] + (form,) for form in sorted(forms)]
+
+                pattern_id = len(self.patterns)
+                self.patterns.append((group, keyword.lower()))
+                self.variants.append(variants)
+                for variant in variants:
+                    if len(variant) == 1:
+                        self.words.setdefault(variant[0], []).append(pattern_id)
+                    else:
+                        self.phrases.setdefault(variant[0], []).append((' '.join(variant), pattern_id))
+
+        self.word_keys = frozenset(self.words)
+        self.phrase_keys = frozenset(self.phrases)
+
+    def scan_ids(self, text: str) -> Set[int]:
+        """
+        Ids of every keyword present in a text as whole words
+
+        Args:
+            text: Text to search (lowercased and tokenized here)
+
+        Returns:
+            Set[int]: Indexes into self.patterns
+        """
+        tokens = tokenize(text)
+        present = set(tokens)
+        hits = set()
+        for token in present & self.word_keys:
+            hits.update(self.words[token])
+
+        starts = present & self.phrase_keys
+        if starts:
+            joined = f" {' '.join(tokens)} "
+            for token in starts:
+                for phrase, pattern_id in self.phrases[token]:
+                    if f" {phrase} " in joined:
+                        hits.add(pattern_id)
+        return hits
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Every keyword present in a text as whole words
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Dict: Group name -> set of keywords found
+        """
+        found = {group: set() for group in self.groups}
+        patterns = self.patterns
+        for pattern_id in self.scan_ids(text):
+            group, keyword = patterns[pattern_id]
+            found[group].add(keyword)
+        return found
+
+    def get_stats(self) -> Dict:
+        """Size of the index"""
+        return {
+            'patterns': len(self.patterns),
+            'indexed_words': len(self.words),
+            'indexed_phrases': sum(len(phrases) for phrases in self.phrases.values())
+        }
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Vibe Engine
+The one Good Vibes lexicon and scorer shared by the content generator and the filters
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .keyword_matcher import KeywordMatcher
+    from .score_cache import ScoreCache
+    from .token_index import TokenIndex, tokenize
+except ImportError:
+    from keyword_matcher import KeywordMatcher
+    from score_cache import ScoreCache
+    from token_index import TokenIndex, tokenize
+
+# Vectorized batch scoring needs NumPy; without it batches are scored one text at a time
+try:
+    import numpy as np
+    try:
+        from .batch_scorer import BatchScorer
+    except ImportError:
+        from batch_scorer import BatchScorer
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Positive keywords that boost Good Vibes score
+GOOD_VIBES_KEYWORDS = [
+    # Openings & Launches
+    'opening', 'launch', 'debut', 'premiere', 'unveiling', 'grand opening',
+    'soft opening', 'ribbon cutting', 'new', 'introducing', 'announcing',
+
+    # Community & Celebration
+    'community', 'celebrate', 'celebration', 'festival', 'party', 'gathering',
+    'reunion', 'anniversary', 'milestone', 'achievement', 'success', 'winner',
+    'award', 'recognition', 'honor', 'tribute',
+
+    # Culture & Arts
+    'art', 'artist', 'exhibition', 'gallery', 'museum', 'performance',
+    'concert', 'music', 'theater', 'dance', 'creative', 'culture',
+    'mural', 'installation', 'sculpture', 'painting',
+
+    # Food & Dining
+    'restaurant', 'cafe', 'coffee', 'food', 'chef', 'menu', 'dining',
+    'brewery', 'bar', 'cocktail', 'wine', 'brunch', 'dinner', 'lunch',
+    'farmers market', 'food truck', 'bakery', 'dessert',
+
+    # Business & Innovation
+    'expansion', 'growth', 'innovation', 'collaboration', 'partnership',
+    'investment', 'funding', 'startup', 'entrepreneur', 'business',
+    'hiring', 'jobs', 'opportunity', 'development', 'discovery',
+
+    # Positive Activities
+    'free', 'family-friendly', 'outdoor', 'fun', 'exciting', 'amazing',
+    'beautiful', 'stunning', 'gorgeous', 'incredible', 'wonderful',
+    'fantastic', 'awesome', 'brilliant', 'inspiring', 'uplifting',
+
+    # Community Improvement
+    'renovation', 'restoration', 'improvement', 'upgrade', 'modernization',
+    'beautification', 'revitalization', 'transformation', 'enhancement',
+    'sustainability', 'green', 'eco-friendly', 'renewable'
+]
+
+# Negative keywords that reduce Good Vibes score or block content
+BLOCKED_KEYWORDS = [
+    # Crime & Violence
+    'murder', 'shooting', 'stabbing', 'robbery', 'theft', 'burglary',
+    'assault', 'attack', 'violence', 'crime', 'criminal', 'arrest',
+    'police', 'investigation', 'suspect', 'victim', 'death', 'killed',
+    'injured', 'hospital', 'emergency',
+
+    # Politics & Controversy
+    'political', 'politics', 'election', 'candidate', 'voting', 'ballot',
+    'republican', 'democrat', 'conservative', 'liberal', 'government',
+    'city council', 'mayor', 'congressman', 'senator', 'governor',
+    'protest', 'rally', 'demonstration', 'activist', 'activism',
+
+    # Legal & Financial Problems
+    'lawsuit', 'legal', 'court', 'judge', 'trial', 'settlement',
+    'bankruptcy', 'foreclosure', 'eviction', 'closure', 'closing',
+    'layoffs', 'fired', 'terminated', 'downsizing', 'cuts', 'losses',
+    'debt', 'financial trouble', 'scandal', 'fraud', 'corruption',
+
+    # Controversy & Conflict
+    'controversy', 'controversial', 'outrage', 'angry', 'anger',
+    'upset', 'furious', 'complaint', 'complain', 'criticism', 'critic',
+    'oppose', 'opposition', 'against', 'conflict', 'dispute', 'fight',
+    'argument', 'disagreement', 'tension', 'divided',
+
+    # Negative Business
+    'decline', 'decrease', 'drop', 'fall', 'plummet', 'crash',
+    'fail', 'failure', 'struggling', 'problem', 'issue', 'concern',
+    'worry', 'fear', 'threat', 'danger', 'risk', 'warning'
+]
+
+# Neighborhood name patterns for LA
+LA_NEIGHBORHOODS = {
+    'downtown': ['downtown', 'dtla', 'downtown la', 'downtown los angeles', 'arts district', 'little tokyo', 'chinatown'],
+    'westside': ['westside', 'santa monica', 'venice', 'brentwood', 'west la', 'west los angeles', 'mar vista', 'palms'],
+    'valley': ['valley', 'san fernando valley', 'studio city', 'sherman oaks', 'burbank', 'north hollywood', 'van nuys', 'encino'],
+    'eastside': ['eastside', 'silver lake', 'echo park', 'los feliz', 'highland park', 'eagle rock', 'mount washington'],
+    'south_bay': ['south bay', 'manhattan beach', 'hermosa beach', 'redondo beach', 'el segundo', 'torrance'],
+    'hollywood': ['hollywood', 'west hollywood', 'weho', 'hollywood hills', 'sunset strip', 'melrose'],
+    'mid_city': ['mid city', 'beverly hills', 'fairfax', 'miracle mile', 'mid-wilshire', 'koreatown', 'pico-robertson'],
+    'pasadena': ['pasadena', 'south pasadena', 'altadena', 'san marino', 'alhambra'],
+    'beaches': ['manhattan beach', 'hermosa beach', 'redondo beach', 'el segundo', 'playa del rey']
+}
+
+# Display names that str.title() would get wrong
+NEIGHBORHOOD_NAMES = {
+    'dtla': 'DTLA',
+    'downtown la': 'Downtown LA',
+    'west la': 'West LA',
+    'weho': 'WeHo',
+    'playa del rey': 'Playa del Rey'
+}
+
+# Words that look like an inflected keyword but mean something else
+NOT_INFLECTIONS = {'news'}
+
+# Threshold used when a caller doesn't pass one
+DEFAULT_THRESHOLD = 0.3
+
+# How keywords are matched: 'tokens' (whole words and phrases, with plurals and verb forms)
+# or 'substring' (anywhere in the text, so 'art' also fires on 'party')
+MATCH_MODES = ('tokens', 'substring')
+MATCH_MODE = 'tokens'
+
+# Smallest batch worth vectorizing, per match mode (see benchmark_vibe_scoring.py); token mode only
+# pulls ahead on backfill-sized batches, so daily per-category runs stay on the scalar path
+BATCH_MIN_ITEMS = {'tokens': 2000, 'substring': 200}
+BATCH_CHUNK = 2048  # Texts vectorized together, bounding the character grid's memory
+
+# Bump whenever score_text() changes how matches turn into a score, so cached scores are dropped
+SCORING_VERSION = 1
+
+class VibeEngine:
+    def __init__(self, good_keywords: Iterable[str], blocked_keywords: Iterable[str],
+                 neighborhoods: Dict[str, Iterable[str]], mode: str = MATCH_MODE):
+        """
+        Initialize Vibe Engine
+
+        Args:
+            good_keywords: Keywords that raise the score
+            blocked_keywords: Keywords that lower the score (weighted double)
+            neighborhoods: Area -> name variants, in lookup priority order
+            mode: One of MATCH_MODES
+        """
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode '{mode}', expected one of {MATCH_MODES}")
+        self.mode = mode
+        self.good_keywords = tuple(dict.fromkeys(keyword.lower() for keyword in good_keywords))
+        self.blocked_keywords = tuple(dict.fromkeys(keyword.lower() for keyword in blocked_keywords))
+        self.neighborhoods = {area: [name.lower() for name in names] for area, names in neighborhoods.items()}
+
+        # Neighborhood variants in lookup priority order (area order, then variant order)
+        self.neighborhood_order = list(dict.fromkeys(
+            name for names in self.neighborhoods.values() for name in names
+        ))
+        self.keyword_rank = {keyword: rank for rank, keyword in
+                             enumerate(self.good_keywords + self.blocked_keywords)}
+
+        lexicons = {
+            'good': self.good_keywords,
+            'blocked': self.blocked_keywords,
+            'neighborhood': self.neighborhood_order
+        }
+        if mode == 'tokens':
+            self.matcher = TokenIndex(lexicons, inflect=('good', 'blocked'), not_inflections=NOT_INFLECTIONS)
+        else:
+            self.matcher = KeywordMatcher(lexicons)
+        self.neighborhood_names = [NEIGHBORHOOD_NAMES.get(name, name.title())
+                                   for name in self.neighborhood_order] + ["Los Angeles"]
+
+        # Score weight and neighborhood rank of every matcher pattern id
+        group_weights = {'good': 1, 'blocked': -2, 'neighborhood': 0}
+        rank_of = {name: rank for rank, name in enumerate(self.neighborhood_order)}
+        self.no_rank = len(self.neighborhood_order)
+        self.pattern_weights = [group_weights[group] for group, _ in self.matcher.patterns]
+        self.pattern_ranks = [rank_of[keyword] if group == 'neighborhood' else self.no_rank
+                              for group, keyword in self.matcher.patterns]
+        self._batch_scorer = None
+
+        # Lexicon version: changes with anything that can change a score or neighborhood, so cached
+        # results from an older keyword list, match mode, threshold or formula are never reused
+        self.version = hashlib.sha256(json.dumps([
+            SCORING_VERSION, mode, DEFAULT_THRESHOLD,
+            self.matcher.patterns, getattr(self.matcher, 'variants', None),
+            self.pattern_weights, self.pattern_ranks, self.neighborhood_names
+        ]).encode('utf-8')).hexdigest()[:12]
+        self.cache: Optional[ScoreCache] = None  # Set by get_engine()
+
+    def scan(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Find every good keyword, blocked keyword and neighborhood in one pass over a text
+
+        Args:
+            text: Content to analyze
+
+        Returns:
+            Dict: 'good', 'blocked' and 'neighborhood' -> keywords found
+        """
+        return self.matcher.scan(text)
+
+    def score_matches(self, matches: Dict[str, Set[str]]) -> float:
+        """
+        Vibe score from a scan result
+
+        Args:
+            matches: Output of scan()
+
+        Returns:
+            float: Vibe score between 0 (bad vibes) and 1 (good vibes)
+        """
+        # Negative keywords have twice the impact of positive ones
+        net_score = len(matches['good']) - 2 * len(matches['blocked'])
+
+        # Baseline of 5 keeps neutral content from scoring 0
+        return float(max(0, min(1, (net_score + 5) / 10)))
+
+    def neighborhood_from_matches(self, matches: Dict[str, Set[str]]) -> str:
+        """
+        Neighborhood from a scan result
+
+        Args:
+            matches: Output of scan()
+
+        Returns:
+            str: Neighborhood name or "Los Angeles" as fallback
+        """
+        found = matches['neighborhood']
+        if found:
+            # First mention in priority order, properly capitalized
+            for rank, name in enumerate(self.neighborhood_order):
+                if name in found:
+                    return self.neighborhood_names[rank]
+
+        return "Los Angeles"
+
+    def score(self, text: str) -> float:
+        """Vibe score of a text (0 for empty text)"""
+        return self.score_text(text)[0]
+
+    def neighborhood(self, text: str) -> str:
+        """Neighborhood mentioned in a text"""
+        return self.score_text(text)[1]
+
+    def normalize(self, text: str) -> str:
+        """
+        Canonical form of a text for caching: texts with the same form always score the same
+
+        Args:
+            text: Non-empty content
+
+        Returns:
+            str: Lowercased text, with runs of whitespace collapsed in 'tokens' mode (cheaper than tokenizing,
+                 and whitespace never changes a token)
+        """
+        return ' '.join(text.lower().split()) if self.mode == 'tokens' else text.lower()
+
+    def score_text(self, text: str) -> Tuple[float, str]:
+        """
+        Vibe score and neighborhood of a text from a single scan
+
+        Args:
+            text: Content to analyze
+
+        Returns:
+            Tuple: (vibe score, neighborhood), as score() and neighborhood() would give
+        """
+        if not text:
+            return 0.0, "Los Angeles"
+
+        pattern_ids = self.matcher.scan_ids(text)
+        weights, ranks = self.pattern_weights, self.pattern_ranks
+        net_score = sum(weights[pattern_id] for pattern_id in pattern_ids)
+        rank = min((ranks[pattern_id] for pattern_id in pattern_ids), default=self.no_rank)
+        return float(max(0, min(1, (net_score + 5) / 10))), self.neighborhood_names[rank]
+
+    def score_batch(self, texts: List[str], threshold: float = DEFAULT_THRESHOLD,
+                    vectorized: bool = None, cached: bool = True) -> Tuple[List[float], List[str], List[bool]]:
+        """
+        Vibe scores, neighborhoods and threshold results for many texts at once
+
+        Args:
+            texts: Texts to analyze
+            threshold: Minimum score to pass
+            vectorized: Use (True) or skip (False) the NumPy path; by default it is used for
+                        batches of at least BATCH_MIN_ITEMS for the match mode. Needs NumPy either way.
+            cached: Reuse and record results in the engine's score cache, when it has one
+
+        Returns:
+            Tuple: (scores, neighborhoods, passes), each in the order of texts and equal to score_text()
+        """
+        if cached and self.cache is not None:
+            return self.cache.score_batch(self, texts, threshold, vectorized)
+
+        if vectorized is None:
+            vectorized = len(texts) >= BATCH_MIN_ITEMS[self.mode]
+        scorer = self.batch_scorer() if vectorized else None
+
+        if scorer is None:
+            results = [self.score_text(text) for text in texts]
+            scores = [score for score, _ in results]
+            return scores, [neighborhood for _, neighborhood in results], [score >= threshold for score in scores]
+
+        scores, ranks = [], []
+        for start in range(0, len(texts), BATCH_CHUNK):
+            chunk = texts[start:start + BATCH_CHUNK]
+            net, best = scorer.reduce([f" {' '.join(tokenize(text))} " for text in chunk]
+                                      if self.mode == 'tokens' else chunk)
+            chunk_scores = np.clip((net + 5) / 10, 0, 1)
+            chunk_scores[np.fromiter((not text for text in chunk), dtype=bool, count=len(chunk))] = 0.0
+            scores.append(chunk_scores)
+            ranks.append(best)
+
+        scores = np.concatenate(scores) if scores else np.zeros(0)
+        ranks = np.concatenate(ranks) if ranks else np.zeros(0, dtype=np.intp)
+        names = self.neighborhood_names
+        return scores.tolist(), [names[rank] for rank in ranks.tolist()], (scores >= threshold).tolist()
+
+    def batch_scorer(self) -> Optional['BatchScorer']:
+        """Vectorized scorer over this engine's automaton, built on first use (None without NumPy)"""
+        if self._batch_scorer is None and NUMPY_AVAILABLE:
+            if self.mode == 'tokens':
+                # Whole-word matching as substring matching: texts become space-padded token strings,
+                # and each keyword's token sequences are padded the same way
+                automaton = KeywordMatcher({
+                    pattern_id: [f" {' '.join(variant)} " for variant in variants]
+                    for pattern_id, variants in enumerate(self.matcher.variants)
+                })
+                columns = [pattern_id for pattern_id, _ in automaton.patterns]
+            else:
+                automaton, columns = self.matcher, None
+
+            try:
+                self._batch_scorer = BatchScorer(
+                    automaton,
+                    weights=self.pattern_weights,
+                    ranks=self.pattern_ranks,
+                    no_rank=self.no_rank,
+                    columns=columns
+                )
+            except ValueError as e:
+                print(f"⚠️  Batch scoring unavailable for this lexicon: {e}")
+                self._batch_scorer = False
+        return self._batch_scorer or None
+
+    def ordered(self, keywords: Set[str]) -> List[str]:
+        """Keywords in lexicon order"""
+        return sorted(keywords, key=self.keyword_rank.__getitem__)
+
+    def get_stats(self) -> Dict:
+        """Lexicon and automaton sizes"""
+        return {
+            'good_keywords_count': len(self.good_keywords),
+            'blocked_keywords_count': len(self.blocked_keywords),
+            'neighborhoods_tracked': len(self.neighborhoods),
+            'total_neighborhood_variations': sum(len(names) for names in self.neighborhoods.values()),
+            **self.matcher.get_stats()
+        }
+
+@lru_cache(maxsize=None)
+def compile_engine(good_keywords: Tuple[str, ...], blocked_keywords: Tuple[str, ...],
+                   neighborhoods: Tuple[Tuple[str, Tuple[str, ...]], ...], mode: str = MATCH_MODE) -> VibeEngine:
+    """One compiled engine per lexicon and match mode, shared by everything that scores with it"""
+    return VibeEngine(good_keywords, blocked_keywords, dict(neighborhoods), mode)
+
+_engines: Dict[str, VibeEngine] = {}
+_score_cache: Optional[ScoreCache] = None
+
+def get_score_cache() -> ScoreCache:
+    """Score cache shared by every engine from get_engine(), loaded from disk on first use"""
+    global _score_cache
+    if _score_cache is None:
+        _score_cache = ScoreCache()
+    return _score_cache
+
+def get_engine(mode: str = None) -> VibeEngine:
+    """
+    Engine for the configured lexicon
+
+    Args:
+        mode: One of MATCH_MODES (defaults to MATCH_MODE)
+
+    Returns:
+        VibeEngine: Compiled on first use, then shared for the rest of the process, with batch
+                    scores cached across runs
+    """
+    mode = mode or MATCH_MODE
+    if mode not in _engines:
+        _engines[mode] = compile_engine(
+            tuple(GOOD_VIBES_KEYWORDS),
+            tuple(BLOCKED_KEYWORDS),
+            tuple((area, tuple(names)) for area, names in LA_NEIGHBORHOODS.items()),
+            mode
+        )
+        _engines[mode].cache = get_score_cache()
+    return _engines[mode]
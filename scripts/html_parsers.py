@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+CurationsLA HTML Parser Backends
+Picks the fastest BeautifulSoup tree builder installed, falling back to html.parser
+"""
+
+import os
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+# Configuration
+PARSER_ENV = 'CURATIONSLA_HTML_PARSER'  # Force a backend, e.g. 'html.parser'
+
+# Fastest first; lxml is C-accelerated, html.parser ships with Python
+PREFERRED_BACKENDS = ['lxml', 'html.parser']
+FALLBACK_BACKEND = 'html.parser'
+
+def is_available(backend: str) -> bool:
+    """Whether BeautifulSoup has a tree builder installed for a backend"""
+    return builder_registry.lookup(backend) is not None
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first"""
+    return [backend for backend in PREFERRED_BACKENDS if is_available(backend)]
+
+def select_backend(preferred: Optional[str] = None) -> str:
+    """
+    Choose the parser backend for scraping
+
+    Args:
+        preferred: Backend to use if installed; defaults to CURATIONSLA_HTML_PARSER,
+                   then the fastest installed backend
+
+    Returns:
+        str: BeautifulSoup feature name to parse with
+    """
+    preferred = preferred or os.environ.get(PARSER_ENV)
+    if preferred:
+        if is_available(preferred):
+            return preferred
+        print(f"⚠️  HTML parser '{preferred}' not installed, using the fastest available")
+
+    backends = available_backends()
+    return backends[0] if backends else FALLBACK_BACKEND
+
+class _EnoughSubtrees(Exception):
+    """Raised from inside the tree builder to stop parsing early"""
+
+class PartialSoup(BeautifulSoup):
+    """
+    BeautifulSoup that keeps only strainer-matched subtrees and stops parsing
+    once max_subtrees of them have been closed
+    """
+
+    def __init__(self, markup, features: str, parse_only: SoupStrainer, max_subtrees: int = None, **kwargs):
+        self.max_subtrees = max_subtrees
+        super().__init__(markup, features, parse_only=parse_only, **kwargs)
+
+    def handle_endtag(self, name, nsprefix=None):
+        super().handle_endtag(name, nsprefix)
+        # Back at the root means a matched subtree just closed
+        if self.max_subtrees and len(self.tagStack) == 1 and len(self.contents) >= self.max_subtrees:
+            raise _EnoughSubtrees()
+
+    def _feed(self):
+        try:
+            super()._feed()
+        except _EnoughSubtrees:
+            self.endData()
+            while self.currentTag.name != self.ROOT_TAG_NAME:
+                self.popTag()
+
+def make_soup(markup, backend: Optional[str] = None, parse_only: Optional[SoupStrainer] = None,
+              max_subtrees: Optional[int] = None, **kwargs) -> BeautifulSoup:
+    """
+    Parse markup with the given (or best available) backend
+
+    Args:
+        markup: HTML bytes or text
+        backend: Parser backend; defaults to select_backend()
+        parse_only: Build only the subtrees this strainer matches
+        max_subtrees: With parse_only, stop parsing after this many matched subtrees
+
+    Returns:
+        BeautifulSoup: The full document, or just the matched subtrees
+    """
+    backend = backend or select_backend()
+    if parse_only is None:
+        return BeautifulSoup(markup, backend, **kwargs)
+    return PartialSoup(markup, backend, parse_only, max_subtrees, **kwargs)
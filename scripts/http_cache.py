@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+CurationsLA HTTP Cache
+On-disk conditional-GET cache (ETag / Last-Modified) for RSS feed downloads
+"""
+
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from http_fixtures import fixture_cache_dir
+from json_store import atomic_write, write_json
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+
+class HTTPCache:
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR):
+        """
+        Initialize HTTP Cache
+
+        Args:
+            cache_dir: Directory holding one metadata/body file pair per URL
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        """Stable filename key for a URL"""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.json"
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}.body"
+
+    def load(self, url: str) -> Optional[Dict]:
+        """Load cached metadata for a URL, or None if not cached"""
+        meta_path = self._meta_path(url)
+        if not meta_path.exists() or not self._body_path(url).exists():
+            return None
+
+        try:
+            with open(meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get_body(self, url: str) -> Optional[bytes]:
+        """Load the cached response body for a URL"""
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from the cached entry"""
+        meta = self.load(url)
+        if not meta:
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]):
+        """Store a fresh 200 response body with its validators"""
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': datetime.now().isoformat(),
+            'validated_at': datetime.now().isoformat(),
+            'size': len(body),
+            'items': None
+        }
+        atomic_write(self._body_path(url), body)
+        write_json(self._meta_path(url), meta)
+
+    def mark_validated(self, url: str):
+        """Record that the server confirmed the cached copy is current (HTTP 304)"""
+        meta = self.load(url)
+        if meta:
+            meta['validated_at'] = datetime.now().isoformat()
+            write_json(self._meta_path(url), meta)
+
+    def get_items(self, url: str) -> Optional[List[Dict]]:
+        """Load previously parsed items for the cached body, if stored"""
+        meta = self.load(url)
+        return meta.get('items') if meta else None
+
+    def store_items(self, url: str, items: List[Dict]):
+        """Store parsed items so an unchanged body never needs re-parsing"""
+        meta = self.load(url)
+        if meta:
+            meta['items'] = items
+            write_json(self._meta_path(url), meta)
+
+    def get_cache_stats(self) -> Dict:
+        """Get statistics about the cache contents"""
+        meta_files = list(self.cache_dir.glob("*.json"))
+        body_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*.body"))
+        return {
+            'cached_urls': len(meta_files),
+            'total_body_bytes': body_bytes,
+            'cache_dir': str(self.cache_dir)
+        }
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+CurationsLA HTTP Client
+Shared keep-alive connection pools, modern compression and a DNS cache for every outbound fetch
+"""
+
+import socket
+import threading
+import time
+import requests
+from collections import defaultdict
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util import make_headers
+
+from http_fixtures import configure_session
+
+# Configuration
+POOL_HOSTS = 64              # Hosts whose connections are kept alive at once
+POOL_PER_HOST = 4            # Idle keep-alive connections kept per host
+DNS_TTL_SECONDS = 300
+
+# gzip/deflate always; br and zstd whenever brotli / zstandard are installed
+ACCEPT_ENCODING = ', '.join(make_headers(accept_encoding=True)['accept-encoding'].split(','))
+
+class DNSCache:
+    def __init__(self, ttl: float = DNS_TTL_SECONDS, resolver=None):
+        """
+        Initialize DNS Cache
+
+        Args:
+            ttl: Seconds a successful lookup is reused
+            resolver: getaddrinfo-compatible function (defaults to the system resolver)
+        """
+        self.ttl = ttl
+        self.resolver = resolver or socket.getaddrinfo
+        self.entries: Dict[tuple, tuple] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        """socket.getaddrinfo with successful results cached for the TTL"""
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+
+        result = self.resolver(host, port, family, type, proto, flags)
+        with self.lock:
+            self.entries[key] = (now + self.ttl, tuple(result))
+        return result
+
+_dns_cache = None
+_dns_lock = threading.Lock()
+
+def get_shared_dns_cache() -> DNSCache:
+    """Process-wide DNS cache for the pooled transports"""
+    global _dns_cache
+    with _dns_lock:
+        if _dns_cache is None:
+            _dns_cache = DNSCache()
+        return _dns_cache
+
+class PooledAdapter(HTTPAdapter):
+    """Keep-alive transport that counts connections and bytes per host and caches its DNS lookups"""
+
+    def __init__(self, pool_hosts: int = POOL_HOSTS, per_host: int = POOL_PER_HOST, dns_cache: DNSCache = None):
+        self.lock = threading.Lock()
+        self.stats = defaultdict(lambda: {'connections': 0, 'requests': 0, 'bytes_received': 0, 'bytes_decoded': 0})
+        # Only this adapter's connections resolve through the cache; the rest of the process is untouched
+        self.dns_cache = dns_cache or get_shared_dns_cache()
+        super().__init__(pool_connections=pool_hosts, pool_maxsize=per_host)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        adapter = self
+
+        def cached_dns(connection_class):
+            class CachedDNSConnection(connection_class):
+                def _new_conn(self):
+                    host = self._dns_host
+                    try:
+                        addresses = adapter.dns_cache.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+                    except OSError:
+                        return super()._new_conn()  # Let urllib3 raise its usual resolution error
+
+                    # Connect to the cached addresses; TLS still verifies and sends SNI for self.host
+                    for index, (_, _, _, _, sockaddr) in enumerate(addresses):
+                        self._dns_host = sockaddr[0]
+                        try:
+                            return super()._new_conn()
+                        except ConnectTimeoutError:  # Also covers NewConnectionError
+                            if index == len(addresses) - 1:
+                                raise
+                        finally:
+                            self._dns_host = host
+            return CachedDNSConnection
+
+        def counting(pool_class):
+            class CountingPool(pool_class):
+                ConnectionCls = cached_dns(pool_class.ConnectionCls)
+
+                def _new_conn(self):
+                    adapter._count(self.host, connections=1)
+                    return super()._new_conn()
+            return CountingPool
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': counting(HTTPConnectionPool),
+            'https': counting(HTTPSConnectionPool)
+        }
+
+    def _count(self, host: str, **counts):
+        with self.lock:
+            record = self.stats[host.lower()]
+            for key, value in counts.items():
+                record[key] += value
+
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=stream, **kwargs)
+        host = urlparse(request.url).hostname or ''
+        if stream:
+            self._count(host, requests=1)
+        else:
+            content = response.content  # Read now so the wire byte count is final
+            self._count(host, requests=1, bytes_received=response.raw.tell() or len(content),
+                        bytes_decoded=len(content))
+        return response
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-host connection, request and byte counters"""
+        with self.lock:
+            return {host: dict(record) for host, record in self.stats.items()}
+
+    def get_totals(self) -> Dict[str, int]:
+        """Counters summed over every host"""
+        totals = {'hosts': 0, 'connections': 0, 'requests': 0, 'bytes_received': 0, 'bytes_decoded': 0}
+        for record in self.get_stats().values():
+            totals['hosts'] += 1
+            for key, value in record.items():
+                totals[key] += value
+        return totals
+
+_shared_adapter = None
+_adapter_lock = threading.Lock()
+
+def get_shared_adapter() -> PooledAdapter:
+    """Process-wide transport so feeds, scrapes and enrichment reuse each other's connections"""
+    global _shared_adapter
+    with _adapter_lock:
+        if _shared_adapter is None:
+            _shared_adapter = PooledAdapter()
+        return _shared_adapter
+
+def create_session(user_agent: str, headers: Optional[Dict[str, str]] = None,
+                   adapter: PooledAdapter = None) -> requests.Session:
+    """
+    Session on the shared connection pools, advertising every supported compression
+
+    Args:
+        user_agent: User-Agent header for the session
+        headers: Extra default headers
+        adapter: Transport to mount (defaults to the shared one)
+
+    Returns:
+        requests.Session: Ready to use, with record/replay fixtures attached when enabled
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': user_agent, 'Accept-Encoding': ACCEPT_ENCODING})
+    session.headers.update(headers or {})
+
+    adapter = adapter or get_shared_adapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return configure_session(session)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+CurationsLA HTTP Fixtures
+Record every feed/scrape response to a compressed archive and replay it offline
+
+Set CURATIONSLA_HTTP_MODE=record to capture live responses, or
+CURATIONSLA_HTTP_MODE=replay to serve ContentGenerator and WebScraper from the
+archive without touching the network.
+
+Both modes run against a fresh, temporary cache directory (see fixture_cache_dir),
+so they never read or write the live caches and replays don't depend on leftover state.
+"""
+
+import atexit
+import base64
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import requests
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+FIXTURES_DIR = BASE_DIR / "fixtures"
+DEFAULT_ARCHIVE = FIXTURES_DIR / "http_fixtures.json.gz"
+
+MODE_ENV = 'CURATIONSLA_HTTP_MODE'                 # live | record | replay
+ARCHIVE_ENV = 'CURATIONSLA_FIXTURE_ARCHIVE'        # Path to the archive
+LATENCY_ENV = 'CURATIONSLA_REPLAY_LATENCY'         # 'recorded' or fixed seconds
+LATENCY_SCALE_ENV = 'CURATIONSLA_REPLAY_LATENCY_SCALE'
+
+# Headers that describe the wire encoding, which no longer applies to decoded bodies
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+def _fixture_key(method: str, url: str) -> str:
+    return f"{method.upper()} {url}"
+
+class FixtureArchive:
+    def __init__(self, path: Path = DEFAULT_ARCHIVE, mode: str = 'replay',
+                 latency: str = 'recorded', latency_scale: float = 1.0):
+        """
+        Initialize Fixture Archive
+
+        Args:
+            path: Gzip-compressed JSON archive of recorded responses
+            mode: 'record' to capture live responses, 'replay' to serve them
+            latency: 'recorded' replays each response's original elapsed time,
+                     a number of seconds applies a fixed delay to every response
+            latency_scale: Multiplier applied to recorded latencies
+        """
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.lock = threading.Lock()
+        self.responses: Dict[str, Dict] = {}
+        self.unsaved = False
+        self.misses = 0
+
+        if mode == 'replay':
+            self.load()
+        elif mode == 'record':
+            atexit.register(self.save)
+
+    def load(self):
+        """Load recorded responses from the archive"""
+        if not self.path.exists():
+            print(f"⚠️  Fixture archive not found: {self.path}")
+            return
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            self.responses = json.load(f).get('responses', {})
+        print(f"📼 Loaded {len(self.responses)} recorded responses from {self.path}")
+
+    def save(self):
+        """Write recorded responses to the archive"""
+        if self.mode != 'record' or not self.unsaved:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            data = {
+                'version': 1,
+                'recorded_at': datetime.now().isoformat(),
+                'responses': self.responses
+            }
+            with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+                json.dump(data, f)
+            self.unsaved = False
+        print(f"📼 Saved {len(self.responses)} recorded responses to {self.path}")
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response):
+        """Capture a live response"""
+        headers = {key: value for key, value in response.headers.items()
+                   if key.lower() not in DROPPED_HEADERS}
+        with self.lock:
+            self.responses[_fixture_key(request.method, request.url)] = {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': headers,
+                'body': base64.b64encode(response.content).decode('ascii'),
+                'elapsed': response.elapsed.total_seconds()
+            }
+            self.unsaved = True
+
+    def lookup(self, method: str, url: str) -> Optional[Dict]:
+        """Find the recorded response for a request"""
+        fixture = self.responses.get(_fixture_key(method, url))
+        if fixture is None:
+            with self.lock:
+                self.misses += 1
+        return fixture
+
+    def replay_delay(self, fixture: Dict) -> float:
+        """Latency to simulate for a recorded response"""
+        if self.latency == 'recorded':
+            return fixture.get('elapsed', 0) * self.latency_scale
+        return float(self.latency) * self.latency_scale
+
+    def attach(self, session: requests.Session):
+        """Mount the record or replay transport on a session"""
+        adapter = RecordingAdapter(self) if self.mode == 'record' else ReplayAdapter(self)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+class RecordingAdapter(HTTPAdapter):
+    """Live transport that copies every response into the archive"""
+
+    def __init__(self, archive: FixtureArchive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        # Always record full bodies, so replay never depends on a warm HTTP cache
+        for header in CONDITIONAL_HEADERS:
+            request.headers.pop(header, None)
+        response = super().send(request, **kwargs)
+        response.content  # Read the body before recording it
+        self.archive.record(request, response)
+        return response
+
+class ReplayAdapter(BaseAdapter):
+    """Offline transport that serves responses from the archive"""
+
+    def __init__(self, archive: FixtureArchive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        fixture = self.archive.lookup(request.method, request.url)
+        if fixture is None:
+            raise requests.exceptions.ConnectionError(f"No recorded fixture for {request.method} {request.url}",
+                                                      request=request)
+
+        delay = self.archive.replay_delay(fixture)
+        if timeout is not None and not isinstance(timeout, tuple) and delay > timeout:
+            time.sleep(timeout)
+            raise requests.exceptions.ReadTimeout(f"Replayed latency exceeds timeout for {request.url}",
+                                                  request=request)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = fixture['status']
+        response.reason = fixture.get('reason', '')
+        response.headers = CaseInsensitiveDict(fixture.get('headers', {}))
+        response._content = base64.b64decode(fixture['body'])
+        response._content_consumed = True  # Body is already in memory, even for stream=True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+_archive = None
+_archive_lock = threading.Lock()
+_cache_dir = None
+
+def fixture_mode() -> Optional[str]:
+    """'record' or 'replay' when CURATIONSLA_HTTP_MODE selects a fixture mode, else None"""
+    mode = os.environ.get(MODE_ENV, 'live').lower()
+    return mode if mode in ('record', 'replay') else None
+
+def fixture_cache_dir() -> Optional[Path]:
+    """
+    Cache directory for a record or replay run
+
+    Modules that persist state under cache/ (feed health, discovered feeds, items,
+    scrape/robots/article/HTTP/vibe score caches) use this instead when it is set. Recording then
+    downloads everything rather than skipping pages cached by a live run, and a replay
+    neither sees nor leaves behind state from other runs.
+
+    Returns:
+        Optional[Path]: Temporary directory removed at exit, or None on live runs
+    """
+    global _cache_dir
+    if not fixture_mode():
+        return None
+    with _archive_lock:
+        if _cache_dir is None:
+            _cache_dir = Path(tempfile.mkdtemp(prefix='curationsla-fixture-cache-'))
+            atexit.register(shutil.rmtree, _cache_dir, True)
+        return _cache_dir
+
+def get_fixture_archive() -> Optional[FixtureArchive]:
+    """Process-wide archive for the mode selected by CURATIONSLA_HTTP_MODE"""
+    global _archive
+    mode = fixture_mode()
+    if not mode:
+        return None
+
+    with _archive_lock:
+        if _archive is None:
+            _archive = FixtureArchive(
+                path=Path(os.environ.get(ARCHIVE_ENV, DEFAULT_ARCHIVE)),
+                mode=mode,
+                latency=os.environ.get(LATENCY_ENV, 'recorded'),
+                latency_scale=float(os.environ.get(LATENCY_SCALE_ENV, '1.0'))
+            )
+        return _archive
+
+def configure_session(session: requests.Session) -> requests.Session:
+    """Attach record/replay fixtures to a session when fixture mode is enabled"""
+    archive = get_fixture_archive()
+    if archive:
+        archive.attach(session)
+    return session
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Item Store
+Persistent SQLite store of ingested feed entries for incremental runs
+"""
+
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from http_fixtures import fixture_cache_dir
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+ITEM_STORE_FILE = CACHE_DIR / "items.sqlite"
+
+# Query parameters that never change which article a link points to
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'cmpid'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    link TEXT PRIMARY KEY,
+    title TEXT,
+    source TEXT,
+    category TEXT,
+    published TEXT,
+    cleaned_text TEXT,
+    vibe_score REAL,
+    neighborhood TEXT,
+    score_version TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_first_seen ON items (first_seen);
+CREATE INDEX IF NOT EXISTS idx_items_category ON items (category);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    new_items INTEGER DEFAULT 0
+);
+"""
+
+def canonicalize_link(link: str) -> str:
+    """Normalize a link so the same article always maps to the same key"""
+    parsed = urlparse(link.strip())
+    query = [(key, value) for key, value in parse_qsl(parsed.query)
+             if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS]
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, '', urlencode(query), ''))
+
+def clean_text(item: Dict) -> str:
+    """Title plus description with HTML tags and extra whitespace removed"""
+    text = f"{item.get('title', '')} {item.get('description', '')}"
+    text = re.sub(r'<[^>]+>', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+class ItemStore:
+    def __init__(self, db_path: Path = ITEM_STORE_FILE):
+        """
+        Initialize Item Store
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.run_id = None
+
+    def _migrate(self):
+        """Add columns introduced after a store was created"""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(items)")}
+        if 'score_version' not in columns:
+            # Rows from before versioning match no lexicon, so they are scored once more
+            self.conn.execute("ALTER TABLE items ADD COLUMN score_version TEXT")
+            self.conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def start_run(self) -> int:
+        """Record the start of a generator run"""
+        cursor = self.conn.execute("INSERT INTO runs (started_at) VALUES (?)", (datetime.now().isoformat(),))
+        self.conn.commit()
+        self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def finish_run(self):
+        """Record the end of the current run and how many new items it stored"""
+        if self.run_id is None:
+            return
+        started_at = self.conn.execute("SELECT started_at FROM runs WHERE id = ?", (self.run_id,)).fetchone()[0]
+        new_items = self.conn.execute("SELECT COUNT(*) FROM items WHERE first_seen >= ?", (started_at,)).fetchone()[0]
+        self.conn.execute("UPDATE runs SET finished_at = ?, new_items = ? WHERE id = ?",
+                          (datetime.now().isoformat(), new_items, self.run_id))
+        self.conn.commit()
+        self.run_id = None
+
+    def get_last_run_time(self) -> Optional[str]:
+        """Start time of the most recent completed run"""
+        row = self.conn.execute(
+            "SELECT started_at FROM runs WHERE finished_at IS NOT NULL ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def partition(self, items: List[Dict], score_version: str = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split items into ones that need processing and ones already stored
+
+        Known items come back with their stored vibe_score and neighborhood so
+        they don't need to be processed again. Items stored under a different
+        score version (the vibe engine's lexicon version) count as new, so they
+        are scored again. Repeats of an article within the batch are dropped.
+
+        Args:
+            items: Items fetched this run
+            score_version: Version the stored scores must have been computed with
+
+        Returns:
+            Tuple: (new_items, known_items)
+        """
+        keyed = [(canonicalize_link(item['link']) if item.get('link') else None, item) for item in items]
+        links = list({key for key, _ in keyed if key})
+
+        stored = {}
+        for start in range(0, len(links), 500):  # Stay under SQLite's variable limit
+            chunk = links[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for row in self.conn.execute(f"SELECT * FROM items WHERE link IN ({placeholders})", chunk):
+                stored[row['link']] = row
+
+        new_items, known_items = [], []
+        seen = set()
+        for key, item in keyed:
+            if key in seen:
+                continue  # Same article twice in one batch - process it once
+            if key:
+                seen.add(key)
+            row = stored.get(key)
+            if row is not None and row['vibe_score'] is not None and row['score_version'] == score_version:
+                known_items.append(dict(item, vibe_score=row['vibe_score'], neighborhood=row['neighborhood']))
+            else:
+                new_items.append(item)
+
+        if stored:
+            now = datetime.now().isoformat()
+            self.conn.executemany("UPDATE items SET last_seen = ? WHERE link = ?",
+                                  [(now, link) for link in stored])
+            self.conn.commit()
+
+        return new_items, known_items
+
+    def record_items(self, items: List[Dict], category: str, score_version: str = None):
+        """Insert or refresh items with the score version they were scored under, keeping first_seen"""
+        now = datetime.now().isoformat()
+        rows = []
+        for item in items:
+            if not item.get('link'):
+                continue
+            rows.append((
+                canonicalize_link(item['link']),
+                item.get('title', ''),
+                item.get('source', ''),
+                category,
+                item.get('published', ''),
+                clean_text(item),
+                item.get('vibe_score'),
+                item.get('neighborhood'),
+                score_version,
+                now,
+                now
+            ))
+
+        self.conn.executemany("""
+            INSERT INTO items (link, title, source, category, published, cleaned_text,
+                               vibe_score, neighborhood, score_version, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(link) DO UPDATE SET
+                title = excluded.title,
+                cleaned_text = excluded.cleaned_text,
+                vibe_score = excluded.vibe_score,
+                neighborhood = excluded.neighborhood,
+                score_version = excluded.score_version,
+                last_seen = excluded.last_seen
+        """, rows)
+        self.conn.commit()
+
+    def items_since(self, timestamp: str, category: str = None) -> List[Dict]:
+        """Items first seen at or after a timestamp, optionally for one category"""
+        query = "SELECT * FROM items WHERE first_seen >= ?"
+        params = [timestamp]
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        return [dict(row) for row in self.conn.execute(query + " ORDER BY first_seen", params)]
+
+    def get_stats(self) -> Dict:
+        """Get statistics about the store"""
+        total = self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        by_category = {
+            row[0]: row[1]
+            for row in self.conn.execute("SELECT category, COUNT(*) FROM items GROUP BY category")
+        }
+        return {
+            'total_items': total,
+            'items_by_category': by_category,
+            'last_run': self.get_last_run_time(),
+            'db_path': str(self.db_path)
+        }
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+CurationsLA JSON Store
+Loading and atomic saving of the JSON files the caches and registries under cache/ persist to
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+def atomic_write(path: Path, data: bytes):
+    """Write a file via a temp file so concurrent readers never see partial data"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def write_json(path: Path, data: Any):
+    """Atomically write a JSON document"""
+    atomic_write(path, json.dumps(data, indent=2).encode('utf-8'))
+
+def load_section(path: Path, key: str, label: str) -> Dict:
+    """
+    One top-level section of a JSON store
+
+    Args:
+        path: JSON file written by save_section()
+        key: Section to read
+        label: What the file holds, for the warning when it can't be read
+
+    Returns:
+        Dict: The section, or {} when the file is missing or unreadable
+    """
+    if not path.exists():
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get(key, {})
+    except (OSError, ValueError):
+        print(f"⚠️  Could not read {label}, starting fresh: {path}")
+        return {}
+
+def save_section(path: Path, key: str, entries: Dict):
+    """Atomically write a JSON store holding one section and when it was last updated"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, {'last_updated': datetime.now().isoformat(), key: entries})
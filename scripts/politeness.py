@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Politeness Scheduler
+Per-host token buckets (with robots.txt Crawl-delay) shared by feeds and scrapers
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+from robots_cache import RobotsCache, get_shared_robots
+
+# Configuration
+REQUESTS_PER_SECOND = 1.0  # Sustained request rate per host
+BURST_SIZE = 2             # Requests a host may receive back-to-back
+MAX_CRAWL_DELAY = 10.0     # Cap on robots.txt Crawl-delay so one site can't stall a run
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize Token Bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class HostRateLimiter:
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, burst: float = BURST_SIZE,
+                 respect_crawl_delay: bool = True, robots: RobotsCache = None):
+        """
+        Initialize Host Rate Limiter
+
+        Args:
+            rate: Default requests per second per host
+            burst: Default burst size per host
+            respect_crawl_delay: Slow hosts down to their robots.txt Crawl-delay
+            robots: robots.txt rules to read Crawl-delay from (defaults to the shared cache)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.respect_crawl_delay = respect_crawl_delay
+        self.robots = (robots or get_shared_robots()) if respect_crawl_delay else None
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        """Get or create the bucket for a URL's host"""
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+
+        with self.lock:
+            if host in self.buckets:
+                return self.buckets[host]
+
+        rate, burst = self.rate, self.burst
+        if self.robots:
+            delay = self.robots.crawl_delay(url)
+            if delay:
+                rate = min(rate, 1.0 / min(delay, MAX_CRAWL_DELAY))
+                burst = 1
+
+        with self.lock:
+            return self.buckets.setdefault(host, TokenBucket(rate, burst))
+
+    def reserve(self, url: str) -> float:
+        """Reserve the next request slot for a URL's host, returning the wait in seconds"""
+        return self._bucket(url).reserve()
+
+    def wait(self, url: str):
+        """Block until a request to this URL's host is allowed"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, url: str):
+        """Asynchronously wait until a request to this URL's host is allowed"""
+        delay = await asyncio.to_thread(self.reserve, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+def get_shared_limiter() -> HostRateLimiter:
+    """Process-wide limiter so feed fetches and scrapes share per-host spacing"""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = HostRateLimiter()
+        return _shared_limiter
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Request Coalescer
+Per-run single-flight memo so each distinct URL is fetched and parsed once
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class RequestCoalescer:
+    def __init__(self):
+        """
+        Initialize Request Coalescer
+
+        Results are kept for the lifetime of the instance (one generator run).
+        Concurrent callers asking for a key that is still in flight wait on the
+        first caller's result instead of issuing their own request.
+        """
+        self._futures: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _claim(self, key: Hashable):
+        """Return (future, is_owner) for a key, creating the future on first use"""
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self.hits += 1
+                return future, False
+            future = Future()
+            self._futures[key] = future
+            self.misses += 1
+            return future, True
+
+    def _abandon(self, key: Hashable, future: Future, error: BaseException):
+        """Fail a key's waiters with the owner's cancellation and forget the key, so a later caller retries"""
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+        future.set_exception(error)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Compute a key's value once; later and concurrent callers share it"""
+        future, is_owner = self._claim(key)
+        if is_owner:
+            try:
+                future.set_result(compute())
+            except Exception as e:
+                future.set_exception(e)
+            except BaseException as e:
+                self._abandon(key, future, e)
+                raise
+        return future.result()
+
+    async def get_async(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of get; compute is a coroutine factory"""
+        future, is_owner = self._claim(key)
+        if is_owner:
+            try:
+                future.set_result(await compute())
+            except Exception as e:
+                future.set_exception(e)
+            except BaseException as e:  # Cancelled, e.g. at the run deadline
+                self._abandon(key, future, e)
+                raise
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> Dict:
+        """Get coalescing statistics for this run"""
+        return {
+            'distinct_requests': self.misses,
+            'coalesced_requests': self.hits
+        }
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Robots Cache
+Fetches each host's robots.txt once per TTL and answers allow/deny and Crawl-delay lookups from memory
+"""
+
+import re
+import threading
+import requests
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from http_client import create_session
+from http_fixtures import fixture_cache_dir
+from json_store import load_section, save_section
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+ROBOTS_FILE = CACHE_DIR / "robots.json"
+
+USER_AGENT = 'CurationsLA/1.0 (Newsletter Aggregator; +https://la.curations.cc)'
+ROBOTS_TIMEOUT = 10
+ROBOTS_TTL_HOURS = 24        # How long a fetched robots.txt is trusted
+ERROR_TTL_MINUTES = 30       # Retry sooner when robots.txt couldn't be read
+MAX_ROBOTS_BYTES = 500 * 1024  # RFC 9309 lets crawlers ignore anything past 500 KiB
+
+class RobotsDisallowed(requests.RequestException):
+    """Raised instead of requesting a URL that robots.txt disallows for us"""
+
+def _product_token(user_agent: str) -> str:
+    """'CurationsLA/1.0 (...)' -> 'curationsla'"""
+    return user_agent.split('/', 1)[0].strip().lower()
+
+def _compile(pattern: str) -> re.Pattern:
+    """robots.txt path pattern ('*' wildcard, trailing '$' anchor) as a regex"""
+    anchored = pattern.endswith('$')
+    body = re.escape(pattern[:-1] if anchored else pattern).replace(r'\*', '.*')
+    return re.compile(body + ('$' if anchored else ''))
+
+class RobotsRules:
+    def __init__(self, rules: List[Tuple[bool, str]] = (), crawl_delay: Optional[float] = None):
+        """
+        Initialize Robots Rules
+
+        Args:
+            rules: (allow, path pattern) pairs from the group that applies to us
+            crawl_delay: Seconds between requests, if the site asks for one
+        """
+        self.rules = [(allow, pattern) for allow, pattern in rules]
+        self.crawl_delay = crawl_delay
+        # Longest pattern first so the most specific rule wins; Allow wins ties
+        self._compiled = [
+            (allow, _compile(pattern))
+            for allow, pattern in sorted(self.rules, key=lambda rule: (-len(rule[1]), not rule[0]))
+        ]
+
+    @classmethod
+    def allow_all(cls) -> 'RobotsRules':
+        return cls()
+
+    @classmethod
+    def disallow_all(cls) -> 'RobotsRules':
+        return cls([(False, '/')])
+
+    @classmethod
+    def parse(cls, text: str, user_agent: str = USER_AGENT) -> 'RobotsRules':
+        """Rules for our user agent, falling back to the '*' group"""
+        token = _product_token(user_agent)
+        groups = defaultdict(lambda: {'rules': [], 'delay': None})
+        agents, in_rules = [], False
+
+        for line in text.splitlines():
+            key, _, value = line.split('#', 1)[0].partition(':')
+            key, value = key.strip().lower(), value.strip()
+            if key == 'user-agent':
+                if in_rules:
+                    agents, in_rules = [], False
+                agents.append(value.lower())
+            elif key in ('allow', 'disallow') and agents:
+                in_rules = True
+                for agent in agents:
+                    group = groups[agent]
+                    if value:  # An empty Disallow allows everything
+                        group['rules'].append((key == 'allow', value))
+            elif key == 'crawl-delay' and agents:
+                in_rules = True
+                try:
+                    for agent in agents:
+                        groups[agent]['delay'] = float(value)
+                except ValueError:
+                    pass
+
+        group = groups.get(token) or groups.get('*')
+        if not group:
+            return cls.allow_all()
+        return cls(group['rules'], group['delay'])
+
+    def allowed(self, path: str) -> bool:
+        """Whether a path (with query string) may be fetched"""
+        for allow, pattern in self._compiled:
+            if pattern.match(path):
+                return allow
+        return True
+
+    def to_dict(self) -> Dict:
+        return {'rules': [list(rule) for rule in self.rules], 'crawl_delay': self.crawl_delay}
+
+class RobotsCache:
+    def __init__(self, cache_file: Path = ROBOTS_FILE, user_agent: str = USER_AGENT,
+                 ttl_hours: float = ROBOTS_TTL_HOURS, timeout: int = ROBOTS_TIMEOUT):
+        """
+        Initialize Robots Cache
+
+        Args:
+            cache_file: JSON file the parsed rule sets persist to (written by save())
+            user_agent: User agent whose robots.txt group applies
+            ttl_hours: Hours before a host's robots.txt is fetched again
+            timeout: robots.txt request timeout in seconds
+        """
+        self.cache_file = Path(cache_file)
+        self.user_agent = user_agent
+        self.ttl = timedelta(hours=ttl_hours)
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.host_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self.entries = self._load()
+        # Parsed rules per origin; lookups after the first are a dict hit
+        self.rules: Dict[str, Tuple[datetime, RobotsRules]] = {}
+
+        self.session = create_session(user_agent)
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached rule sets from disk"""
+        return load_section(self.cache_file, 'hosts', "robots cache")
+
+    def save(self):
+        """Persist rule sets to disk, dropping expired ones"""
+        now = datetime.now().isoformat()
+        with self.lock:
+            self.entries = {origin: entry for origin, entry in self.entries.items() if entry['expires_at'] > now}
+            save_section(self.cache_file, 'hosts', self.entries)
+
+    def _fetch(self, origin: str) -> Tuple[RobotsRules, timedelta]:
+        """Download and parse an origin's robots.txt, returning the rules and how long to trust them"""
+        try:
+            response = self.session.get(f"{origin}/robots.txt", timeout=self.timeout)
+        except requests.RequestException:
+            # Unreachable: don't block the run, but look again soon
+            return RobotsRules.allow_all(), timedelta(minutes=ERROR_TTL_MINUTES)
+
+        if response.status_code == 200:
+            text = response.content[:MAX_ROBOTS_BYTES].decode('utf-8', errors='replace')
+            return RobotsRules.parse(text, self.user_agent), self.ttl
+        if 400 <= response.status_code < 500:
+            return RobotsRules.allow_all(), self.ttl  # No robots.txt means no restrictions
+        return RobotsRules.disallow_all(), timedelta(minutes=ERROR_TTL_MINUTES)  # Server error: stay off
+
+    def _rules(self, url: str) -> RobotsRules:
+        """Rules for a URL's origin, from memory, disk, or (once per TTL) the network"""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme or 'https'}://{parsed.netloc.lower()}"
+        now = datetime.now()
+
+        cached = self.rules.get(origin)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        # One fetch per origin even when many requests arrive at once
+        with self.lock:
+            host_lock = self.host_locks[origin]
+        with host_lock:
+            cached = self.rules.get(origin)
+            if cached and cached[0] > now:
+                return cached[1]
+
+            with self.lock:
+                entry = self.entries.get(origin)
+            if entry and datetime.fromisoformat(entry['expires_at']) > now:
+                rules = RobotsRules(entry['rules'], entry['crawl_delay'])
+                expires_at = datetime.fromisoformat(entry['expires_at'])
+            else:
+                rules, ttl = self._fetch(origin)
+                expires_at = now + ttl
+                with self.lock:
+                    self.entries[origin] = dict(rules.to_dict(), expires_at=expires_at.isoformat())
+
+            self.rules[origin] = (expires_at, rules)
+            return rules
+
+    def allowed(self, url: str) -> bool:
+        """Whether robots.txt lets us fetch a URL"""
+        parsed = urlparse(url)
+        path = (parsed.path or '/') + (f"?{parsed.query}" if parsed.query else '')
+        return self._rules(url).allowed(path)
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """The Crawl-delay a URL's host asks of us, if any"""
+        return self._rules(url).crawl_delay
+
+    def check(self, url: str):
+        """Raise RobotsDisallowed if a URL may not be fetched"""
+        if not self.allowed(url):
+            raise RobotsDisallowed(f"Disallowed by robots.txt: {url}")
+
+_shared_robots = None
+_shared_lock = threading.Lock()
+
+def get_shared_robots() -> RobotsCache:
+    """Process-wide robots cache shared by the rate limiter, scraper and enricher"""
+    global _shared_robots
+    with _shared_lock:
+        if _shared_robots is None:
+            _shared_robots = RobotsCache()
+        return _shared_robots
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Run Budget
+Wall-clock budget for a generator run, with priority-aware launch decisions
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Configuration
+FETCH_BUDGET_SECONDS = 90     # After this, only high-priority or still-needed feeds launch
+RUN_DEADLINE_SECONDS = 180    # Hard stop: nothing new launches and in-flight fetches are cut off
+TARGET_CANDIDATES = 8         # Each category needs enough candidates for its top 8
+
+# Lower rank launches first; feeds without a priority count as medium
+PRIORITY_RANKS = {'high': 0, 'medium': 1, 'low': 2}
+DEFAULT_PRIORITY_RANK = 1
+
+def priority_rank(feed: Dict) -> int:
+    """Scheduling rank of a feed config"""
+    return PRIORITY_RANKS.get(str(feed.get('priority', '')).lower(), DEFAULT_PRIORITY_RANK)
+
+def order_by_priority(feeds: List[Dict]) -> List[Dict]:
+    """High-priority feeds first, keeping file order within each priority"""
+    return sorted(feeds, key=priority_rank)
+
+class RunBudget:
+    def __init__(self, budget_seconds: float = FETCH_BUDGET_SECONDS,
+                 deadline_seconds: float = RUN_DEADLINE_SECONDS,
+                 target_candidates: int = TARGET_CANDIDATES):
+        """
+        Initialize Run Budget
+
+        Args:
+            budget_seconds: Soft budget; once spent, feeds below high priority only
+                            launch for categories that still lack candidates
+            deadline_seconds: Hard deadline; no network work starts after it
+            target_candidates: Candidates a category needs before it counts as covered
+        """
+        self.started = time.monotonic()
+        self.budget_at = self.started + budget_seconds
+        self.deadline_at = self.started + max(deadline_seconds, budget_seconds)
+        self.target_candidates = target_candidates
+        self.candidates: Dict[str, int] = defaultdict(int)
+        self.skipped: List[str] = []
+        self.lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        """Seconds left before the hard deadline"""
+        return max(0.0, self.deadline_at - time.monotonic())
+
+    def budget_spent(self) -> bool:
+        return time.monotonic() >= self.budget_at
+
+    def deadline_passed(self) -> bool:
+        return time.monotonic() >= self.deadline_at
+
+    def cap_timeout(self, timeout: Optional[float]) -> float:
+        """
+        Shrink a request timeout so it can't run past the deadline
+
+        Raises:
+            TimeoutError: If the deadline has already passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise TimeoutError("Run deadline reached")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def add_candidates(self, category: Optional[str], count: int):
+        """Count items a finished fetch contributed to a category"""
+        if category and count:
+            with self.lock:
+                self.candidates[category] += count
+
+    def is_covered(self, category: Optional[str]) -> bool:
+        """Whether a category already has enough candidates for its top picks"""
+        return bool(category) and self.candidates[category] >= self.target_candidates
+
+    def should_launch(self, feed: Dict, categories: Optional[List[str]] = None) -> bool:
+        """
+        Decide whether a fetch or scrape for a feed may still start
+
+        Args:
+            feed: Feed config (uses 'priority', and 'category' if categories is omitted)
+            categories: Categories the fetch would contribute to
+
+        Returns:
+            bool: False once the deadline has passed, or once the soft budget is
+                  spent for a non-high feed whose categories are all covered
+        """
+        categories = categories or [feed.get('category')]
+        if self.deadline_passed():
+            launch = False
+        elif self.budget_spent():
+            launch = priority_rank(feed) == 0 or not all(self.is_covered(c) for c in categories)
+        else:
+            launch = True
+
+        if not launch:
+            with self.lock:
+                self.skipped.append(feed.get('name', feed.get('url', '')))
+        return launch
+
+    def get_summary(self) -> Dict:
+        """Get budget usage for this run"""
+        return {
+            'elapsed_seconds': round(self.elapsed(), 1),
+            'budget_spent': self.budget_spent(),
+            'deadline_passed': self.deadline_passed(),
+            'skipped_fetches': len(self.skipped),
+            'candidates_by_category': dict(self.candidates)
+        }
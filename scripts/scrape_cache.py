@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Scrape Cache
+Per-URL cache of scraped article lists, skipping downloads within a TTL and extraction for unchanged pages
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from http_fixtures import fixture_cache_dir
+from json_store import load_section, save_section
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = fixture_cache_dir() or BASE_DIR / "cache"  # Isolated in record/replay runs
+SCRAPE_CACHE_FILE = CACHE_DIR / "scrape_cache.json"
+
+SCRAPE_TTL_MINUTES = 60      # Re-runs within the hour reuse results without a request
+MAX_AGE_DAYS = 7             # Entries older than this are dropped on save
+
+def body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+class ScrapeCache:
+    def __init__(self, cache_file: Path = SCRAPE_CACHE_FILE, ttl_minutes: float = SCRAPE_TTL_MINUTES):
+        """
+        Initialize Scrape Cache
+
+        Args:
+            cache_file: JSON file the cache persists to
+            ttl_minutes: Minutes a scrape is reused without downloading the page again
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        self.stats = {'fresh_hits': 0, 'unchanged_hits': 0, 'misses': 0}
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached scrapes from disk"""
+        return load_section(self.cache_file, 'pages', "scrape cache")
+
+    def save(self):
+        """Persist cached scrapes, dropping entries past the maximum age"""
+        cutoff = (datetime.now() - timedelta(days=MAX_AGE_DAYS)).isoformat()
+        with self.lock:
+            self.entries = {url: entry for url, entry in self.entries.items() if entry['checked_at'] >= cutoff}
+            save_section(self.cache_file, 'pages', self.entries)
+
+    def _usable(self, url: str, limit: int) -> Optional[Dict]:
+        """Entry for a URL if it was extracted with at least this limit (caller holds the lock)"""
+        entry = self.entries.get(url)
+        return entry if entry and entry['limit'] >= limit else None
+
+    def get_fresh(self, url: str, limit: int) -> Optional[List[Dict]]:
+        """Articles scraped within the TTL, so the page needn't be downloaded at all"""
+        with self.lock:
+            entry = self._usable(url, limit)
+            if entry and datetime.fromisoformat(entry['checked_at']) > datetime.now() - self.ttl:
+                self.stats['fresh_hits'] += 1
+                return entry['articles'][:limit]
+        return None
+
+    def get_unchanged(self, url: str, body: bytes, limit: int) -> Optional[List[Dict]]:
+        """Articles from the last scrape when the downloaded page is byte-for-byte the same"""
+        with self.lock:
+            entry = self._usable(url, limit)
+            if entry and entry['body_hash'] == body_hash(body):
+                entry['checked_at'] = datetime.now().isoformat()
+                self.stats['unchanged_hits'] += 1
+                return entry['articles'][:limit]
+            self.stats['misses'] += 1
+        return None
+
+    def store(self, url: str, body: bytes, limit: int, articles: List[Dict]):
+        """Remember the articles extracted from a page body"""
+        with self.lock:
+            self.entries[url] = {
+                'body_hash': body_hash(body),
+                'checked_at': datetime.now().isoformat(),
+                'limit': limit,
+                'articles': articles
+            }
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Scraper Engine
+Declarative per-site scraping specs, compiled once and run by one extraction loop
+"""
+
+import json
+import re
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from structured_data import extract_json_ld, has_item_list, structured_articles
+
+# Configuration
+BASE_DIR = Path(__file__).parent.parent
+SCRAPER_SPECS_FILE = BASE_DIR / "sources" / "scrapers" / "sites.json"
+
+class Selector:
+    def __init__(self, tags: List[str], class_pattern: str = None, attr: str = None):
+        """
+        Initialize Selector
+
+        Args:
+            tags: Element names to match
+            class_pattern: Optional regex matched against the element's classes
+            attr: Attribute to read (and require); the element's text is used otherwise
+        """
+        self.tags = tags
+        self.class_re = re.compile(class_pattern) if class_pattern else None
+        self.attr = attr
+
+        # BeautifulSoup keyword filters, built once instead of on every call
+        self.filters = {}
+        if self.class_re:
+            self.filters['class_'] = self.class_re
+        if attr:
+            self.filters['attrs'] = {attr: True}
+        # Lets the parser build only the subtrees this selector matches
+        self.strainer = SoupStrainer(tags, **self.filters)
+
+    @classmethod
+    def from_dict(cls, config: Dict) -> 'Selector':
+        return cls(config['tags'], config.get('class'), config.get('attr'))
+
+    def find(self, element: Tag) -> Optional[Tag]:
+        return element.find(self.tags, **self.filters)
+
+    def find_all(self, element: Tag, limit: int = None) -> List[Tag]:
+        return element.find_all(self.tags, limit=limit, **self.filters)
+
+    def extract(self, element: Tag) -> str:
+        """Value of the first match inside an element, or '' when nothing matches"""
+        match = self.find(element)
+        if match is None:
+            return ''
+        return match[self.attr] if self.attr else match.get_text(strip=True)
+
+class SiteSpec:
+    def __init__(self, name: str, config: Dict):
+        """
+        Initialize Site Spec from a merged sites.json entry
+
+        Args:
+            name: Scraper name (e.g. 'laist')
+            config: Site config with defaults already applied
+        """
+        self.name = name
+        self.source = config['source']
+        self.base_url = config['base_url']
+        self.link_base = config.get('link_base', self.base_url)
+        self.paths = config.get('paths', {})
+        self.default_path = config.get('default_path', '')
+        self.verify_ssl = config.get('verify_ssl', True)
+        self.structured_data = config.get('structured_data', True)
+
+        self.container = Selector.from_dict(config['container'])
+        self.title = Selector.from_dict(config['title'])
+        self.link = Selector.from_dict(config['link'])
+        self.excerpt = Selector.from_dict(config['excerpt'])
+        self.date = Selector.from_dict(config['date']) if config.get('date') else None
+
+    def page_url(self, category: str) -> str:
+        """Listing page for a category, falling back to the site's default section"""
+        return f"{self.base_url}{self.paths.get(category, self.default_path)}"
+
+@lru_cache(maxsize=None)
+def load_site_specs(specs_file: Path = SCRAPER_SPECS_FILE) -> Dict[str, SiteSpec]:
+    """Load and compile every site spec once per process"""
+    with open(specs_file, 'r') as f:
+        config = json.load(f)
+
+    defaults = config.get('defaults', {})
+    return {
+        name: SiteSpec(name, {**defaults, **site})
+        for name, site in config.get('sites', {}).items()
+    }
+
+def extract_articles(soup: BeautifulSoup, spec: SiteSpec, category: str, limit: int) -> List[Dict]:
+    """Pull up to limit articles out of a listing page using a site's selectors"""
+    articles = []
+
+    for element in spec.container.find_all(soup, limit=limit):
+        try:
+            title = spec.title.extract(element)
+            link = spec.link.extract(element)
+            if not (title and link):
+                continue
+
+            published = spec.date.extract(element) if spec.date else ''
+            article = {
+                'title': title,
+                'link': urljoin(spec.link_base, link),
+                'description': spec.excerpt.extract(element),
+                'published': published or datetime.now().isoformat(),
+                'source': spec.source,
+                'category': category
+            }
+            if not published:
+                article['published_estimated'] = True  # Scrape time, not the real date
+            articles.append(article)
+        except Exception:
+            continue
+
+    return articles
+
+def extract_structured(body: bytes, spec: SiteSpec, category: str, limit: int) -> Tuple[List[Dict], bool]:
+    """
+    Articles from a page's JSON-LD
+
+    Returns:
+        Tuple: (articles, complete). complete is True when they stand in for the whole listing:
+               the page declares an ItemList, or there are already `limit` of them. Otherwise
+               (e.g. one featured NewsArticle on a page of cards) the selectors are still needed.
+    """
+    if not spec.structured_data:
+        return [], False
+
+    markup = body.decode('utf-8', errors='replace')
+    blocks = extract_json_ld(markup)
+    articles = structured_articles(markup, spec.link_base, limit, blocks)
+    for article in articles:
+        if not article['published']:
+            article['published'] = datetime.now().isoformat()
+            article['published_estimated'] = True  # Scrape time, not the real date
+        article['source'] = spec.source
+        article['category'] = category
+    return articles, bool(articles) and (len(articles) >= limit or has_item_list(blocks))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Structured Data
+Reads schema.org JSON-LD and OpenGraph metadata straight from page source, no DOM needed
+"""
+
+import html
+import json
+import re
+from typing import Any, Dict, Iterator, List
+from urllib.parse import urljoin
+
+# Configuration
+ARTICLE_TYPES = {
+    'Article', 'NewsArticle', 'BlogPosting', 'ReportageNewsArticle', 'AnalysisNewsArticle',
+    'OpinionNewsArticle', 'ReviewNewsArticle', 'Review', 'Event'
+}
+
+META_TAG_RE = re.compile(r'<meta\s[^>]*>', re.IGNORECASE)
+ATTRIBUTE_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+TIME_TAG_RE = re.compile(r'<time\s[^>]*datetime\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Meta properties checked for each field, most specific first
+DESCRIPTION_META = ('og:description', 'twitter:description', 'description')
+PUBLISHED_META = ('article:published_time', 'og:published_time', 'datePublished', 'pubdate', 'date')
+IMAGE_META = ('og:image', 'og:image:url', 'twitter:image', 'twitter:image:src')
+
+JSON_LD_RE = re.compile(
+    r'<script[^>]*type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+def _types(node: Dict) -> set:
+    node_type = node.get('@type', [])
+    return set(node_type) if isinstance(node_type, list) else {node_type}
+
+def _text(value: Any) -> str:
+    """Plain string from a JSON-LD value, unescaping any HTML entities"""
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('@id') or ''
+    return html.unescape(str(value)).strip() if value else ''
+
+def extract_json_ld(markup: str) -> List[Any]:
+    """Every parseable JSON-LD block in a page; malformed blocks are skipped"""
+    blocks = []
+    for raw in JSON_LD_RE.findall(markup):
+        raw = raw.strip()
+        if raw.startswith('<!--'):
+            raw = raw[4:].rsplit('-->', 1)[0]
+        try:
+            blocks.append(json.loads(raw))
+        except ValueError:
+            continue
+    return blocks
+
+def _walk(node: Any) -> Iterator[Dict]:
+    """Depth-first article-like nodes, expanding @graph arrays and ItemLists in order"""
+    if isinstance(node, list):
+        for child in node:
+            yield from _walk(child)
+        return
+    if not isinstance(node, dict):
+        return
+
+    types = _types(node)
+    if '@graph' in node:
+        yield from _walk(node['@graph'])
+    elif 'ItemList' in types:
+        elements = node.get('itemListElement', [])
+        if isinstance(elements, list):
+            elements = sorted(elements, key=lambda e: e.get('position', 0) if isinstance(e, dict) else 0)
+        yield from _walk(elements)
+    elif 'ListItem' in types:
+        item = node.get('item')
+        if isinstance(item, dict):
+            yield from _walk(item)
+        else:
+            # Bare list entries only carry a name and URL
+            yield {'@type': 'ListItem', 'name': node.get('name'), 'url': node.get('url') or item}
+    elif types & ARTICLE_TYPES:
+        yield node
+
+def has_item_list(blocks: List[Any]) -> bool:
+    """Whether JSON-LD blocks declare an ItemList, i.e. describe a whole listing page rather than one story"""
+    for node in blocks:
+        if isinstance(node, list):
+            if has_item_list(node):
+                return True
+        elif isinstance(node, dict):
+            if 'ItemList' in _types(node) or has_item_list(node.get('@graph', [])):
+                return True
+    return False
+
+def structured_articles(markup: str, base_url: str, limit: int, blocks: List[Any] = None) -> List[Dict]:
+    """
+    Articles described by a page's JSON-LD, in page order
+
+    Args:
+        markup: Page source
+        base_url: Base for relative article URLs
+        limit: Maximum articles to return
+        blocks: Already parsed JSON-LD blocks of the page (parsed from markup when omitted)
+
+    Returns:
+        List[Dict]: title, link, description and published ('' when no date) per article
+    """
+    articles = []
+    seen = set()
+
+    for block in extract_json_ld(markup) if blocks is None else blocks:
+        for node in _walk(block):
+            title = _text(node.get('headline') or node.get('name'))
+            url = _text(node.get('url') or node.get('mainEntityOfPage') or node.get('@id'))
+            if not (title and url):
+                continue
+
+            link = urljoin(base_url, url)
+            if link in seen:
+                continue
+            seen.add(link)
+
+            articles.append({
+                'title': title,
+                'link': link,
+                'description': _text(node.get('description')),
+                'published': _text(node.get('datePublished') or node.get('dateCreated'))
+            })
+            if len(articles) >= limit:
+                return articles
+
+    return articles
+
+def extract_meta_tags(markup: str) -> Dict[str, str]:
+    """<meta> property/name -> content for a page, first occurrence winning"""
+    meta = {}
+    for tag in META_TAG_RE.findall(markup):
+        attributes = {key.lower(): html.unescape(dq or sq) for key, dq, sq in ATTRIBUTE_RE.findall(tag)}
+        key = attributes.get('property') or attributes.get('name') or attributes.get('itemprop')
+        if key and attributes.get('content') and key not in meta:
+            meta[key] = attributes['content'].strip()
+    return meta
+
+def _image_url(value: Any) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('contentUrl') or ''
+    return str(value).strip() if value else ''
+
+def page_metadata(markup: str, page_url: str) -> Dict[str, str]:
+    """
+    Description, publish date and lead image of an article page
+
+    OpenGraph/meta tags win, then the page's JSON-LD article, then the first
+    <time datetime> for the date. Missing fields are ''.
+    """
+    head = markup.split('</head>', 1)[0] if '</head>' in markup else markup
+    meta = extract_meta_tags(head)
+    article = next((node for block in extract_json_ld(markup) for node in _walk(block)), {})
+
+    def first(keys) -> str:
+        return next((meta[key] for key in keys if meta.get(key)), '')
+
+    published = first(PUBLISHED_META) or _text(article.get('datePublished'))
+    if not published:
+        match = TIME_TAG_RE.search(markup)
+        published = match.group(1) if match else ''
+
+    image = first(IMAGE_META) or _image_url(article.get('image'))
+    return {
+        'description': first(DESCRIPTION_META) or _text(article.get('description')),
+        'published': published,
+        'image': urljoin(page_url, image) if image else ''
+    }
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test Article Enricher
+Validates detail-page enrichment of thin items against a local HTTP server (no internet needed)
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from article_enricher import ArticleEnricher, is_thin
+from content_generator import ContentGenerator
+from filters.vibe_engine import get_engine
+from item_store import ItemStore
+from structured_data import page_metadata
+from testing_helpers import LocalServer, unthrottled
+
+ARTICLE_HTML = b"""<!DOCTYPE html>
+<html><head>
+<meta property="og:description" content="Neighbors gather to celebrate the reopening of the Silver Lake Reservoir walking path with music and tacos.">
+<meta property="article:published_time" content="2025-09-25T09:00:00-07:00">
+<meta property='og:image' content='/images/path.jpg'>
+</head><body><p>Full article text.</p></body></html>
+"""
+
+class ArticleServer(LocalServer):
+    """Local server that serves ARTICLE_HTML with a configurable delay"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        super().__init__()
+
+    def handle(self, request):
+        with self.lock:
+            self.requests.append(request.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        self.respond(request, 200, ARTICLE_HTML, {'Content-Type': 'text/html; charset=utf-8'})
+
+def make_item(link: str, description: str = '') -> dict:
+    return {'title': 'Silver Lake Path Reopens', 'link': link, 'description': description,
+            'published': '2025-09-26T12:00:00', 'published_estimated': True}
+
+def test_page_metadata():
+    """Test that description, date and image are read from meta tags"""
+    print("🧪 Testing page metadata extraction...")
+
+    details = page_metadata(ARTICLE_HTML.decode(), "https://laist.com/news/path")
+    assert details['description'].startswith('Neighbors gather')
+    assert details['published'] == '2025-09-25T09:00:00-07:00'
+    assert details['image'] == "https://laist.com/images/path.jpg"
+
+    json_ld = ('<script type="application/ld+json">{"@type": "NewsArticle", "headline": "Path", '
+               '"description": "From JSON-LD.", "datePublished": "2025-09-20", '
+               '"image": {"url": "https://cdn.example.com/a.jpg"}}</script>')
+    details = page_metadata(json_ld, "https://laist.com/news/path")
+    assert details == {'description': 'From JSON-LD.', 'published': '2025-09-20',
+                       'image': "https://cdn.example.com/a.jpg"}
+    assert page_metadata('<p>nothing here</p>', "https://laist.com") == \
+        {'description': '', 'published': '', 'image': ''}
+
+    print("✅ Page metadata extraction works!")
+
+def test_select_candidates():
+    """Test that only thin items that could still make the top picks are fetched"""
+    print("🧪 Testing candidate selection...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        enricher = ArticleEnricher(fetch_budget=2, cache_file=Path(tmp) / 'details.json')
+
+    full = [make_item(f"https://example.com/full/{i}", 'A long enough description of a good LA event.')
+            for i in range(8)]
+    thin = [make_item(f"https://example.com/thin/{i}") for i in range(4)]
+    known = make_item("https://example.com/known")
+    known['vibe_score'] = 0.9
+    items = full + thin + [known]
+    assert is_thin(thin[0]) and not is_thin(full[0])
+
+    scores = {id(item): 0.6 for item in full}
+    scores.update({id(item): 0.1 * i for i, item in enumerate(thin)})
+    scores[id(known)] = 0.9
+
+    candidates = enricher.select_candidates(items, scores)
+    assert candidates == [thin[3], thin[2]], "Best provisional scores first, capped at the fetch budget"
+
+    maxed = {id(item): 1.0 for item in full}
+    maxed.update({id(item): 0.0 for item in thin + [known]})
+    assert enricher.select_candidates(items, maxed) == [], "No fetches once the top 8 can't be beaten"
+
+    print("✅ Candidate selection works!")
+
+def test_enrich_and_cache():
+    """Test that detail pages fill in thin items, per-host limits hold and repeats hit the cache"""
+    print("🧪 Testing article enrichment...")
+
+    with ArticleServer(delay=0.2) as server, tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / 'details.json'
+        enricher = ArticleEnricher(per_host=2, cache_file=cache_file, rate_limiter=unthrottled())
+        items = [make_item(f"{server.base_url}/article/{i}") for i in range(4)]
+
+        assert enricher.enrich(items) == 4
+        assert items[0]['description'].startswith('Neighbors gather')
+        assert items[0]['published'] == '2025-09-25T09:00:00-07:00'
+        assert 'published_estimated' not in items[0]
+        assert items[0]['image'] == f"{server.base_url}/images/path.jpg"
+        assert server.max_in_flight == 2, f"Expected 2 requests per host, saw {server.max_in_flight}"
+        assert server.requests.count('/robots.txt') == 1, "robots.txt is fetched once per host"
+        enricher.save()
+
+        # A fresh enricher (next run) reuses the cached details
+        again = ArticleEnricher(cache_file=cache_file, rate_limiter=unthrottled())
+        repeat = [make_item(f"{server.base_url}/article/0")]
+        assert again.enrich(repeat) == 1
+        assert again.stats == {'fetched': 0, 'cached': 1, 'failed': 0, 'disallowed': 0}
+        assert len(server.requests) == 5, "Cached articles shouldn't be downloaded again"
+
+    print("✅ Article enrichment works!")
+
+def test_generator_scores_candidates_once():
+    """Test that the generator picks candidates from one batch of scores and keeps them for unfetched items"""
+    print("🧪 Testing candidate scoring in the generator...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Skip __init__, which opens the item store and fetchers
+        generator = ContentGenerator.__new__(ContentGenerator)
+        generator.article_enricher = ArticleEnricher(fetch_budget=0, cache_file=Path(tmp) / 'details.json')
+
+        def score_one_at_a_time(text):
+            raise AssertionError("Candidates should be scored in one batch")
+        generator.calculate_vibe_score = score_one_at_a_time
+
+        items = [make_item(f"https://example.com/{i}", 'Free concert and a new mural in Echo Park tonight!')
+                 for i in range(3)] + [make_item("https://example.com/thin")]
+        generator.enrich_candidates(items, 'events')
+
+    engine = get_engine()
+    for item in items:
+        assert (item['vibe_score'], item['neighborhood']) == \
+            engine.score_text(f"{item['title']} {item['description']}"), "Unfetched items keep their batch score"
+
+    print("✅ Candidates are scored once!")
+
+def test_known_items_reuse_stored_scores():
+    """Test that known items keep their stored scores, and are re-scored from cached details after a lexicon change"""
+    print("🧪 Testing known items on later runs...")
+
+    with ArticleServer() as server, tempfile.TemporaryDirectory() as tmp:
+        def run(fetch_budget: int) -> dict:
+            # Skip __init__, which opens the live item store and fetchers
+            generator = ContentGenerator.__new__(ContentGenerator)
+            generator.item_store = ItemStore(Path(tmp) / 'items.db')
+            generator.article_enricher = ArticleEnricher(fetch_budget=fetch_budget, cache_file=Path(tmp) / 'details.json',
+                                                         rate_limiter=unthrottled())
+            item, = generator.process_incremental([make_item(f"{server.base_url}/article/1")], 'events')
+            generator.article_enricher.save()
+            generator.item_store.close()
+            return item
+
+        first = run(fetch_budget=1)
+        assert first['description'].startswith('Neighbors gather')
+        requests_made = len(server.requests)
+
+        # Next run: the feed still only has the title; the stored score is reused as-is
+        second = run(fetch_budget=1)
+        assert len(server.requests) == requests_made, "Known items shouldn't be enriched again"
+        assert not second['description'], "Known items aren't enriched, not even from the cache"
+        assert (second['vibe_score'], second['neighborhood']) == (first['vibe_score'], first['neighborhood'])
+
+        # After a lexicon change the item is scored again, on the details cached by the first run
+        store = ItemStore(Path(tmp) / 'items.db')
+        store.conn.execute("UPDATE items SET vibe_score = 0.0, score_version = 'old-lexicon'")
+        store.conn.commit()
+        store.close()
+        third = run(fetch_budget=0)
+        assert len(server.requests) == requests_made, "Cached details shouldn't be downloaded again"
+        assert third['description'] == first['description']
+        assert (third['vibe_score'], third['neighborhood']) == (first['vibe_score'], first['neighborhood'])
+
+    print("✅ Known items keep their stored scores!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Article Enricher Test Suite")
+    print()
+
+    test_page_metadata()
+    test_select_candidates()
+    test_enrich_and_cache()
+    test_generator_scores_candidates_once()
+    test_known_items_reuse_stored_scores()
+
+    print("\n🎉 All article enricher tests passed!")
+
+if __name__ == "__main__":
+    main()
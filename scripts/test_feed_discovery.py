@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Test Feed Discovery
+Validates finding replacement feeds against a local HTTP server (no internet needed)
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from feed_discovery import FeedDiscovery, find_feed_links, find_sitemap_feeds
+from run_budget import RunBudget
+from test_feed_fetcher import SAMPLE_RSS
+from testing_helpers import LocalServer, unthrottled
+
+class SiteServer(LocalServer):
+    """Local server that serves a fixed path -> body map, 404 otherwise, with a configurable delay"""
+
+    def __init__(self, pages: dict, delay: float = 0.0):
+        self.pages = pages
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+        super().__init__()
+
+    def handle(self, request):
+        with self.lock:
+            self.requests.append(request.path)
+        time.sleep(self.delay)
+        body = self.pages.get(request.path)
+        if body is None:
+            self.respond(request, 404)
+            return
+
+        self.respond(request, 200, body.replace(b'{base}', self.base_url.encode()))
+
+def broken_feed(server: SiteServer) -> dict:
+    return {'name': 'Sample LA', 'url': f"{server.base_url}/old/rss"}
+
+def test_find_links():
+    """Test reading feed links from homepages and sitemaps"""
+    print("🧪 Testing feed link extraction...")
+
+    markup = """<head>
+      <link rel="stylesheet" href="/style.css">
+      <link rel="alternate" type="application/rss+xml" title="News" href="/news/feed/">
+      <link href='https://cdn.example.com/atom' type='application/atom+xml' rel='alternate'>
+      <link rel="alternate" hreflang="es" href="/es/">
+    </head>"""
+    assert find_feed_links(markup, "https://example.com/") == [
+        "https://example.com/news/feed/", "https://cdn.example.com/atom"
+    ]
+
+    sitemap = """<sitemapindex>
+      <sitemap><loc>https://example.com/sitemap-posts.xml</loc></sitemap>
+      <url><loc>https://example.com/category/food/feed</loc></url>
+      <url><loc>https://example.com/about</loc></url>
+    </sitemapindex>"""
+    assert find_sitemap_feeds(sitemap) == (
+        ["https://example.com/category/food/feed"], ["https://example.com/sitemap-posts.xml"]
+    )
+
+    print("✅ Feed link extraction works!")
+
+def test_discover_link_alternate_and_cache():
+    """Test that a homepage feed link is found, validated and used first on later runs"""
+    print("🧪 Testing discovery via <link rel=alternate>...")
+
+    pages = {
+        '/': b'<html><head><link rel="alternate" type="application/rss+xml" href="/news/feed.xml"></head></html>',
+        '/news/feed.xml': SAMPLE_RSS
+    }
+    with SiteServer(pages) as server, tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / 'discovered.json'
+        discovery = FeedDiscovery(cache_file=cache_file, rate_limiter=unthrottled())
+        feed = broken_feed(server)
+
+        feed_url, items = discovery.discover(feed)
+        assert feed_url == f"{server.base_url}/news/feed.xml"
+        assert len(items) == 2 and items[0]['feed_url'] == feed_url
+        assert server.requests == ['/', '/news/feed.xml'], "The advertised feed should be tried first"
+        discovery.save()
+
+        # The next run resolves straight to the discovered feed
+        later = FeedDiscovery(cache_file=cache_file, rate_limiter=unthrottled())
+        resolved = later.resolve(feed)
+        assert resolved['url'] == feed_url
+        assert resolved['configured_url'] == feed['url']
+        assert later.resolve({'name': 'Other', 'url': 'https://example.com/rss'})['url'] == 'https://example.com/rss'
+
+        later.forget(feed['url'])
+        assert later.resolve(feed)['url'] == feed['url']
+
+    print("✅ Link-alternate discovery works!")
+
+def test_discover_common_path_and_sitemap():
+    """Test falling back to common feed paths, then sitemaps"""
+    print("🧪 Testing discovery via common paths and sitemaps...")
+
+    with SiteServer({'/': b'<html></html>', '/rss.xml': SAMPLE_RSS}) as server, tempfile.TemporaryDirectory() as tmp:
+        discovery = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled())
+        feed_url, _ = discovery.discover(broken_feed(server))
+        assert feed_url == f"{server.base_url}/rss.xml"
+
+    pages = {
+        '/robots.txt': b'User-agent: *\nSitemap: {base}/sitemap_index.xml\n',
+        '/sitemap_index.xml': b'<sitemapindex><sitemap><loc>{base}/sitemap-feeds.xml</loc></sitemap></sitemapindex>',
+        '/sitemap-feeds.xml': b'<urlset><url><loc>{base}/la/stories.rss</loc></url></urlset>',
+        '/la/stories.rss': SAMPLE_RSS
+    }
+    with SiteServer(pages) as server, tempfile.TemporaryDirectory() as tmp:
+        discovery = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled())
+        feed_url, items = discovery.discover(broken_feed(server))
+        assert feed_url == f"{server.base_url}/la/stories.rss"
+        assert len(items) == 2
+
+    print("✅ Common-path and sitemap discovery works!")
+
+def test_no_feed_found():
+    """Test that sites without a feed aren't searched again until the retry period passes"""
+    print("🧪 Testing negative discovery cache...")
+
+    with SiteServer({'/': b'<html></html>', '/feed': b'<html>not a feed</html>'}) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        discovery = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled())
+        feed = broken_feed(server)
+
+        assert discovery.should_search(feed['url'])
+        assert discovery.discover(feed) == (None, [])
+        assert not discovery.should_search(feed['url']), "A fruitless search should be remembered"
+        assert discovery.resolve(feed) == feed
+
+        eager = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled(), retry_days=0)
+        eager.entries = discovery.entries
+        assert eager.should_search(feed['url'])
+
+    print("✅ Negative discovery cache works!")
+
+def test_budget_stops_discovery():
+    """Test that discovery requests are capped by the run deadline and the search stops at the soft budget"""
+    print("🧪 Testing discovery under the run budget...")
+
+    with SiteServer({'/': b'<html></html>', '/rss.xml': SAMPLE_RSS}, delay=1.0) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        discovery = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled())
+        discovery.budget = RunBudget(budget_seconds=0.3, deadline_seconds=0.6)
+        feed = broken_feed(server)
+
+        start = time.time()
+        assert discovery.discover(feed) == (None, [])
+        elapsed = time.time() - start
+        assert elapsed < 0.9, f"Discovery took {elapsed:.2f}s - requests ran past the deadline"
+        assert server.requests == ['/'], "No candidates should be checked once the soft budget is spent"
+        assert discovery.should_search(feed['url']), "A search cut short should be retried next run"
+
+        assert discovery.discover_many([feed]) == {feed['url']: (None, [])}
+        assert server.requests == ['/'], "No search starts once the soft budget is spent"
+
+    print("✅ Discovery respects the run budget!")
+
+def test_site_pages_shared():
+    """Test that feeds on the same site read its homepage, robots.txt and sitemaps once"""
+    print("🧪 Testing shared site pages...")
+
+    pages = {
+        '/robots.txt': b'User-agent: *\nSitemap: {base}/sitemap.xml\n',
+        '/sitemap.xml': b'<urlset><url><loc>{base}/la/stories.rss</loc></url></urlset>',
+        '/la/stories.rss': SAMPLE_RSS
+    }
+    with SiteServer(pages) as server, tempfile.TemporaryDirectory() as tmp:
+        discovery = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled())
+        feeds = [{'name': f'Sample LA {n}', 'url': f"{server.base_url}/old/{n}/rss"} for n in range(3)]
+        # The same feed listed under two categories is searched once
+        results = discovery.discover_many(feeds + [dict(feeds[0], category='food')])
+
+        assert set(results) == {feed['url'] for feed in feeds}
+        assert all(feed_url == f"{server.base_url}/la/stories.rss" for feed_url, _ in results.values())
+        for path in ('/', '/robots.txt', '/sitemap.xml'):
+            assert server.requests.count(path) == 1, f"{path} was fetched {server.requests.count(path)} times"
+
+    print("✅ Site pages are shared!")
+
+def test_discover_many_concurrent():
+    """Test that different sites are searched at the same time"""
+    print("🧪 Testing concurrent discovery...")
+
+    pages = {
+        '/': b'<html><head><link rel="alternate" type="application/rss+xml" href="/news/feed.xml"></head></html>',
+        '/news/feed.xml': SAMPLE_RSS
+    }
+    servers = [SiteServer(pages, delay=0.3) for _ in range(3)]
+    with servers[0], servers[1], servers[2], tempfile.TemporaryDirectory() as tmp:
+        discovery = FeedDiscovery(cache_file=Path(tmp) / 'd.json', rate_limiter=unthrottled())
+        feeds = [broken_feed(server) for server in servers]
+
+        start = time.time()
+        results = discovery.discover_many(feeds)
+        elapsed = time.time() - start
+
+        assert all(results[feed['url']][0] for feed in feeds), "Every site's feed should be found"
+        assert elapsed < 1.5, f"Searching 3 sites took {elapsed:.2f}s - they ran one after another"
+
+    print("✅ Concurrent discovery works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Feed Discovery Test Suite")
+    print()
+
+    test_find_links()
+    test_discover_link_alternate_and_cache()
+    test_discover_common_path_and_sitemap()
+    test_no_feed_found()
+    test_budget_stops_discovery()
+    test_site_pages_shared()
+    test_discover_many_concurrent()
+
+    print("\n🎉 All feed discovery tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Test Feed Fetcher
+Validates concurrent feed fetching against a local HTTP server (no internet needed)
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from feed_fetcher import FeedFetcher, parse_feed_items
+from http_cache import HTTPCache
+from request_coalescer import RequestCoalescer
+from testing_helpers import LocalServer, unthrottled
+
+SAMPLE_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Sample LA Feed</title>
+    <item>
+      <title>New Taco Spot Opens in Silver Lake</title>
+      <link>https://example.com/tacos</link>
+      <description>A community celebration of food.</description>
+      <pubDate>Thu, 25 Sep 2025 10:00:00 -0700</pubDate>
+    </item>
+    <item>
+      <title>Art Festival Returns to DTLA</title>
+      <link>https://example.com/art</link>
+      <description>Local artists celebrate.</description>
+      <pubDate>Wed, 24 Sep 2025 09:00:00 -0700</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+class FeedServer(LocalServer):
+    """Local server that serves SAMPLE_RSS with a configurable delay"""
+
+    def __init__(self, delay: float = 0.0, etag: str = None):
+        self.delay = delay
+        self.etag = etag
+        self.requests = []
+        self.not_modified_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        super().__init__()
+
+    def handle(self, request):
+        with self.lock:
+            self.requests.append(request.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        if request.path.startswith('/missing'):
+            self.respond(request, 404)
+            return
+
+        if self.etag and request.headers.get('If-None-Match') == self.etag:
+            with self.lock:
+                self.not_modified_count += 1
+            request.send_response(304)  # No body, so no Content-Length
+            request.end_headers()
+            return
+
+        headers = {'ETag': self.etag} if self.etag else {}
+        headers['Content-Type'] = 'application/rss+xml'
+        self.respond(request, 200, SAMPLE_RSS, headers)
+
+def test_parse_feed_items():
+    """Test that parsed items keep the generator's item dict shape"""
+    print("🧪 Testing feed item parsing...")
+
+    items = parse_feed_items(SAMPLE_RSS, 'Sample', 'https://example.com/rss')
+
+    assert len(items) == 2, f"Expected 2 items, got {len(items)}"
+    expected_keys = {'title', 'link', 'description', 'published', 'summary', 'source', 'feed_url'}
+    assert set(items[0].keys()) == expected_keys, f"Unexpected keys: {items[0].keys()}"
+    assert items[0]['title'] == 'New Taco Spot Opens in Silver Lake'
+    assert items[0]['source'] == 'Sample'
+    assert items[0]['feed_url'] == 'https://example.com/rss'
+
+    print("✅ Feed item parsing works!")
+
+def test_concurrent_fetch():
+    """Test that feeds are downloaded concurrently and failures map to []"""
+    print("🧪 Testing concurrent feed fetching...")
+
+    with FeedServer(delay=0.3) as server:
+        feeds = [{'name': f'Feed {i}', 'url': f"{server.base_url}/feed/{i}"} for i in range(6)]
+        feeds.append({'name': 'Broken', 'url': f"{server.base_url}/missing"})
+
+        fetcher = FeedFetcher(concurrency=8, per_host=8, rate_limiter=unthrottled())
+        start = time.time()
+        results = fetcher.fetch_feeds(feeds)
+        elapsed = time.time() - start
+
+    assert len(results) == 7, f"Expected 7 results, got {len(results)}"
+    assert results[f"{server.base_url}/missing"] == [], "Failed feed should map to []"
+    assert all(len(results[feed['url']]) == 2 for feed in feeds[:6])
+    assert elapsed < 1.5, f"Fetching took {elapsed:.2f}s - not concurrent"
+    assert server.max_in_flight > 1, "Expected overlapping requests"
+
+    print(f"✅ Fetched {len(feeds)} feeds in {elapsed:.2f}s")
+
+def test_process_pool_parsing():
+    """Test that parsing in worker processes returns the same items as in-thread parsing"""
+    print("🧪 Testing process-pool feed parsing...")
+
+    with FeedServer(delay=0.05) as server:
+        feeds = [{'name': f'Feed {i}', 'url': f"{server.base_url}/feed/{i}"} for i in range(4)]
+        pooled = FeedFetcher(rate_limiter=unthrottled(), parse_processes=2).fetch_feeds(feeds)
+        inline = FeedFetcher(rate_limiter=unthrottled(), parse_processes=0).fetch_feeds(feeds)
+
+    assert pooled == inline, "Process-pool parsing should match in-thread parsing"
+    assert all(len(items) == 2 for items in pooled.values())
+
+    print("✅ Process-pool parsing works!")
+
+def test_per_host_limit():
+    """Test that the per-host cap bounds simultaneous requests to one host"""
+    print("🧪 Testing per-host concurrency limit...")
+
+    with FeedServer(delay=0.1) as server:
+        feeds = [{'name': f'Feed {i}', 'url': f"{server.base_url}/feed/{i}"} for i in range(6)]
+        fetcher = FeedFetcher(concurrency=8, per_host=2, rate_limiter=unthrottled())
+        fetcher.fetch_feeds(feeds)
+
+    assert server.max_in_flight <= 2, f"Per-host limit exceeded: {server.max_in_flight}"
+
+    print("✅ Per-host limit is respected!")
+
+def test_duplicate_urls_fetched_once():
+    """Test that a URL listed twice is only downloaded once"""
+    print("🧪 Testing duplicate feed URLs...")
+
+    with FeedServer(delay=0.2) as server:
+        url = f"{server.base_url}/feed/shared"
+        feeds = [{'name': 'A', 'url': url}, {'name': 'B', 'url': url}]
+        fetcher = FeedFetcher(rate_limiter=unthrottled())
+        results = fetcher.fetch_feeds(feeds)
+
+        # A later category asking for the same feed is served from the run's results
+        later = fetcher.fetch_feed(url, 'LAist Food')
+
+    assert len(server.requests) == 1, f"Expected 1 request, got {len(server.requests)}"
+    assert len(results[url]) == 2
+    assert [item['source'] for item in later] == ['LAist Food', 'LAist Food'], "Fan-out keeps each feed's name"
+    assert later[0] is not results[url][0], "Each requester gets its own item copies"
+    assert fetcher.coalescer.get_stats() == {'distinct_requests': 1, 'coalesced_requests': 2}
+
+    print("✅ Duplicate URLs are fetched once!")
+
+def test_coalescer_in_flight():
+    """Test that concurrent callers share one in-flight computation"""
+    print("🧪 Testing in-flight request coalescing...")
+
+    coalescer = RequestCoalescer()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return ['entry']
+
+    threads = [threading.Thread(target=coalescer.get, args=('https://example.com/page', slow_fetch))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1, f"Expected one fetch, got {len(calls)}"
+    assert coalescer.get('https://example.com/page', slow_fetch) == ['entry']
+
+    print("✅ In-flight requests are coalesced!")
+
+def test_coalescer_cancelled_owner():
+    """Test that cancelling the caller that owns a request releases its waiters and the key"""
+    print("🧪 Testing coalescer cancellation...")
+
+    coalescer = RequestCoalescer()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def fetch_once():
+        return ['entry']
+
+    async def run():
+        owner = asyncio.ensure_future(coalescer.get_async('u', hang))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(coalescer.get_async('u', fetch_once))
+        await asyncio.sleep(0)
+        owner.cancel()
+        for task in (owner, waiter):
+            try:
+                await asyncio.wait_for(task, timeout=1)
+                assert False, "Cancelled request should not produce a result"
+            except asyncio.CancelledError:
+                pass
+        return await asyncio.wait_for(coalescer.get_async('u', fetch_once), timeout=1)
+
+    assert asyncio.run(run()) == ['entry'], "A later caller should fetch again"
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    try:
+        coalescer.get('v', interrupted)
+        assert False, "Interrupt should propagate"
+    except KeyboardInterrupt:
+        pass
+    assert coalescer.get('v', lambda: 'retried') == 'retried'
+
+    print("✅ Cancelled requests are released!")
+
+def test_conditional_get_cache():
+    """Test that a cached feed is revalidated with If-None-Match and served from disk"""
+    print("🧪 Testing conditional-GET HTTP cache...")
+
+    with tempfile.TemporaryDirectory() as cache_dir, FeedServer(etag='"v1"') as server:
+        url = f"{server.base_url}/feed/cached"
+        cache = HTTPCache(Path(cache_dir))
+
+        first = FeedFetcher(http_cache=cache, rate_limiter=unthrottled()).fetch_feed(url, 'Cached Feed')
+        assert cache.conditional_headers(url) == {'If-None-Match': '"v1"'}
+
+        second = FeedFetcher(http_cache=cache, rate_limiter=unthrottled()).fetch_feed(url, 'Cached Feed')
+
+        assert server.not_modified_count == 1, "Second fetch should get a 304"
+        assert first == second, "304 response should serve identical items from disk"
+        assert cache.get_cache_stats()['cached_urls'] == 1
+
+    print("✅ Conditional-GET cache works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Feed Fetcher Test Suite")
+    print()
+
+    test_parse_feed_items()
+    test_concurrent_fetch()
+    test_process_pool_parsing()
+    test_per_host_limit()
+    test_duplicate_urls_fetched_once()
+    test_coalescer_in_flight()
+    test_coalescer_cancelled_owner()
+    test_conditional_get_cache()
+
+    print("\n🎉 All feed fetcher tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test Feed Health Registry
+Validates health tracking and the circuit breaker for dead feeds
+"""
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from feed_fetcher import FeedFetcher
+from feed_health import FeedHealthRegistry
+from politeness import HostRateLimiter
+
+DEAD_URL = "http://127.0.0.1:9/dead-feed.xml"  # Discard port - connection refused
+
+def test_health_summary():
+    """Test success rate and latency percentiles"""
+    print("🧪 Testing feed health summary...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        registry = FeedHealthRegistry(Path(tmp_dir) / "health.json")
+        for latency in [0.1, 0.2, 0.3, 0.4]:
+            registry.record_success("https://example.com/rss", latency)
+        registry.record_failure("https://example.com/rss", "Timeout", 2.0)
+
+        health = registry.get_feed_health("https://example.com/rss")
+
+    assert health['attempts'] == 5
+    assert health['success_rate'] == 0.8, f"Unexpected success rate: {health['success_rate']}"
+    assert health['p50_latency'] == 0.3, f"Unexpected p50: {health['p50_latency']}"
+    assert health['p95_latency'] == 2.0, f"Unexpected p95: {health['p95_latency']}"
+    assert health['last_error'] == "Timeout"
+    assert health['circuit'] == 'closed'
+
+    print("✅ Feed health summary works!")
+
+def test_circuit_breaker():
+    """Test that consecutive failures open the circuit until the cooldown ends"""
+    print("🧪 Testing circuit breaker...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        health_file = Path(tmp_dir) / "health.json"
+        registry = FeedHealthRegistry(health_file, failure_threshold=2, cooldown_hours=1)
+
+        registry.record_failure(DEAD_URL, "Connection refused")
+        assert not registry.is_open(DEAD_URL), "One failure should not open the circuit"
+
+        registry.record_failure(DEAD_URL, "Connection refused")
+        assert registry.is_open(DEAD_URL), "Threshold failures should open the circuit"
+        assert not registry.is_open(DEAD_URL, now=datetime.now() + timedelta(hours=2)), \
+            "Circuit should allow a retry after the cooldown"
+
+        # State survives a restart
+        registry.save()
+        reloaded = FeedHealthRegistry(health_file, failure_threshold=2, cooldown_hours=1)
+        assert reloaded.is_open(DEAD_URL), "Open circuit should persist to disk"
+
+        reloaded.record_success(DEAD_URL, 0.5)
+        assert not reloaded.is_open(DEAD_URL), "A success should close the circuit"
+
+    print("✅ Circuit breaker works!")
+
+def test_fetcher_skips_open_circuit():
+    """Test that the fetcher records failures and then stops hitting a dead feed"""
+    print("🧪 Testing fetcher integration...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        registry = FeedHealthRegistry(Path(tmp_dir) / "health.json", failure_threshold=1)
+        fetcher = FeedFetcher(timeout=2, health=registry,
+                              rate_limiter=HostRateLimiter(respect_crawl_delay=False))
+
+        assert fetcher.fetch_feed(DEAD_URL, 'Dead Feed') == []
+        assert registry.get_feed_health(DEAD_URL)['consecutive_failures'] == 1
+        assert registry.is_open(DEAD_URL)
+
+        assert fetcher.fetch_feed(DEAD_URL, 'Dead Feed') == []
+        assert registry.get_feed_health(DEAD_URL)['attempts'] == 1, "Open circuit should skip the request"
+
+    print("✅ Fetcher skips known-dead feeds!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Feed Health Test Suite")
+    print()
+
+    test_health_summary()
+    test_circuit_breaker()
+    test_fetcher_skips_open_circuit()
+
+    print("\n🎉 All feed health tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test Streaming Feed Parser
+Validates early-exit RSS/Atom parsing and the feedparser fallback
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+import feedparser
+
+from content_generator import ContentGenerator
+from feed_fetcher import parse_feed_items
+from feed_stream import FeedFormatError, iter_feed_entries, take_entries
+from test_feed_fetcher import SAMPLE_RSS
+
+SAMPLE_ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Sample LA Atom Feed</title>
+  <entry>
+    <title>Night Market Lights Up Chinatown</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/night-market"/>
+    <published>2025-09-25T18:00:00Z</published>
+    <summary>&lt;p&gt;Food stalls and music&lt;/p&gt;</summary>
+  </entry>
+</feed>
+"""
+
+UNSAFE_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Unsafe</title>
+  <item>
+    <title>Gallery Night in the Arts District</title>
+    <link>https://example.com/gallery-night</link>
+    <description><![CDATA[<p onclick="steal()">Open studios <a href="javascript:alert(1)">tonight</a>
+      <iframe src="https://evil.example/"></iframe><img src="/art.jpg" onerror="alert(1)">
+      <script>alert(1)</script><style>p {display: none}</style></p>]]></description>
+  </item>
+</channel></rss>
+"""
+
+def build_rss(count: int, start: datetime = None, tail: bytes = b"</channel></rss>") -> bytes:
+    """RSS document with count items, one hour apart and newest first"""
+    start = start or datetime(2025, 9, 25, 12, tzinfo=timezone.utc)
+    items = [
+        f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+        f"<description>Story {i} body</description>"
+        f"<pubDate>{format_datetime(start - timedelta(hours=i))}</pubDate></item>"
+        for i in range(count)
+    ]
+    return ('<?xml version="1.0"?><rss version="2.0"><channel><title>Big</title>'
+            + ''.join(items)).encode() + tail
+
+def test_matches_feedparser():
+    """Test that streamed items match the full feedparser parse"""
+    print("🧪 Testing streaming parse matches feedparser...")
+
+    for document in (SAMPLE_RSS, SAMPLE_ATOM, build_rss(12)):
+        streamed = take_entries(iter_feed_entries(document), 10)
+        parsed = feedparser.parse(document).entries[:10]
+        assert len(streamed) == len(parsed)
+        for ours, theirs in zip(streamed, parsed):
+            for key in ('title', 'link', 'description', 'published', 'summary'):
+                assert ours[key] == theirs.get(key, ''), f"{key}: {ours[key]!r} != {theirs.get(key)!r}"
+
+    print("✅ Streaming parse matches feedparser!")
+
+def test_unsafe_markup_sanitized():
+    """Test that streamed summaries are sanitized like feedparser's, and blurbs never keep half a tag"""
+    print("🧪 Testing markup sanitizing...")
+
+    streamed, = take_entries(iter_feed_entries(UNSAFE_RSS), 10)
+    parsed, = feedparser.parse(UNSAFE_RSS).entries
+    assert streamed['description'] == parsed['description'] == streamed['summary']
+    for unsafe in ('onclick', 'javascript:', '<iframe', 'onerror', '<script', '<style', 'alert'):
+        assert unsafe not in streamed['description'], unsafe
+
+    # A tag straddling the 150-character cut must not survive as '<img src=x onerror=...'
+    generator = ContentGenerator.__new__(ContentGenerator)  # Skip __init__, which opens the live caches
+    description = 'x' * 130 + '<img src=x onerror=alert(1)> Silver Lake'
+    section = generator.format_newsletter_section('events', [
+        {'title': 'Gallery Night', 'link': 'https://example.com/g', 'description': description}
+    ])
+    assert '<' not in section and 'onerror' not in section
+    assert 'Silver Lake' in section, "Text after a removed tag still counts toward the blurb"
+
+    print("✅ Markup is sanitized!")
+
+def test_early_exit():
+    """Test that parsing stops after the entry limit, never reading the rest"""
+    print("🧪 Testing early exit...")
+
+    # Everything after the first 2000 entries is garbage; reaching it would raise
+    document = build_rss(2000, tail=b"<item><broken></item>" * 10)
+    entries = take_entries(iter_feed_entries(document), 10)
+    assert [entry['title'] for entry in entries] == [f"Story {i}" for i in range(10)]
+
+    try:
+        take_entries(iter_feed_entries(document), 5000)
+        assert False, "Reading the whole document should hit the malformed tail"
+    except FeedFormatError:
+        pass
+
+    print("✅ Early exit works!")
+
+def test_malformed_feed_falls_back():
+    """Test that documents the streaming parser rejects go through feedparser"""
+    print("🧪 Testing feedparser fallback...")
+
+    # &nbsp; isn't defined in XML, which the strict parser rejects
+    document = SAMPLE_RSS.replace(b"A community celebration", b"A&nbsp;community celebration")
+    try:
+        list(iter_feed_entries(document))
+        assert False, "Strict parser should reject undefined entities"
+    except FeedFormatError:
+        pass
+
+    items = parse_feed_items(document, 'Sloppy Feed', 'https://example.com/rss')
+    assert len(items) == 2
+    assert items[0]['title'] == 'New Taco Spot Opens in Silver Lake'
+
+    print("✅ Feedparser fallback works!")
+
+def test_freshness_cutoff():
+    """Test that stale entries are skipped and a stale run ends the scan"""
+    print("🧪 Testing freshness cutoff...")
+
+    start = datetime(2025, 9, 25, 12, tzinfo=timezone.utc)
+    document = build_rss(500, start=start)
+    cutoff = start - timedelta(hours=2, minutes=30)
+
+    items = parse_feed_items(document, 'Big', 'https://example.com/rss', limit=10, cutoff=cutoff)
+    assert [item['title'] for item in items] == ['Story 0', 'Story 1', 'Story 2']
+
+    naive_cutoff = cutoff.replace(tzinfo=None)
+    assert len(parse_feed_items(document, 'Big', 'https://example.com/rss', cutoff=naive_cutoff)) == 3
+
+    print("✅ Freshness cutoff works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Streaming Feed Parser Test Suite")
+    print()
+
+    test_matches_feedparser()
+    test_unsafe_markup_sanitized()
+    test_early_exit()
+    test_malformed_feed_falls_back()
+    test_freshness_cutoff()
+
+    print("\n🎉 All streaming parser tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test HTML Parser Backends
+Validates backend selection and that every installed backend extracts the same articles
+"""
+
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from benchmark_html_parsers import synthetic_page
+from html_parsers import PARSER_ENV, available_backends, make_soup, select_backend
+from scraper_engine import extract_articles, load_site_specs
+from web_scraper import WebScraper
+
+def test_backend_selection():
+    """Test that the fastest installed backend is chosen, with a safe fallback"""
+    print("🧪 Testing parser backend selection...")
+
+    backends = available_backends()
+    assert 'html.parser' in backends, "The stdlib parser is always available"
+    assert select_backend() == backends[0]
+    assert select_backend('html.parser') == 'html.parser'
+    assert select_backend('not-a-parser') == backends[0], "Unknown backends fall back"
+
+    os.environ[PARSER_ENV] = 'html.parser'
+    try:
+        assert WebScraper().parser_backend == 'html.parser', "Environment override is honoured"
+    finally:
+        del os.environ[PARSER_ENV]
+
+    print(f"✅ Parser backend selection works! (installed: {', '.join(backends)})")
+
+def test_backends_agree():
+    """Test that every installed backend extracts identical articles"""
+    print("🧪 Testing backend consistency...")
+
+    for spec in load_site_specs().values():
+        page = synthetic_page(spec)
+        results = [extract_articles(make_soup(page, backend), spec, 'general', 10)
+                   for backend in available_backends()]
+        titles = [[article['title'] for article in articles] for articles in results]
+        assert len(titles[0]) == 10, f"{spec.name}: expected 10 articles"
+        assert all(t == titles[0] for t in titles), f"{spec.name}: backends disagree"
+
+    print("✅ Backends extract the same articles!")
+
+def test_partial_parse():
+    """Test that container-only parsing finds the same articles with less work"""
+    print("🧪 Testing partial parsing...")
+
+    spec = load_site_specs()['laist']
+    page = synthetic_page(spec)
+
+    for backend in available_backends():
+        tracemalloc.start()
+        full = make_soup(page, backend)
+        full_articles = extract_articles(full, spec, 'general', 10)
+        full_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del full
+
+        tracemalloc.start()
+        partial = make_soup(page, backend, parse_only=spec.container.strainer, max_subtrees=10)
+        partial_articles = extract_articles(partial, spec, 'general', 10)
+        partial_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert partial_articles == full_articles, f"{backend}: partial parse changed the articles"
+        assert len(partial.contents) == 10, f"{backend}: parsing should stop after 10 containers"
+        assert partial.find('div', class_='nav-block') is None, "Page chrome should never be built"
+        assert partial_peak < full_peak / 2, f"{backend}: peak memory {partial_peak} vs {full_peak}"
+
+    print("✅ Partial parsing works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA HTML Parser Test Suite")
+    print()
+
+    test_backend_selection()
+    test_backends_agree()
+    test_partial_parse()
+
+    print("\n🎉 All HTML parser tests passed!")
+
+if __name__ == "__main__":
+    main()
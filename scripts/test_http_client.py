@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test HTTP Client
+Validates shared keep-alive pools, compression and counters against a local HTTP server (no internet needed)
+"""
+
+import gzip
+import socket
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from http_client import ACCEPT_ENCODING, DNSCache, PooledAdapter, create_session
+from testing_helpers import LocalServer
+
+PAGE = b"<html><body>" + b"<p>Good vibes from Silver Lake.</p>" * 200 + b"</body></html>"
+
+class KeepAliveServer(LocalServer):
+    """Local HTTP/1.1 server that gzips responses when the client accepts it"""
+
+    protocol_version = 'HTTP/1.1'  # Keep connections open between requests
+
+    def __init__(self):
+        self.accept_encodings = []
+        super().__init__()
+
+    def handle(self, request):
+        accept = request.headers.get('Accept-Encoding', '')
+        self.accept_encodings.append(accept)
+        if 'gzip' in accept:
+            self.respond(request, 200, gzip.compress(PAGE), {'Content-Encoding': 'gzip'})
+        else:
+            self.respond(request, 200, PAGE)
+
+def test_accept_encoding():
+    """Test that every installed decoder is advertised"""
+    print("🧪 Testing Accept-Encoding...")
+
+    encodings = [encoding.strip() for encoding in ACCEPT_ENCODING.split(',')]
+    assert encodings[:2] == ['gzip', 'deflate']
+    for module, encoding in [('brotli', 'br'), ('brotlicffi', 'br'), ('zstandard', 'zstd')]:
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        assert encoding in encodings, f"{module} is installed, so {encoding} should be advertised"
+
+    print(f"✅ Advertising: {ACCEPT_ENCODING}")
+
+def test_shared_pool_and_counters():
+    """Test that sessions on one adapter share keep-alive connections and count bytes"""
+    print("🧪 Testing shared connection pool...")
+
+    adapter = PooledAdapter()
+    feeds = create_session('FeedBot/1.0', adapter=adapter)
+    pages = create_session('PageBot/1.0', {'Accept': 'text/html'}, adapter=adapter)
+
+    with KeepAliveServer() as server:
+        for i in range(3):
+            assert feeds.get(f"{server.base_url}/feed/{i}", timeout=5).content == PAGE
+            assert pages.get(f"{server.base_url}/page/{i}", timeout=5).content == PAGE
+
+    stats = adapter.get_stats()['127.0.0.1']
+    assert stats['requests'] == 6
+    assert stats['connections'] == 1, f"Sessions should reuse one connection, opened {stats['connections']}"
+    assert stats['bytes_decoded'] == 6 * len(PAGE)
+    assert stats['bytes_received'] < stats['bytes_decoded'] / 5, "Compressed bytes should be counted on the wire"
+    assert all('gzip' in accept for accept in server.accept_encodings)
+
+    totals = adapter.get_totals()
+    assert totals['hosts'] == 1 and totals['requests'] == 6
+
+    print(f"✅ 6 requests over {stats['connections']} connection, "
+          f"{stats['bytes_received']} of {stats['bytes_decoded']} bytes on the wire")
+
+def test_dns_cache():
+    """Test that lookups are answered from the cache until the TTL passes"""
+    print("🧪 Testing DNS cache...")
+
+    calls = []
+
+    def resolver(host, port, *args):
+        calls.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', port))]
+
+    cache = DNSCache(resolver=resolver)
+    first = cache.getaddrinfo('laist.com', 443)
+    assert cache.getaddrinfo('laist.com', 443) == first
+    cache.getaddrinfo('lamag.com', 443)
+    assert calls == ['laist.com', 'lamag.com']
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    expired = DNSCache(ttl=0, resolver=resolver)
+    expired.getaddrinfo('laist.com', 443)
+    expired.getaddrinfo('laist.com', 443)
+    assert calls.count('laist.com') == 3
+
+    print("✅ DNS cache works!")
+
+def test_dns_cache_scoped_to_adapter():
+    """Test that pooled connections resolve through the adapter's cache without patching the process resolver"""
+    print("🧪 Testing adapter DNS cache...")
+
+    calls = []
+
+    def resolver(host, port, *args):
+        calls.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', port))]
+
+    system_getaddrinfo = socket.getaddrinfo
+    adapter = PooledAdapter(dns_cache=DNSCache(resolver=resolver))
+    session = create_session('test-agent', adapter=adapter)
+    with KeepAliveServer() as server:
+        port = server.base_url.rsplit(':', 1)[1]
+        for i in range(2):
+            # Close between requests so the second connection has to resolve again
+            assert session.get(f"http://feeds.curationsla.test:{port}/{i}", timeout=5,
+                               headers={'Connection': 'close'}).content == PAGE
+
+    assert calls == ['feeds.curationsla.test'], "The second connection should resolve from the cache"
+    assert adapter.dns_cache.hits == 1
+    assert socket.getaddrinfo is system_getaddrinfo, "The process-wide resolver must stay untouched"
+
+    print("✅ Adapter DNS cache works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA HTTP Client Test Suite")
+    print()
+
+    test_accept_encoding()
+    test_shared_pool_and_counters()
+    test_dns_cache()
+    test_dns_cache_scoped_to_adapter()
+
+    print("\n🎉 All HTTP client tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test HTTP Fixtures
+Validates record/replay of feed and scrape responses for offline runs
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+import requests
+
+from feed_fetcher import FeedFetcher
+from http_fixtures import FixtureArchive
+from test_feed_fetcher import FeedServer, SAMPLE_RSS
+from testing_helpers import unthrottled
+
+def test_record_then_replay():
+    """Test that recorded responses replay offline with configured latency"""
+    print("🧪 Testing record and replay...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive_path = Path(tmp_dir) / "fixtures.json.gz"
+
+        with FeedServer(etag='"v1"') as server:
+            url = f"{server.base_url}/feed/record"
+            recorder = FixtureArchive(archive_path, mode='record')
+            session = requests.Session()
+            recorder.attach(session)
+
+            live = session.get(url, headers={'If-None-Match': '"v1"'}, timeout=5)
+            recorder.save()
+
+        assert live.status_code == 200, "Recording should strip conditional headers"
+        assert archive_path.exists()
+
+        # Server is gone - replay must not touch the network
+        replayer = FixtureArchive(archive_path, mode='replay', latency='0.1')
+        session = requests.Session()
+        replayer.attach(session)
+
+        start = time.monotonic()
+        replayed = session.get(url, timeout=5)
+        elapsed = time.monotonic() - start
+
+        assert replayed.status_code == 200
+        assert replayed.content == SAMPLE_RSS
+        assert replayed.headers['ETag'] == '"v1"'
+        assert 0.1 <= elapsed < 0.5, f"Expected ~0.1s replay latency, took {elapsed:.2f}s"
+
+        try:
+            session.get(f"{server.base_url}/never-recorded", timeout=5)
+            assert False, "Unrecorded URLs should fail"
+        except requests.exceptions.ConnectionError:
+            pass
+        assert replayer.misses == 1
+
+    print("✅ Record and replay work!")
+
+def test_replay_feeds_through_fetcher():
+    """Test that the feed fetcher produces identical items from a replayed archive"""
+    print("🧪 Testing fetcher replay...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive_path = Path(tmp_dir) / "fixtures.json.gz"
+        limiter = unthrottled()
+
+        with FeedServer() as server:
+            feeds = [{'name': f'Feed {i}', 'url': f"{server.base_url}/feed/{i}"} for i in range(3)]
+            recorder = FixtureArchive(archive_path, mode='record')
+            fetcher = FeedFetcher(rate_limiter=limiter, parse_processes=0)
+            recorder.attach(fetcher.session)
+            live_results = fetcher.fetch_feeds(feeds)
+            recorder.save()
+
+        replayer = FixtureArchive(archive_path, mode='replay', latency='recorded', latency_scale=0)
+        fetcher = FeedFetcher(rate_limiter=limiter, parse_processes=0)
+        replayer.attach(fetcher.session)
+        replayed_results = fetcher.fetch_feeds(feeds)
+
+    assert replayed_results == live_results, "Replay should reproduce the live run"
+    assert all(len(items) == 2 for items in replayed_results.values())
+
+    print("✅ Fetcher replay works!")
+
+def test_fixture_runs_use_isolated_caches():
+    """Test that record/replay runs keep every persistent cache out of the live cache directory"""
+    print("🧪 Testing fixture cache isolation...")
+
+    script = """
+import json
+import article_enricher, feed_discovery, feed_health, http_cache, item_store, robots_cache, scrape_cache
+from filters import score_cache
+paths = [article_enricher.ARTICLE_CACHE_FILE, feed_discovery.DISCOVERY_FILE, feed_health.HEALTH_FILE,
+         http_cache.HTTP_CACHE_DIR, item_store.ITEM_STORE_FILE, robots_cache.ROBOTS_FILE,
+         scrape_cache.SCRAPE_CACHE_FILE, score_cache.SCORE_CACHE_FILE]
+feed_health.FeedHealthRegistry().save()
+print(json.dumps([str(path) for path in paths]))
+"""
+    scripts_dir = Path(__file__).parent
+    live_cache = scripts_dir.parent / "cache"
+    for mode in ('record', 'replay'):
+        env = dict(os.environ, CURATIONSLA_HTTP_MODE=mode, PYTHONPATH=str(scripts_dir))
+        result = subprocess.run([sys.executable, '-c', script], env=env, cwd=str(scripts_dir),
+                                capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        paths = [Path(path) for path in json.loads(result.stdout.strip().splitlines()[-1])]
+
+        cache_dirs = {path.parent for path in paths}
+        assert len(cache_dirs) == 1, "Every cache should share one fixture directory"
+        cache_dir = cache_dirs.pop()
+        assert cache_dir != live_cache and live_cache not in cache_dir.parents, mode
+        assert not cache_dir.exists(), "Fixture cache directory should be removed at exit"
+
+    print("✅ Fixture runs use isolated caches!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA HTTP Fixtures Test Suite")
+    print()
+
+    test_record_then_replay()
+    test_replay_feeds_through_fetcher()
+    test_fixture_runs_use_isolated_caches()
+
+    print("\n🎉 All HTTP fixture tests passed!")
+
+if __name__ == "__main__":
+    main()
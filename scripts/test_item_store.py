@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test Item Store
+Validates the SQLite item store used for incremental runs
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from item_store import ItemStore, canonicalize_link, clean_text
+
+def make_item(link: str, title: str = 'New Cafe Opens', score: float = None) -> dict:
+    item = {
+        'title': title,
+        'link': link,
+        'description': '<p>A <b>community</b> celebration</p>',
+        'published': 'Thu, 25 Sep 2025 10:00:00 -0700',
+        'source': 'LAist'
+    }
+    if score is not None:
+        item['vibe_score'] = score
+        item['neighborhood'] = 'Silver Lake'
+    return item
+
+def test_canonical_links():
+    """Test that tracking params, fragments and trailing slashes are ignored"""
+    print("🧪 Testing link canonicalization...")
+
+    canonical = canonicalize_link("https://LAist.com/news/cafe/")
+    assert canonicalize_link("https://laist.com/news/cafe?utm_source=rss&utm_medium=feed") == canonical
+    assert canonicalize_link("https://laist.com/news/cafe#comments") == canonical
+    assert canonicalize_link("https://laist.com/news/cafe?id=2") != canonical, "Real params must be kept"
+    assert clean_text(make_item('x')) == 'New Cafe Opens A community celebration'
+
+    print("✅ Link canonicalization works!")
+
+def test_incremental_partition():
+    """Test that only unseen items are reported as new"""
+    print("🧪 Testing incremental partitioning...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = ItemStore(Path(tmp_dir) / "items.sqlite")
+
+        store.start_run()
+        first_batch = [make_item("https://laist.com/a"), make_item("https://laist.com/b")]
+        new_items, known_items = store.partition(first_batch)
+        assert len(new_items) == 2 and not known_items
+
+        store.record_items([make_item("https://laist.com/a", score=0.8),
+                            make_item("https://laist.com/b", score=0.4)], 'eats')
+        store.finish_run()
+        last_run = store.get_last_run_time()
+        assert last_run is not None
+
+        time.sleep(0.01)
+        second_batch = [make_item("https://laist.com/a?utm_source=rss"), make_item("https://laist.com/c"),
+                        make_item("https://laist.com/c"), make_item("https://laist.com/a")]
+        new_items, known_items = store.partition(second_batch)
+
+        assert [item['link'] for item in new_items] == ["https://laist.com/c"], "Duplicates in a batch count once"
+        assert len(known_items) == 1, "Known duplicates count once too"
+        assert known_items[0]['vibe_score'] == 0.8, "Known items keep their stored score"
+        assert known_items[0]['neighborhood'] == 'Silver Lake'
+
+        stats = store.get_stats()
+        assert stats['total_items'] == 2
+        assert stats['items_by_category'] == {'eats': 2}
+        assert len(store.items_since(last_run)) == 2, "Items recorded during the last run"
+        assert store.items_since("9999-01-01") == []
+        store.close()
+
+    print("✅ Incremental partitioning works!")
+
+def test_score_versions():
+    """Test that stored scores are only reused under the score version they were computed with"""
+    print("🧪 Testing score versions...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "items.sqlite"
+
+        # A store created before score versions existed gains the column, and its rows are scored again
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""CREATE TABLE items (link TEXT PRIMARY KEY, title TEXT, source TEXT, category TEXT,
+                        published TEXT, cleaned_text TEXT, vibe_score REAL, neighborhood TEXT,
+                        first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)""")
+        conn.execute("INSERT INTO items VALUES ('https://laist.com/a', 't', 's', 'eats', '', '', 0.8, 'Silver Lake', "
+                     "'2025-01-01', '2025-01-01')")
+        conn.commit()
+        conn.close()
+
+        store = ItemStore(db_path)
+        new_items, known_items = store.partition([make_item("https://laist.com/a")], 'v2')
+        assert len(new_items) == 1 and not known_items
+
+        store.record_items([make_item("https://laist.com/a", score=0.6)], 'eats', 'v2')
+        new_items, known_items = store.partition([make_item("https://laist.com/a")], 'v2')
+        assert not new_items and known_items[0]['vibe_score'] == 0.6
+        new_items, known_items = store.partition([make_item("https://laist.com/a")], 'v3')
+        assert len(new_items) == 1 and not known_items, "A lexicon change means scoring again"
+        store.close()
+
+    print("✅ Score versions work!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Item Store Test Suite")
+    print()
+
+    test_canonical_links()
+    test_incremental_partition()
+    test_score_versions()
+
+    print("\n🎉 All item store tests passed!")
+
+if __name__ == "__main__":
+    main()
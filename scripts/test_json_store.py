@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test JSON Store
+Validates the shared load/save helpers the caches under cache/ persist through
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from json_store import load_section, save_section
+
+def test_round_trip():
+    """Test that a saved section reads back and the write leaves no temp file behind"""
+    print("🧪 Testing save and load...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'nested' / 'store.json'
+        assert load_section(path, 'feeds', "test store") == {}, "A missing file starts empty"
+
+        save_section(path, 'feeds', {'https://example.com/rss': {'failures': 2}})
+        assert load_section(path, 'feeds', "test store") == {'https://example.com/rss': {'failures': 2}}
+        assert load_section(path, 'pages', "test store") == {}
+        assert 'last_updated' in json.loads(path.read_text())
+        assert [p.name for p in path.parent.iterdir()] == ['store.json']
+
+    print("✅ Save and load work!")
+
+def test_corrupt_file():
+    """Test that an unreadable file starts fresh and is replaced whole on the next save"""
+    print("🧪 Testing corrupt store...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'store.json'
+        path.write_text('{"feeds": {"trunc')
+        assert load_section(path, 'feeds', "test store") == {}
+
+        save_section(path, 'feeds', {})
+        assert json.loads(path.read_text())['feeds'] == {}
+
+    print("✅ Corrupt stores start fresh!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA JSON Store Test Suite")
+    print()
+
+    test_round_trip()
+    test_corrupt_file()
+
+    print("\n🎉 All JSON store tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test Keyword Matcher
+Validates the single-pass Aho-Corasick matcher behind the Good Vibes filter
+"""
+
+import random
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from filters.good_vibes_filter import (
+    BLOCKED_KEYWORDS, GOOD_VIBES_KEYWORDS, LA_NEIGHBORHOODS, GoodVibesFilter
+)
+from filters.vibe_engine import NEIGHBORHOOD_NAMES
+from filters.keyword_matcher import KeywordMatcher
+
+def substring_reference(vibes: GoodVibesFilter, text: str):
+    """The original per-keyword substring scans, for comparison"""
+    text_lower = text.lower()
+    good = sum(1 for keyword in vibes.good_keywords if keyword in text_lower)
+    bad = sum(2 for keyword in vibes.blocked_keywords if keyword in text_lower)
+    score = max(0, min(1, (good - bad + 5) / 10))
+    for neighborhoods in LA_NEIGHBORHOODS.values():
+        for neighborhood in neighborhoods:
+            if neighborhood in text_lower:
+                return score, NEIGHBORHOOD_NAMES.get(neighborhood, neighborhood.title())
+    return score, "Los Angeles"
+
+def sample_texts(count: int, seed: int = 7):
+    words = GOOD_VIBES_KEYWORDS + BLOCKED_KEYWORDS + [
+        'the', 'weekend', 'Silver Lake', 'ECHO PARK', 'tacos', 'people', 'West Hollywood', 'news'
+    ] * 8
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(words) for _ in range(40)) for _ in range(count)]
+
+def test_overlapping_matches():
+    """Test that nested and overlapping keywords are all found in one pass"""
+    print("🧪 Testing Aho-Corasick matching...")
+
+    matcher = KeywordMatcher({'a': ['he', 'she', 'his', 'hers'], 'b': ['SHE', 'ushers']})
+    found = matcher.scan("Ushers")
+    assert found == {'a': {'she', 'he', 'hers'}, 'b': {'she', 'ushers'}}, found
+    assert matcher.scan("") == {'a': set(), 'b': set()}
+    assert matcher.scan("xyz") == {'a': set(), 'b': set()}
+
+    print("✅ Aho-Corasick matching works!")
+
+def test_matches_substring_scorer():
+    """Test that scores and neighborhoods equal the original substring scans"""
+    print("🧪 Testing equivalence with substring scoring...")
+
+    vibes = GoodVibesFilter(match_mode='substring')
+    texts = sample_texts(500)
+    for text in texts:
+        matches = vibes.scan(text)
+        assert (vibes.score_matches(matches), vibes.neighborhood_from_matches(matches)) == \
+            substring_reference(vibes, text), text
+        assert vibes.calculate_vibe_score(text) == substring_reference(vibes, text)[0]
+
+    analysis = vibes.analyze_content("Police join the party at the new Echo Park mural")
+    assert analysis['good_keywords_found'] == ['new', 'party', 'art', 'mural'], analysis['good_keywords_found']
+    assert analysis['bad_keywords_found'] == ['police']
+    assert analysis['neighborhood'] == 'Echo Park'
+    assert analysis['vibe_score'] == 0.7
+
+    assert GoodVibesFilter(0.5, 'substring').matcher is vibes.matcher, "The automaton is built once per lexicon"
+
+    print("✅ Identical results to substring scanning!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Keyword Matcher Test Suite")
+    print()
+
+    test_overlapping_matches()
+    test_matches_substring_scorer()
+
+    print("\n🎉 All keyword matcher tests passed!")
+
+if __name__ == "__main__":
+    main()
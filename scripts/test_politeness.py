@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test Politeness Scheduler
+Validates per-host token buckets and robots.txt Crawl-delay handling
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from politeness import HostRateLimiter, TokenBucket
+
+def test_token_bucket_spacing():
+    """Test that a bucket allows its burst and then spaces requests at its rate"""
+    print("🧪 Testing token bucket spacing...")
+
+    bucket = TokenBucket(rate=10, capacity=2)
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[0] == 0 and waits[1] == 0, f"Burst should not wait: {waits}"
+    assert 0.05 < waits[2] <= 0.1, f"Third request should wait ~0.1s: {waits[2]}"
+    assert 0.15 < waits[3] <= 0.2, f"Fourth request should wait ~0.2s: {waits[3]}"
+
+    print("✅ Token bucket spacing works!")
+
+def test_hosts_are_independent():
+    """Test that requests to different hosts are not delayed by each other"""
+    print("🧪 Testing per-host independence...")
+
+    limiter = HostRateLimiter(rate=1, burst=1, respect_crawl_delay=False)
+    start = time.monotonic()
+    for host in ['a.example.com', 'b.example.com', 'c.example.com']:
+        limiter.wait(f"https://{host}/feed")
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.1, f"Different hosts should run back-to-back, took {elapsed:.2f}s"
+    assert limiter.reserve("https://a.example.com/other") > 0.9, "Same host should be spaced"
+
+    print("✅ Hosts are rate limited independently!")
+
+def test_crawl_delay_slows_host():
+    """Test that a robots.txt Crawl-delay lowers the host's rate"""
+    print("🧪 Testing Crawl-delay handling...")
+
+    class StubRobots:
+        def crawl_delay(self, url):
+            return 4.0 if 'slow.example.com' in url else None
+
+    limiter = HostRateLimiter(rate=100, burst=5, robots=StubRobots())
+
+    limiter.reserve("https://slow.example.com/a")
+    assert 3.9 < limiter.reserve("https://slow.example.com/b") <= 4.0, "Crawl-delay should space requests"
+
+    limiter.reserve("https://fast.example.com/a")
+    assert limiter.reserve("https://fast.example.com/b") == 0, "Hosts without Crawl-delay keep the default"
+
+    print("✅ Crawl-delay is respected!")
+
+def test_async_wait():
+    """Test that async waits on different hosts overlap"""
+    print("🧪 Testing async waits...")
+
+    limiter = HostRateLimiter(rate=5, burst=1, respect_crawl_delay=False)
+
+    async def run():
+        await asyncio.gather(*[
+            limiter.wait_async(f"https://{host}.example.com/{i}")
+            for host in ['a', 'b', 'c'] for i in range(2)
+        ])
+
+    start = time.monotonic()
+    asyncio.run(run())
+    elapsed = time.monotonic() - start
+
+    assert 0.15 < elapsed < 0.5, f"Expected ~0.2s of per-host spacing, took {elapsed:.2f}s"
+
+    print("✅ Async waits work!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Politeness Scheduler Test Suite")
+    print()
+
+    test_token_bucket_spacing()
+    test_hosts_are_independent()
+    test_crawl_delay_slows_host()
+    test_async_wait()
+
+    print("\n🎉 All politeness tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test Robots Cache
+Validates robots.txt parsing, caching and enforcement against a local HTTP server (no internet needed)
+"""
+
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from politeness import HostRateLimiter
+from robots_cache import RobotsCache, RobotsDisallowed, RobotsRules
+from testing_helpers import LocalServer
+from web_scraper import WebScraper
+
+ROBOTS_TXT = """
+# Example rules
+User-agent: *
+Disallow: /private/
+Crawl-delay: 1
+
+User-agent: Googlebot
+User-agent: CurationsLA
+Disallow: /search
+Disallow: /*.pdf$
+Allow: /search/about
+Crawl-delay: 3
+"""
+
+class RobotsServer(LocalServer):
+    """Local server with a configurable robots.txt status and body"""
+
+    def __init__(self, status: int = 200, body: str = ROBOTS_TXT):
+        self.status = status
+        self.body = body.encode()
+        self.requests = []
+        self.lock = threading.Lock()
+        super().__init__()
+
+    def handle(self, request):
+        with self.lock:
+            self.requests.append(request.path)
+        status, body = (self.status, self.body) if request.path == '/robots.txt' else (200, b'<html></html>')
+        self.respond(request, status, body)
+
+def test_parse_rules():
+    """Test group selection, longest-match precedence and wildcards"""
+    print("🧪 Testing robots.txt parsing...")
+
+    rules = RobotsRules.parse(ROBOTS_TXT)
+    assert rules.crawl_delay == 3.0, "Our own group should win over '*'"
+    assert not rules.allowed('/search?q=tacos')
+    assert rules.allowed('/search/about'), "The longer Allow rule should win"
+    assert not rules.allowed('/menus/dinner.pdf')
+    assert rules.allowed('/menus/dinner.pdf?download=1'), "'$' anchors the pattern at the end"
+    assert rules.allowed('/private/page'), "'*' rules don't apply once our group matches"
+
+    other = RobotsRules.parse(ROBOTS_TXT, user_agent='OtherBot/2.0')
+    assert other.crawl_delay == 1.0
+    assert not other.allowed('/private/page')
+
+    assert RobotsRules.parse("User-agent: CurationsLA\nDisallow:\n\nUser-agent: *\nDisallow: /\n").allowed('/'), \
+        "An empty Disallow in our group allows everything"
+    assert RobotsRules.parse("").allowed('/anything')
+
+    print("✅ robots.txt parsing works!")
+
+def test_cache_fetches_once():
+    """Test that each host's robots.txt is fetched once and then served from memory or disk"""
+    print("🧪 Testing robots.txt caching...")
+
+    with RobotsServer() as server, tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / 'robots.json'
+        robots = RobotsCache(cache_file=cache_file)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(robots.allowed, [f"{server.base_url}/search/{i}" for i in range(8)]))
+        assert results == [False] * 8
+        assert robots.crawl_delay(f"{server.base_url}/") == 3.0
+        assert server.requests == ['/robots.txt'], "Concurrent lookups should share one fetch"
+        robots.save()
+
+        # The next run reads the parsed rules from disk
+        later = RobotsCache(cache_file=cache_file)
+        assert later.allowed(f"{server.base_url}/news") and not later.allowed(f"{server.base_url}/search")
+        assert server.requests == ['/robots.txt']
+
+        expiring = RobotsCache(cache_file=Path(tmp) / 'expiring.json', ttl_hours=0)
+        expiring.allowed(f"{server.base_url}/news")
+        expiring.allowed(f"{server.base_url}/news")
+        assert server.requests == ['/robots.txt'] * 3, "Expired rules should be fetched again"
+
+    print("✅ robots.txt caching works!")
+
+def test_status_handling():
+    """Test that a missing robots.txt allows everything and a server error blocks the host"""
+    print("🧪 Testing robots.txt status handling...")
+
+    with RobotsServer(status=404) as server, tempfile.TemporaryDirectory() as tmp:
+        assert RobotsCache(cache_file=Path(tmp) / 'r.json').allowed(f"{server.base_url}/private/")
+
+    with RobotsServer(status=503) as server, tempfile.TemporaryDirectory() as tmp:
+        assert not RobotsCache(cache_file=Path(tmp) / 'r.json').allowed(f"{server.base_url}/news")
+
+    print("✅ robots.txt status handling works!")
+
+def test_scraper_and_limiter_use_rules():
+    """Test that the scraper refuses disallowed pages and the limiter applies Crawl-delay"""
+    print("🧪 Testing robots.txt enforcement...")
+
+    with RobotsServer() as server, tempfile.TemporaryDirectory() as tmp:
+        robots = RobotsCache(cache_file=Path(tmp) / 'robots.json')
+        limiter = HostRateLimiter(rate=100, burst=5, robots=robots)
+        scraper = WebScraper(rate_limiter=limiter, robots=robots)
+
+        try:
+            scraper._get(f"{server.base_url}/search?q=tacos")
+            assert False, "Disallowed URL should not be requested"
+        except RobotsDisallowed:
+            pass
+        assert "/search?q=tacos" not in server.requests
+
+        assert scraper._get(f"{server.base_url}/news", timeout=5).status_code == 200
+        assert 2.9 < limiter.reserve(f"{server.base_url}/next") <= 3.0, "Crawl-delay should space requests"
+
+    print("✅ robots.txt enforcement works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Robots Cache Test Suite")
+    print()
+
+    test_parse_rules()
+    test_cache_fetches_once()
+    test_status_handling()
+    test_scraper_and_limiter_use_rules()
+
+    print("\n🎉 All robots cache tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test Run Budget
+Validates priority-ordered feed scheduling and the run-wide deadline
+"""
+
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from feed_fetcher import FeedFetcher
+from run_budget import RunBudget, order_by_priority
+from test_feed_fetcher import FeedServer
+from testing_helpers import unthrottled
+
+def make_feed(server: FeedServer, name: str, priority: str, category: str = 'eats') -> dict:
+    return {'name': name, 'url': f"{server.base_url}/feed/{name}", 'priority': priority, 'category': category}
+
+def test_priority_order():
+    """Test that high-priority feeds are fetched before medium ones"""
+    print("🧪 Testing priority ordering...")
+
+    feeds = [{'name': 'a', 'priority': 'medium'}, {'name': 'b'}, {'name': 'c', 'priority': 'high'}]
+    assert [feed['name'] for feed in order_by_priority(feeds)] == ['c', 'a', 'b']
+
+    with FeedServer() as server:
+        feeds = [make_feed(server, f"medium-{i}", 'medium') for i in range(3)]
+        feeds += [make_feed(server, f"high-{i}", 'high') for i in range(3)]
+        fetcher = FeedFetcher(concurrency=1, per_host=1, rate_limiter=unthrottled(), parse_processes=0)
+        fetcher.fetch_feeds(feeds, RunBudget())
+
+    expected = [f"/feed/high-{i}" for i in range(3)] + [f"/feed/medium-{i}" for i in range(3)]
+    assert server.requests == expected, f"Unexpected fetch order: {server.requests}"
+
+    print("✅ Priority ordering works!")
+
+def test_spent_budget_skips_covered_categories():
+    """Test that a spent budget only skips lower-priority feeds for covered categories"""
+    print("🧪 Testing budget skipping...")
+
+    budget = RunBudget(budget_seconds=0, deadline_seconds=30, target_candidates=8)
+    budget.add_candidates('eats', 8)
+
+    with FeedServer() as server:
+        feeds = [
+            make_feed(server, 'eats-high', 'high'),
+            make_feed(server, 'eats-medium', 'medium'),
+            make_feed(server, 'events-medium', 'medium', category='events')
+        ]
+        results = FeedFetcher(rate_limiter=unthrottled(), parse_processes=0).fetch_feeds(feeds, budget)
+
+    assert sorted(server.requests) == ['/feed/eats-high', '/feed/events-medium']
+    assert results[feeds[1]['url']] == [], "Covered category's medium feed should be skipped"
+    assert len(results[feeds[2]['url']]) == 2, "Uncovered category still gets its feed"
+    assert budget.get_summary()['skipped_fetches'] == 1
+    assert budget.candidates['events'] == 2
+
+    print("✅ Budget skipping works!")
+
+def test_deadline_cuts_off_slow_feeds():
+    """Test that fetching returns by the deadline even when every site is slow"""
+    print("🧪 Testing hard deadline...")
+
+    with FeedServer(delay=3.0) as server:
+        feeds = [make_feed(server, f"slow-{i}", 'high') for i in range(4)]
+        budget = RunBudget(budget_seconds=0, deadline_seconds=0.5)
+        fetcher = FeedFetcher(rate_limiter=unthrottled(), parse_processes=0)
+
+        start = time.monotonic()
+        results = fetcher.fetch_feeds(feeds, budget)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 1.5, f"Fetching should stop at the deadline, took {elapsed:.2f}s"
+    assert all(items == [] for items in results.values())
+    assert budget.deadline_passed()
+    assert not budget.should_launch(feeds[0]), "Nothing launches after the deadline"
+
+    try:
+        budget.cap_timeout(30)
+        assert False, "Requests can't start after the deadline"
+    except TimeoutError:
+        pass
+
+    print("✅ Hard deadline works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Run Budget Test Suite")
+    print()
+
+    test_priority_order()
+    test_spent_budget_skips_covered_categories()
+    test_deadline_cuts_off_slow_feeds()
+
+    print("\n🎉 All run budget tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test Score Cache
+Validates that vibe scores are reused across feeds and runs, and dropped when the lexicon changes
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from filters.score_cache import ScoreCache
+from filters.vibe_engine import (
+    BLOCKED_KEYWORDS, GOOD_VIBES_KEYWORDS, LA_NEIGHBORHOODS, VibeEngine, get_engine, get_score_cache
+)
+
+TEXTS = [
+    "New Restaurant Opens in Silver Lake with community events",
+    "Crime Wave Hits Downtown as police investigate",
+    "NEW RESTAURANT opens in Silver Lake\n  with community events ",  # Same article from another feed
+    "",
+    "Nothing much happened"
+]
+
+def make_engine(good_keywords=GOOD_VIBES_KEYWORDS, mode='tokens') -> VibeEngine:
+    return VibeEngine(good_keywords, BLOCKED_KEYWORDS, LA_NEIGHBORHOODS, mode)
+
+def test_scores_reused_across_runs():
+    """Test that a second run answers from disk, and results equal uncached scoring"""
+    print("🧪 Testing score reuse...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / "vibe_scores.json"
+        engine = make_engine()
+        expected = engine.score_batch(TEXTS, cached=False)
+
+        engine.cache = ScoreCache(cache_file)
+        assert engine.score_batch(TEXTS) == expected
+        stats = engine.cache.get_stats()
+        assert stats['misses'] == 3, "Syndicated copy scored once, empty text never"
+        assert stats['disk_entries'] == 3
+
+        assert engine.score_batch(TEXTS) == expected
+        assert engine.cache.get_stats()['memory_hits'] == 4
+        engine.cache.save()
+
+        # Next run: fresh process, cache read back from disk
+        engine = make_engine()
+        engine.cache = ScoreCache(cache_file)
+        assert engine.score_batch(TEXTS, threshold=0.6) == engine.score_batch(TEXTS, threshold=0.6, cached=False)
+        assert engine.cache.get_stats()['disk_hits'] == 4
+        assert engine.cache.get_stats()['misses'] == 0
+
+    print("✅ Scores reused across feeds and runs!")
+
+def test_lexicon_change_invalidates():
+    """Test that changing keywords, match mode or scoring gives a new version, so old scores aren't reused"""
+    print("🧪 Testing invalidation...")
+
+    engine = make_engine()
+    assert make_engine().version == engine.version
+    assert make_engine(GOOD_VIBES_KEYWORDS + ['tacos']).version != engine.version
+    assert make_engine(mode='substring').version != engine.version
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / "vibe_scores.json"
+        cache = ScoreCache(cache_file)
+        engine.cache = cache
+        engine.score_batch(["Fresh tacos in Echo Park"])
+
+        changed = make_engine(GOOD_VIBES_KEYWORDS + ['tacos'])
+        changed.cache = cache
+        scores, neighborhoods, _ = changed.score_batch(["Fresh tacos in Echo Park"])
+        assert scores == [0.6] and neighborhoods == ['Echo Park'], "Old version's 0.5 must not be reused"
+        assert cache.get_stats()['misses'] == 2
+
+        # Entries from versions no longer in use age out like unused ones
+        cache.save()
+        data = json.loads(cache_file.read_text())
+        assert len(data['scores']) == 2
+        for entry in data['scores'].values():
+            entry[2] = '2000-01-01'
+        cache_file.write_text(json.dumps(data))
+        stale = ScoreCache(cache_file)
+        stale.dirty = True
+        stale.save()
+        assert json.loads(cache_file.read_text())['scores'] == {}
+
+    print("✅ Lexicon changes invalidate cached scores!")
+
+def test_shared_engines_cached():
+    """Test that the configured engines share one cache and fall back cleanly on a corrupt file"""
+    print("🧪 Testing shared cache...")
+
+    assert get_engine().cache is get_engine('substring').cache is get_score_cache()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / "vibe_scores.json"
+        cache_file.write_text("{not json")
+        assert ScoreCache(cache_file).entries == {}
+
+    print("✅ Shared cache works!")
+
+def test_filters_run_standalone():
+    """Test that the filters package still runs as a script, without the rest of scripts/ on the path"""
+    print("🧪 Testing standalone filter script...")
+
+    script = Path(__file__).parent / 'filters' / 'good_vibes_filter.py'
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+    print("✅ Filter script runs standalone!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Score Cache Test Suite")
+    print()
+
+    test_scores_reused_across_runs()
+    test_lexicon_change_invalidates()
+    test_shared_engines_cached()
+    test_filters_run_standalone()
+
+    print("\n🎉 All score cache tests passed!")
+
+if __name__ == "__main__":
+    main()
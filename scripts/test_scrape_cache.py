@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test Scrape Cache
+Validates TTL reuse and unchanged-page short-circuits against a local HTTP server (no internet needed)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from scrape_cache import ScrapeCache
+from scraper_engine import SiteSpec
+from testing_helpers import LocalServer, unthrottled
+from web_scraper import WebScraper
+
+LISTING_HTML = b"""<html><body>
+  <article class="story"><h2>Echo Park Lake Lotus Festival Returns</h2><a href="/lotus">More</a><p>Blooms.</p></article>
+  <article class="story"><h2>New Ramen Spot in Little Tokyo</h2><a href="/ramen">More</a><p>Noodles.</p></article>
+</body></html>"""
+
+class PageServer(LocalServer):
+    """Local server that serves a swappable listing page"""
+
+    def __init__(self):
+        self.body = LISTING_HTML
+        self.requests = 0
+        super().__init__()
+
+    def handle(self, request):
+        if request.path == '/robots.txt':
+            self.respond(request, 404)
+            return
+        self.requests += 1
+        self.respond(request, 200, self.body, {'Content-Type': 'text/html'})
+
+def make_spec(base_url: str) -> SiteSpec:
+    return SiteSpec('local_test', {
+        'source': 'Local Test',
+        'base_url': base_url,
+        'structured_data': False,
+        'container': {'tags': ['article'], 'class': 'story'},
+        'title': {'tags': ['h2']},
+        'link': {'tags': ['a'], 'attr': 'href'},
+        'excerpt': {'tags': ['p']}
+    })
+
+def make_scraper(cache: ScrapeCache) -> WebScraper:
+    """Scraper that counts extractions and never rate-limits"""
+    scraper = WebScraper(rate_limiter=unthrottled(),
+                         scrape_cache=cache)
+    scraper.extractions = 0
+    extract_page = scraper.extract_page
+
+    def counting_extract(*args):
+        scraper.extractions += 1
+        return extract_page(*args)
+
+    scraper.extract_page = counting_extract
+    return scraper
+
+def test_fresh_entries_skip_download():
+    """Test that a re-run within the TTL reuses articles without a request"""
+    print("🧪 Testing scrape cache TTL...")
+
+    with PageServer() as server, tempfile.TemporaryDirectory() as tmp:
+        cache_file = Path(tmp) / 'scrape.json'
+        spec = make_spec(server.base_url)
+        cache = ScrapeCache(cache_file)
+        articles = make_scraper(cache).scrape_site(spec, 'eats', 10)
+        assert [a['title'] for a in articles] == ['Echo Park Lake Lotus Festival Returns', 'New Ramen Spot in Little Tokyo']
+        cache.save()
+
+        rerun = make_scraper(ScrapeCache(cache_file))
+        again = rerun.scrape_site(spec, 'events', 1)
+        assert server.requests == 1, "A fresh entry shouldn't hit the network"
+        assert rerun.extractions == 0
+        assert len(again) == 1 and again[0]['category'] == 'events', "Cached articles are restamped per category"
+
+        more = rerun.scrape_site(spec, 'events', 20)
+        assert rerun.extractions == 1, "A larger limit than was cached needs a new extraction"
+        assert len(more) == 2
+
+    print("✅ Scrape cache TTL works!")
+
+def test_unchanged_body_skips_extraction():
+    """Test that an expired entry is reused when the page body hasn't changed"""
+    print("🧪 Testing unchanged-page short-circuit...")
+
+    with PageServer() as server, tempfile.TemporaryDirectory() as tmp:
+        spec = make_spec(server.base_url)
+        cache = ScrapeCache(Path(tmp) / 'scrape.json', ttl_minutes=0)
+
+        make_scraper(cache).scrape_site(spec, 'eats', 10)
+        rerun = make_scraper(cache)
+        articles = rerun.scrape_site(spec, 'eats', 10)
+        assert server.requests == 2, "An expired entry should be revalidated"
+        assert rerun.extractions == 0, "An unchanged page shouldn't be parsed again"
+        assert len(articles) == 2
+        assert cache.stats['unchanged_hits'] == 1
+
+        server.body = LISTING_HTML.replace(b'Ramen', b'Boba')
+        changed = make_scraper(cache)
+        articles = changed.scrape_site(spec, 'eats', 10)
+        assert changed.extractions == 1
+        assert articles[1]['title'] == 'New Boba Spot in Little Tokyo'
+
+    print("✅ Unchanged-page short-circuit works!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Scrape Cache Test Suite")
+    print()
+
+    test_fresh_entries_skip_download()
+    test_unchanged_body_skips_extraction()
+
+    print("\n🎉 All scrape cache tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Test Scraper Engine
+Validates the declarative site specs and the shared extraction loop (no internet needed)
+"""
+
+import sys
+import time
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from bs4 import BeautifulSoup
+
+from scraper_engine import SiteSpec, extract_articles, extract_structured, load_site_specs
+from testing_helpers import LocalServer, unthrottled
+from web_scraper import WebScraper
+
+LISTING_HTML = """
+<html><body>
+  <article class="story-card">
+    <h2 class="card-title">Silver Lake Reservoir Gets a New Walking Path</h2>
+    <a href="/news/silver-lake-path">Read more</a>
+    <p class="story-summary">Neighbors celebrate the opening.</p>
+    <time datetime="2025-09-25T09:00:00-07:00">Sept 25</time>
+  </article>
+  <article class="story-card">
+    <h2>Untitled teaser without a headline class</h2>
+    <a href="/news/teaser">Read more</a>
+  </article>
+  <div class="post">
+    <h3 class="headline">Arts District Mural Festival Returns</h3>
+    <a href="https://laist.com/news/murals">Murals</a>
+  </div>
+  <div class="sidebar"><h2 class="title">Not an article</h2><a href="/ad">Ad</a></div>
+</body></html>
+"""
+
+JSON_LD_HTML = """
+<html><head>
+<script type="application/ld+json">{"@context": "https://schema.org", "@type": "Organization", "name": "LAist"}</script>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "ItemList", "itemListElement": [
+  {"@type": "ListItem", "position": 2, "url": "/news/second", "name": "Second &amp; Later"},
+  {"@type": "ListItem", "position": 1, "item": {
+    "@type": "NewsArticle", "headline": "Taco Trucks Take Over Echo Park", "url": "https://laist.com/news/tacos",
+    "description": "A community food festival.", "datePublished": "2025-09-24T08:00:00-07:00"}}
+]}
+</script>
+<script type="application/ld+json">{ this is not json }</script>
+<script type='application/ld+json'>{"@graph": [
+  {"@type": "WebSite", "name": "LAist", "url": "https://laist.com"},
+  {"@type": ["BlogPosting"], "headline": "Taco Trucks Take Over Echo Park", "url": "https://laist.com/news/tacos"},
+  {"@type": "Event", "name": "Night Market", "url": "/events/night-market", "datePublished": "2025-09-20"}
+]}</script>
+</head><body>""" + LISTING_HTML + "</body></html>"
+
+def test_specs_compiled_once():
+    """Test that every site spec loads once and compiles its patterns up front"""
+    print("🧪 Testing site spec loading...")
+
+    specs = load_site_specs()
+    assert load_site_specs() is specs, "Specs should be cached for the process"
+    assert len(specs) == 10
+
+    laist = specs['laist']
+    assert laist.page_url('food') == "https://laist.com/news/food"
+    assert laist.page_url('unknown') == "https://laist.com/news"
+    assert laist.container.class_re.pattern == 'post|article|story'
+    assert specs['secret_la'].page_url('general') == "https://secretlosangeles.com"
+    assert specs['lacanvas'].verify_ssl is False
+    assert specs['thrillist_la'].link_base == "https://www.thrillist.com"
+
+    scraper = WebScraper()
+    assert set(scraper.scrapers) == set(specs), "Every spec should be exposed as a scraper"
+
+    print("✅ Site specs load correctly!")
+
+def test_extract_articles():
+    """Test the shared extraction loop against a listing page"""
+    print("🧪 Testing article extraction...")
+
+    soup = BeautifulSoup(LISTING_HTML, 'html.parser')
+    articles = extract_articles(soup, load_site_specs()['laist'], 'local', 10)
+
+    assert [article['title'] for article in articles] == [
+        'Silver Lake Reservoir Gets a New Walking Path',
+        'Arts District Mural Festival Returns'
+    ], "Containers without a matching title are skipped"
+
+    first = articles[0]
+    assert first['link'] == "https://laist.com/news/silver-lake-path"
+    assert first['description'] == 'Neighbors celebrate the opening.'
+    assert first['published'] == '2025-09-25T09:00:00-07:00'
+    assert first['source'] == 'LAist'
+    assert first['category'] == 'local'
+    assert articles[1]['description'] == ''
+    assert articles[1]['published'], "Missing dates fall back to the scrape time"
+
+    limited = extract_articles(soup, load_site_specs()['laist'], 'local', 1)
+    assert len(limited) == 1
+
+    print("✅ Article extraction works!")
+
+def test_structured_data_fast_path():
+    """Test that JSON-LD articles are used first, with real publish dates"""
+    print("🧪 Testing JSON-LD fast path...")
+
+    laist = load_site_specs()['laist']
+    articles, complete = extract_structured(JSON_LD_HTML.encode(), laist, 'local', 10)
+    assert complete, "An ItemList describes the whole listing"
+
+    assert [article['title'] for article in articles] == [
+        'Taco Trucks Take Over Echo Park', 'Second & Later', 'Night Market'
+    ], "ItemList order, duplicates and non-article types should be handled"
+    assert articles[0]['published'] == '2025-09-24T08:00:00-07:00'
+    assert articles[0]['description'] == 'A community food festival.'
+    assert articles[0]['source'] == 'LAist' and articles[0]['category'] == 'local'
+    assert articles[1]['link'] == "https://laist.com/news/second"
+    assert articles[1]['published'], "Entries without a date fall back to the scrape time"
+    assert articles[2]['link'] == "https://laist.com/events/night-market"
+
+    assert len(extract_structured(JSON_LD_HTML.encode(), laist, 'local', 2)[0]) == 2
+    assert extract_structured(LISTING_HTML.encode(), laist, 'local', 10) == ([], False), \
+        "Pages without JSON-LD fall back to selectors"
+
+    print("✅ JSON-LD fast path works!")
+
+def test_partial_structured_data_topped_up():
+    """Test that one featured JSON-LD article doesn't hide the rest of a listing page"""
+    print("🧪 Testing partial JSON-LD...")
+
+    laist = load_site_specs()['laist']
+    featured = """<html><head><script type="application/ld+json">
+{"@type": "NewsArticle", "headline": "Arts District Mural Festival Returns", "url": "/news/murals",
+ "datePublished": "2025-09-23T10:00:00-07:00"}
+</script></head><body>""" + LISTING_HTML + "</body></html>"
+
+    articles, complete = extract_structured(featured.encode(), laist, 'local', 10)
+    assert len(articles) == 1 and not complete
+    assert extract_structured(featured.encode(), laist, 'local', 1)[1], "A full limit needs no selectors"
+
+    scraped = WebScraper().extract_page(featured.encode(), laist, 'local', 10)
+    assert [article['title'] for article in scraped] == [
+        'Arts District Mural Festival Returns', 'Silver Lake Reservoir Gets a New Walking Path'
+    ], "Cards top up the featured article without repeating it"
+    assert scraped[0]['published'] == '2025-09-23T10:00:00-07:00', "The JSON-LD copy keeps its real date"
+    assert len(WebScraper().extract_page(featured.encode(), laist, 'local', 1)) == 1
+
+    print("✅ Partial JSON-LD is topped up from selectors!")
+
+class ListingServer(LocalServer):
+    """Local server that answers every page with LISTING_HTML after a delay (robots.txt is 404)"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        super().__init__()
+
+    def handle(self, request):
+        if request.path == '/robots.txt':
+            self.respond(request, 404)
+            return
+        time.sleep(self.delay)
+        self.respond(request, 200, LISTING_HTML.encode())
+
+def test_scrape_many_concurrent():
+    """Test that many sites are scraped in about the time of the slowest one"""
+    print("🧪 Testing concurrent multi-site scraping...")
+
+    delays = [0.6, 0.2, 0.4, 0.4, 0.4, 0.4]
+    with ExitStack() as stack:
+        servers = [stack.enter_context(ListingServer(delay)) for delay in delays]
+        scraper = WebScraper(rate_limiter=unthrottled())
+        laist = load_site_specs()['laist']
+        scraper.specs = {
+            f"site{i}": SiteSpec(f"site{i}", {
+                'source': f"Site {i}",
+                'base_url': server.base_url,
+                'structured_data': False,
+                'container': {'tags': laist.container.tags, 'class': laist.container.class_re.pattern},
+                'title': {'tags': laist.title.tags, 'class': laist.title.class_re.pattern},
+                'link': {'tags': ['a'], 'attr': 'href'},
+                'excerpt': {'tags': ['p']}
+            })
+            for i, server in enumerate(servers)
+        }
+        scraper.scrapers = {name: partial(scraper.scrape_site, spec) for name, spec in scraper.specs.items()}
+
+        jobs = [(name, 'local', 5) for name in scraper.specs] + [('unknown_site', 'local', 5)]
+        start = time.time()
+        results = scraper.scrape_many(jobs)
+        elapsed = time.time() - start
+
+    assert len(results) == len(jobs)
+    assert results[0][0] == 'unknown_site', "Results should arrive in completion order"
+    assert results[1][0] == 'site1' and results[-1][0] == 'site0'
+    assert all(len(articles) == 2 for name, _, articles in results if name != 'unknown_site')
+    assert elapsed < 1.2, f"Scraping took {elapsed:.2f}s - not concurrent"
+
+    print(f"✅ Scraped {len(servers)} sites in {elapsed:.2f}s")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Scraper Engine Test Suite")
+    print()
+
+    test_specs_compiled_once()
+    test_extract_articles()
+    test_structured_data_fast_path()
+    test_partial_structured_data_topped_up()
+    test_scrape_many_concurrent()
+
+    print("\n🎉 All scraper engine tests passed!")
+
+if __name__ == "__main__":
+    main()
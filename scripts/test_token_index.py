@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test Token Index
+Validates whole-word keyword and phrase matching behind the default Good Vibes scoring mode
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from filters.good_vibes_filter import GoodVibesFilter
+from filters.token_index import TokenIndex, inflections, tokenize
+
+def test_whole_words_and_phrases():
+    """Test that keywords only match whole words, and phrases only match in sequence"""
+    print("🧪 Testing whole-word matching...")
+
+    assert tokenize("West Hollywood's “free” family-friendly fun!") == \
+        ['west', 'hollywood', 's', 'free', 'family', 'friendly', 'fun']
+    assert inflections('party') >= {'party', 'parties'}
+    assert inflections('celebrate') >= {'celebrates', 'celebrated', 'celebrating'}
+    assert 'arted' not in inflections('art'), "Short words only take plural endings"
+
+    index = TokenIndex({'good': ['art', 'new', 'farmers market'], 'place': ['west hollywood']},
+                       inflect=['good'], not_inflections=['news'])
+    assert index.scan("A party to start the news") == {'good': set(), 'place': set()}
+    assert index.scan("New ART at the Farmers-Market in West Hollywood") == \
+        {'good': {'new', 'art', 'farmers market'}, 'place': {'west hollywood'}}
+    assert index.scan("Two farmers markets and arts") == {'good': {'farmers market', 'art'}, 'place': set()}
+    assert index.scan("market farmers, hollywood west") == {'good': set(), 'place': set()}
+    assert index.scan("West Hollywoods") == {'good': set(), 'place': set()}, "Only inflected groups take endings"
+    assert index.scan("") == {'good': set(), 'place': set()}
+
+    print("✅ Whole-word matching works!")
+
+def test_false_positives_gone():
+    """Test that the default scorer no longer counts keywords hidden inside other words"""
+    print("🧪 Testing scorer false positives...")
+
+    vibes = GoodVibesFilter()
+    substring = GoodVibesFilter(match_mode='substring')
+    text = "Police join the party at the new Echo Park mural"
+    assert substring.analyze_content(text)['good_keywords_found'] == ['new', 'party', 'art', 'mural']
+
+    analysis = vibes.analyze_content(text)
+    assert analysis['good_keywords_found'] == ['new', 'party', 'mural']
+    assert analysis['bad_keywords_found'] == ['police']
+    assert analysis['neighborhood'] == 'Echo Park'
+    assert analysis['vibe_score'] == 0.6
+
+    assert vibes.analyze_content("Startup news on city policies")['bad_keywords_found'] == []
+    assert vibes.analyze_content("Restaurants celebrated at two parties")['good_keywords_found'] == \
+        ['celebrate', 'party', 'restaurant']
+
+    print("✅ No more substring false positives!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Token Index Test Suite")
+    print()
+
+    test_whole_words_and_phrases()
+    test_false_positives_gone()
+
+    print("\n🎉 All token index tests passed!")
+
+if __name__ == "__main__":
+    main()
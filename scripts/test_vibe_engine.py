@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test Vibe Engine
+Validates that every Good Vibes entry point scores with the same engine and lexicon
+"""
+
+import random
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from content_generator import ContentGenerator
+from filters import good_vibes_filter
+from filters.good_vibes_filter import GoodVibesFilter
+from filters.vibe_engine import (
+    BLOCKED_KEYWORDS, GOOD_VIBES_KEYWORDS, MATCH_MODES, NUMPY_AVAILABLE, compile_engine, get_engine
+)
+
+TEXTS = [
+    "New Restaurant Opens in Silver Lake with community events",
+    "Crime Wave Hits Downtown as police investigate",
+    "A scientific discovery at the West LA museum",
+    "Brunch at the new WeHo cafe",
+    "Nothing much happened",
+    ""
+]
+
+def make_items():
+    return [{'title': text, 'description': 'Fresh tacos and a free concert', 'link': f"https://example.com/{i}"}
+            for i, text in enumerate(TEXTS)]
+
+def test_entry_points_agree():
+    """Test that the generator, the filter class and the convenience functions give identical results"""
+    print("🧪 Testing scorer entry points...")
+
+    # Skip __init__, which opens the item store and output directories
+    generator = ContentGenerator.__new__(ContentGenerator)
+    vibes = GoodVibesFilter()
+    engine = get_engine()
+
+    for text in TEXTS:
+        score = engine.score(text)
+        assert generator.calculate_vibe_score(text) == score
+        assert vibes.calculate_vibe_score(text) == score
+        assert good_vibes_filter.calculate_vibe_score(text) == score
+        assert good_vibes_filter.is_good_vibes(text) == vibes.is_good_vibes(text)
+        assert generator.extract_neighborhood(text) == vibes.extract_neighborhood(text) == engine.neighborhood(text)
+
+    from_generator = generator.filter_good_vibes(make_items())
+    from_filter = good_vibes_filter.filter_good_vibes(make_items())
+    assert [(item['link'], item['vibe_score'], item['neighborhood']) for item in from_generator] == \
+        [(item['link'], round(item['vibe_score'], 3), item['neighborhood']) for item in from_filter]
+
+    print("✅ All entry points agree!")
+
+def test_lexicon_compiled_once():
+    """Test that the engine is shared and the generator's old-only keywords still count"""
+    print("🧪 Testing shared lexicon...")
+
+    assert GoodVibesFilter(0.6).engine is get_engine()
+    assert compile_engine(('art',), ('crime',), (('eastside', ('echo park',)),)) is \
+        compile_engine(('art',), ('crime',), (('eastside', ('echo park',)),))
+
+    engine = get_engine()
+    assert 'discovery' in engine.good_keywords
+    assert engine.neighborhood("Sunset in West LA") == 'West LA'
+    assert engine.neighborhood("Late night in DTLA") == 'DTLA'
+    assert engine.neighborhood("Tacos in Echo Park") == 'Echo Park'
+    assert engine.score_text("") == (0.0, 'Los Angeles')
+
+    print("✅ Shared lexicon works!")
+
+def test_batch_matches_scalar():
+    """Test that vectorized batch scoring equals scoring one text at a time"""
+    print("🧪 Testing batch scoring...")
+
+    rng = random.Random(11)
+    words = GOOD_VIBES_KEYWORDS + BLOCKED_KEYWORDS + [
+        'the', 'ECHO PARK', 'West Hollywood', 'İstanbul', 'Kelvin \u212a-pop', 'locals’ “favorite”',
+        'café ☕', '😀', '\ud800', 'nul\0', 'what?', 'DTLA', 'WeHo', 'restaurants', 'parties', 'family friendly',
+        'farmers-market', 'news', 'under_score', 'art-house'
+    ] * 4
+    texts = [' '.join(rng.choice(words) for _ in range(rng.randint(0, 60))) for _ in range(300)]
+    texts += ['', ' ', 'ART', 'İnternational art party', 'police ' * 200]
+
+    for mode in MATCH_MODES:
+        engine = get_engine(mode)
+        scalar = engine.score_batch(texts, threshold=0.6, vectorized=False, cached=False)
+        assert scalar[0] == [engine.score_matches(engine.scan(text)) if text else 0.0 for text in texts], mode
+        assert scalar[1] == [engine.neighborhood_from_matches(engine.scan(text)) for text in texts], mode
+
+        if NUMPY_AVAILABLE:
+            assert engine.score_batch(texts, threshold=0.6, vectorized=True, cached=False) == scalar, mode
+            assert engine.score_batch([], vectorized=True) == ([], [], [])
+            assert engine.score_batch(['', ''], vectorized=True) == ([0.0, 0.0], ['Los Angeles'] * 2, [False, False])
+
+        items = [{'title': text, 'description': ''} for text in texts]
+        joined = [f"{text} " for text in texts]  # Title plus empty description
+        expected = [(score, name) for score, name, passed
+                    in zip(*engine.score_batch(joined, vectorized=False, cached=False)) if passed]
+        filtered = GoodVibesFilter(match_mode=mode).filter_content_list(items)
+        assert sorted((item['vibe_score'], item['neighborhood']) for item in filtered) == \
+            sorted((round(score, 3), name) for score, name in expected), mode
+
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not installed, skipped the vectorized comparison")
+    print(f"✅ Batch scoring matches on {len(texts)} texts in every match mode!")
+
+def main():
+    """Run all tests"""
+    print("🧪 CurationsLA Vibe Engine Test Suite")
+    print()
+
+    test_entry_points_agree()
+    test_lexicon_compiled_once()
+    test_batch_matches_scalar()
+
+    print("\n🎉 All vibe engine tests passed!")
+
+if __name__ == "__main__":
+    main()
@@ -19,46 +19,39 @@ def test_web_scraper():
     
     scraper = WebScraper()
     
-    # Test sources with different categories
-    test_cases = [
-        ('laist', 'local', 3),
-        ('timeout_la', 'events', 3),
-        ('secret_la', 'general', 3),
-        ('welikela', 'community', 2),
-        ('thrillist_la', 'general', 2)
-    ]
+    # Every site in one concurrent pass; per-host spacing comes from the rate limiter
+    test_cases = [(source, 'general', 3) for source in scraper.scrapers]
     
     total_articles = 0
     successful_sources = 0
     
-    for source, category, limit in test_cases:
-        print(f"\n🔍 Testing {source} ({category})...")
-        try:
-            articles = scraper.scrape_content(source, category, limit)
+    def report(source: str, category: str, articles: list):
+        nonlocal total_articles, successful_sources
+        print(f"\n🔍 {source} ({category}) finished")
+        if articles:
+            successful_sources += 1
+            total_articles += len(articles)
+            print(f"✅ Success: {len(articles)} articles found")
             
-            if articles:
-                successful_sources += 1
-                total_articles += len(articles)
-                print(f"✅ Success: {len(articles)} articles found")
-                
-                # Show first article as example
-                if articles:
-                    first = articles[0]
-                    print(f"   📰 Sample: {first['title'][:50]}...")
-                    print(f"   🔗 Link: {first['link']}")
-                    print(f"   📝 Description: {first['description'][:80]}...")
-            else:
-                print(f"⚠️  No articles found for {source}")
-                
-        except Exception as e:
-            print(f"❌ Error testing {source}: {str(e)}")
-        
-        time.sleep(2)  # Be respectful
+            # Show first article as example
+            first = articles[0]
+            print(f"   📰 Sample: {first['title'][:50]}...")
+            print(f"   🔗 Link: {first['link']}")
+            print(f"   📝 Description: {first['description'][:80]}...")
+        else:
+            print(f"⚠️  No articles found for {source}")
+    
+    start = time.time()
+    results = scraper.scrape_many(test_cases, on_result=report)
+    elapsed = time.time() - start
+    
+    assert len(results) == len(test_cases), "Every job should report a result"
     
     print(f"\n📊 Web Scraping Test Results:")
     print(f"   ✅ Successful sources: {successful_sources}/{len(test_cases)}")
     print(f"   📰 Total articles scraped: {total_articles}")
     print(f"   📈 Success rate: {successful_sources/len(test_cases)*100:.1f}%")
+    print(f"   ⏱️  Scraped {len(test_cases)} sites in {elapsed:.1f}s")
 
 def test_content_generator_with_scraping():
     """Test content generator with web scraping fallbacks"""
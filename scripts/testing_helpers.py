@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+CurationsLA Testing Helpers
+Local HTTP server and rate limiter shared by the test suites (no internet needed)
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from politeness import HostRateLimiter
+
+def unthrottled() -> HostRateLimiter:
+    """Rate limiter that never delays, so tests measure fetch concurrency alone"""
+    return HostRateLimiter(rate=1000, burst=1000, respect_crawl_delay=False)
+
+class LocalServer:
+    """
+    Tiny threaded HTTP server on a free localhost port, run as a context manager
+
+    Subclasses set up their state, call super().__init__() and answer each GET in handle().
+    """
+
+    protocol_version = 'HTTP/1.0'  # 'HTTP/1.1' keeps connections open between requests
+
+    def __init__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = server.protocol_version
+
+            def do_GET(self):
+                try:
+                    server.handle(self)
+                except ConnectionError:
+                    pass  # The client gave up waiting (e.g. a timeout capped by the run deadline)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        """Answer one GET request"""
+        raise NotImplementedError
+
+    @staticmethod
+    def respond(request: BaseHTTPRequestHandler, status: int, body: bytes = b'', headers: dict = None):
+        """Send a complete response with a Content-Length"""
+        request.send_response(status)
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()